@@ -1,13 +1,20 @@
 import logging
 import yaml
 import os
+import re
 import time
-from datetime import datetime
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time
 from typing import Dict, Optional, List
 from src.utils.google_sheet_manager import GoogleSheetManager
 from discord_webhook import DiscordWebhook
 from src.utils.logger import setup_logger
 
+# 리밸런싱 일자 구분자 (년/월/일, 월/일)
+REBALANCING_DATE_SEPARATOR = re.compile(r'[/\-.]')
+
 class BaseTrader:
     """모든 트레이더의 기본이 되는 클래스입니다."""
     
@@ -25,16 +32,25 @@ class BaseTrader:
         self.settings = None
         self.individual_stocks = None
         self.pool_stocks = None
+        self.rebalancing_schedule = None  # 리밸런싱 일자 (년, 월, 일), 지정되지 않은 항목은 None
         self.discord_webhook_url = self.config['discord']['webhook_url']
         self.is_first_execution = True
         self.market_open_executed = False
         self.market_close_executed = False
         self.execution_date = None
-        self.last_api_call = 0
+        self.last_api_call = 0  # 마지막 토큰 충전 시각 (time.monotonic 기준)
+        self.api_call_lock = threading.Lock()  # 병렬 호출 시 API 호출 간격 제어용 잠금
+        
+        # 당일 매도 종목 캐시 (매도 주문 후 sold_stocks_cache_time을 0으로 초기화하면 다음 확인 시 재조회)
+        self.sold_stocks_cache = set()
+        self.sold_stocks_cache_time = 0
+        self.sold_stocks_cache_ttl = 300  # 캐시 유효 시간 (초)
         
         # 실전/모의투자에 따른 API 호출 간격 설정
         self.is_paper_trading = self.config['api']['is_paper_trading']
         self.api_call_interval = 0.5 if self.is_paper_trading else 0.3  # 모의투자: 0.5초, 실전투자: 0.3초
+        self.api_call_burst = 1  # 대기 없이 연속 호출할 수 있는 최대 횟수 (토큰 버킷 용량, 병렬 호출 시에도 초당 호출 제한을 넘지 않도록 1)
+        self.api_call_tokens = self.api_call_burst
         self.max_retries = 3
         
         # 디렉토리 생성
@@ -87,12 +103,23 @@ class BaseTrader:
             self.logger.error(f"디스코드 메시지 전송 실패: {str(e)}")
     
     def _wait_for_api_call(self) -> None:
-        """API 호출 간격을 제어합니다."""
-        current_time = time.time()
-        elapsed = current_time - self.last_api_call
-        if elapsed < self.api_call_interval:
-            time.sleep(self.api_call_interval - elapsed)
-        self.last_api_call = time.time()
+        """API 호출 속도를 토큰 버킷 방식으로 제어합니다. 여러 스레드에서 호출해도 속도가 유지됩니다.
+        
+        api_call_interval마다 토큰이 하나씩 충전되며(최대 api_call_burst개), 호출할 때마다 하나를 사용합니다.
+        한동안 호출이 없었다면 api_call_burst회까지는 대기 없이 호출하고, 그 이후에는 충전 속도에 맞춰 대기합니다.
+        """
+        with self.api_call_lock:
+            current_time = time.monotonic()
+            self.api_call_tokens = min(
+                self.api_call_burst,
+                self.api_call_tokens + (current_time - self.last_api_call) / self.api_call_interval
+            )
+            if self.api_call_tokens < 1:
+                time.sleep((1 - self.api_call_tokens) * self.api_call_interval)
+                current_time = time.monotonic()
+                self.api_call_tokens = 1
+            self.api_call_tokens -= 1
+            self.last_api_call = current_time
 
     def _retry_api_call(self, func, *args, **kwargs) -> Optional[Dict]:
         """API 호출을 재시도합니다."""
@@ -104,7 +131,80 @@ class BaseTrader:
             except Exception as e:
                 if attempt == self.max_retries - 1:  # 마지막 시도
                     raise Exception(f"API 호출 실패 (최대 재시도 횟수 초과): {str(e)}")
-                time.sleep(self.api_call_interval * (attempt + 1))  # 점진적 대기 시간 증가
+                time.sleep(self.api_call_interval * (2 ** attempt))  # 지수적 대기 시간 증가
+    
+    def _run_api_calls_concurrently(self, func, args_list: List[tuple], max_workers: int = 4) -> List[Optional[Dict]]:
+        """동일한 API 함수를 여러 인자로 병렬 호출합니다.
+        
+        호출 시작 간격은 _wait_for_api_call로 유지되고, 응답 대기와 API 매니저의 후행 대기 시간만 겹쳐서 처리됩니다.
+        
+        Args:
+            func: 호출할 API 함수
+            args_list (List[tuple]): 호출별 인자 목록
+            max_workers (int): 최대 동시 호출 수
+            
+        Returns:
+            List[Optional[Dict]]: args_list와 같은 순서의 호출 결과 (실패 시 None)
+        """
+        if not args_list:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+            futures = [executor.submit(self._retry_api_call, func, *args) for args in args_list]
+        
+        results = []
+        for args, future in zip(args_list, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.error(f"API 병렬 호출 실패 ({args[0]}): {str(e)}")
+                results.append(None)
+        return results
+    
+    @staticmethod
+    def _get_order_no(order_result: Optional[Dict]) -> Optional[str]:
+        """주문 결과에서 증권사 주문번호(ODNO)를 꺼냅니다. (거래 내역 중복 저장 방지용)
+        
+        Args:
+            order_result (Optional[Dict]): order_stock 호출 결과
+            
+        Returns:
+            Optional[str]: 주문번호, 없으면 None
+        """
+        if not isinstance(order_result, dict):
+            return None
+        return (order_result.get('output') or {}).get('ODNO') or None
+    
+    @staticmethod
+    def _calculate_ma_from_closes(closes: np.ndarray, period: int) -> tuple:
+        """날짜 오름차순 종가 배열에서 전전봉/전봉 이동평균값을 계산합니다.
+        
+        rolling 객체를 만들지 않고 전봉 구간 합계를 한 번만 구한 뒤, 전전봉 구간은 한 칸 밀린 값만 보정합니다.
+        
+        Args:
+            closes (np.ndarray): 날짜 오름차순 종가 배열 (마지막 값이 당일/당주)
+            period (int): 이동평균 기간
+        
+        Returns:
+            tuple: (전전일/전전주 이동평균값, 전일/전주 이동평균값)
+        """
+        window_sum = float(closes[-period - 1:-1].sum())
+        ma_prev = window_sum / period  # 전봉
+        ma_prev2 = (window_sum - float(closes[-2]) + float(closes[-period - 2])) / period  # 전전봉
+        return (ma_prev2, ma_prev)
+    
+    @staticmethod
+    def _parse_hhmm(value) -> dt_time:
+        """HHMM 형식의 시간 설정값을 time 객체로 변환합니다.
+        
+        Args:
+            value: HHMM 형식 시간 (예: "0930")
+            
+        Returns:
+            dt_time: 변환된 시각
+        """
+        value = str(value).zfill(4)
+        return dt_time(int(value[:2]), int(value[2:]))
     
     def get_today_sold_stocks(self) -> List[str]:
         """API를 통해 당일 매도한 종목 코드 목록을 조회합니다.
@@ -116,10 +216,109 @@ class BaseTrader:
         # 이 메서드는 하위 클래스에서 구현해야 합니다.
         return []
     
-    def load_settings(self) -> None:
+    def is_sold_today(self, stock_code: str) -> bool:
+        """당일 매도한 종목인지 확인합니다.
+        
+        당일 매도 종목 목록은 sold_stocks_cache_ttl 동안 캐시하여 종목마다 API를 호출하지 않습니다.
+        
+        Args:
+            stock_code (str): 종목코드
+            
+        Returns:
+            bool: 당일 매도 여부
+        """
+        self._refresh_sold_stocks_cache()
+        return stock_code in self.sold_stocks_cache
+    
+    def _refresh_sold_stocks_cache(self) -> None:
+        """당일 매도 종목 캐시가 만료되었으면 다시 조회합니다.
+        
+        여러 스레드에서 is_sold_today를 호출하기 전에 미리 호출하면 스레드마다 중복 조회하지 않습니다.
+        """
+        if time.time() - self.sold_stocks_cache_time > self.sold_stocks_cache_ttl:
+            self.sold_stocks_cache = set(self.get_today_sold_stocks())
+            self.sold_stocks_cache_time = time.time()
+    
+    def load_settings(self, force_refresh: bool = False) -> None:
         """구글 스프레드시트에서 설정을 로드합니다."""
         raise NotImplementedError("이 메서드는 하위 클래스에서 구현해야 합니다.")
     
+    def _parse_rebalancing_date(self) -> None:
+        """설정의 리밸런싱 일자를 설정 로드 시 한 번만 파싱해 rebalancing_schedule에 저장합니다.
+        
+        리밸런싱 날짜 형식:
+        1. 년/월/일 (예: 2023/12/15) → (2023, 12, 15)
+        2. 월/일 (예: 12/15) → (None, 12, 15)
+        3. 일 (예: 15) → (None, None, 15)
+        """
+        self.rebalancing_schedule = None
+        rebalancing_date_str = str(self.settings.get('rebalancing_date', '') or '').strip()
+        if not rebalancing_date_str:
+            return
+        
+        # 구분자(/, -, .)로 한 번에 분리 (년/월/일 또는 월/일)
+        parts = REBALANCING_DATE_SEPARATOR.split(rebalancing_date_str)
+        try:
+            if len(parts) == 3:
+                year, month, day = map(int, parts)
+                self.rebalancing_schedule = (year, month, day)
+            elif len(parts) == 2:
+                month, day = map(int, parts)
+                self.rebalancing_schedule = (None, month, day)
+            elif rebalancing_date_str.isdigit():
+                self.rebalancing_schedule = (None, None, int(rebalancing_date_str))
+        except ValueError:
+            self.logger.error(f"리밸런싱 일자 형식 오류: {rebalancing_date_str}")
+    
+    def _matches_rebalancing_date(self, now: datetime) -> bool:
+        """현재 날짜가 파싱해 둔 리밸런싱 일자에 해당하는지 확인합니다.
+        
+        Args:
+            now (datetime): 시장 기준 현재 시각
+            
+        Returns:
+            bool: 리밸런싱 일자 여부
+        """
+        if self.rebalancing_schedule is None:
+            return False
+        
+        year, month, day = self.rebalancing_schedule
+        if now.day != day or (month is not None and now.month != month) or (year is not None and now.year != year):
+            return False
+        
+        if year is not None:
+            self.logger.info(f"리밸런싱 날짜 도달: {year}/{month}/{day}")
+        elif month is not None:
+            self.logger.info(f"리밸런싱 날짜 도달: 매년 {month}/{day}")
+        else:
+            self.logger.info(f"리밸런싱 날짜 도달: 매월 {day}일")
+        return True
+    
+    def _build_stock_indices(self) -> None:
+        """개별/POOL 종목의 종목코드 집합과 종목코드별 설정 딕셔너리를 생성합니다.
+        
+        매매 루프에서 DataFrame 전체를 반복 탐색하지 않도록 설정 로드 시 한 번만 만듭니다.
+        종목코드가 중복된 경우 시트 상단의 행을 사용합니다.
+        """
+        # 매수 루프에서 iterrows() 대신 사용할 행 단위 딕셔너리 목록
+        self.individual_stock_records = self.individual_stocks.to_dict('records')
+        self.pool_stock_records = self.pool_stocks.to_dict('records')
+        
+        self.individual_stock_map = {}
+        self.individual_stock_order = {}  # 개별 종목코드별 시트 내 순서 (매수 후보 정렬용)
+        for index, record in enumerate(self.individual_stock_records):
+            self.individual_stock_map.setdefault(record['종목코드'], record)
+            self.individual_stock_order.setdefault(record['종목코드'], index)
+        
+        self.pool_stock_map = {}
+        self.pool_stock_order = {}  # POOL 종목코드별 시트 내 순서 (매수 후보/현금 확보 매도 정렬용)
+        for index, record in enumerate(self.pool_stock_records):
+            self.pool_stock_map.setdefault(record['종목코드'], record)
+            self.pool_stock_order.setdefault(record['종목코드'], index)
+        
+        self.individual_stock_codes = frozenset(self.individual_stock_map)
+        self.pool_stock_codes = frozenset(self.pool_stock_map)
+    
     def execute_trade(self) -> None:
         """매매를 실행합니다."""
         raise NotImplementedError("이 메서드는 하위 클래스에서 구현해야 합니다.")
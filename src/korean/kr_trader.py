@@ -9,6 +9,9 @@ from src.korean.kis_kr_api import KISKRAPIManager
 from src.utils.trade_history_manager import TradeHistoryManager
 import time
 import pytz  # 시간대 처리를 위한 pytz 추가
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 class KRTrader(BaseTrader):
     """한국 주식 트레이더"""
@@ -22,17 +25,29 @@ class KRTrader(BaseTrader):
         self.kr_api = KISKRAPIManager(config_path)
         self.trade_history = TradeHistoryManager("KOR")
         self.load_settings()
-        self.last_api_call = 0
-        self.api_call_interval = 0.2  # API 호출 간격 (초)
         self.max_retries = 3  # 최대 재시도 횟수
         
         # 한국 시간대 설정
         self.kr_timezone = pytz.timezone("Asia/Seoul")
         
+        # 장 운영 시간과 시가 매매 시간 구간 (장 시작 ~ 장 시작 후 10분), 매 루프 문자열 비교 대신 time 객체로 미리 변환
+        self.market_start_time = self._parse_hhmm(self.config['trading']['kor_market_start'])
+        self.market_end_time = self._parse_hhmm(self.config['trading']['kor_market_end'])
+        self.market_open_end_time = (datetime.combine(datetime.min, self.market_start_time) + timedelta(minutes=10)).time()
+        
         # 최고가 캐시 관련 변수 추가
         self.highest_price_cache = {}  # 종목별 최고가 캐시
         self.highest_price_cache_date = None  # 최고가 캐시 갱신 날짜
         
+        # 총평가금액 캐시 (스탑 매도 메시지용, 같은 루프에서 매도가 여러 건이어도 잔고를 한 번만 조회)
+        self.total_balance_cache = None
+        self.total_balance_cache_time = 0
+        self.total_balance_cache_ttl = 30  # 캐시 유효 시간 (초)
+        
+        # 이동평균 캐시 (종목코드, 기간, 기간구분) → (전전봉 MA, 전봉 MA), 날짜가 바뀌면 초기화
+        self.ma_cache = {}
+        self.ma_cache_date = None
+        
         # 휴장일 캐시 관련 변수 추가
         self.holiday_cache = {}  # 날짜별 휴장일 캐시
         self.holiday_cache_date = None  # 휴장일 캐시 갱신 날짜
@@ -41,14 +56,6 @@ class KRTrader(BaseTrader):
         self.market_open_executed = False
         self.last_market_date = None
     
-    def _wait_for_api_call(self):
-        """API 호출 간격을 제어합니다."""
-        current_time = time.time()
-        elapsed = current_time - self.last_api_call
-        if elapsed < self.api_call_interval:
-            time.sleep(self.api_call_interval - elapsed)
-        self.last_api_call = time.time()
-
     def _retry_api_call(self, func, *args, **kwargs):
         """API 호출을 재시도합니다."""
         for attempt in range(self.max_retries):
@@ -59,19 +66,24 @@ class KRTrader(BaseTrader):
                     return result
             except Exception as e:
                 if "초당 거래건수를 초과" in str(e):
-                    wait_time = (attempt + 1) * self.api_call_interval
+                    wait_time = self.api_call_interval * (2 ** attempt)  # 지수적 대기 시간 증가
                     self.logger.warning(f"API 호출 제한 도달. {wait_time}초 대기 후 재시도 ({attempt + 1}/{self.max_retries})")
                     time.sleep(wait_time)
                     continue
                 raise
         return None
     
-    def load_settings(self) -> None:
-        """구글 스프레드시트에서 설정을 로드합니다."""
+    def load_settings(self, force_refresh: bool = False) -> None:
+        """구글 스프레드시트에서 설정을 로드합니다.
+        
+        Args:
+            force_refresh (bool): True이면 시트 조회 캐시를 무시하고 다시 조회
+        """
         try:
-            self.settings = self.google_sheet.get_settings(market_type="KOR")
-            self.individual_stocks = self.google_sheet.get_individual_stocks(market_type="KOR")
-            self.pool_stocks = self.google_sheet.get_pool_stocks(market_type="KOR")
+            # 설정값과 개별/POOL 종목을 한 번의 요청으로 조회
+            self.settings, self.individual_stocks, self.pool_stocks = self.google_sheet.get_market_settings(market_type="KOR", force_refresh=force_refresh)
+            self._build_stock_indices()
+            self._parse_rebalancing_date()
             
             # 설정값이 없는 경우 기본값 설정
             if 'stop_loss' not in self.settings:
@@ -94,6 +106,7 @@ class KRTrader(BaseTrader):
         now = datetime.now(self.kr_timezone)
         current_date = now.strftime("%Y%m%d")
         current_time = now.strftime("%H%M")
+        current_clock = now.time().replace(second=0, microsecond=0)  # HHMM 단위 비교
         
         # 주말 체크
         if now.weekday() >= 5:  # 5: 토요일, 6: 일요일
@@ -101,10 +114,10 @@ class KRTrader(BaseTrader):
             return False
         
         # 장 운영 시간 체크 - config 설정값 사용
-        if not (self.config['trading']['kor_market_start'] <= current_time <= self.config['trading']['kor_market_end']):
+        if not (self.market_start_time <= current_clock <= self.market_end_time):
             self.logger.info(f"현재 장 운영 시간이 아닙니다. (현재시간: {current_time}, 장 운영시간: {self.config['trading']['kor_market_start']}~{self.config['trading']['kor_market_end']})")
             # 장 시간이 지나면 다음날을 위해 초기화
-            if current_time > self.config['trading']['kor_market_end']:
+            if current_clock > self.market_end_time:
                 self.market_open_executed = False
             return False
         
@@ -170,7 +183,35 @@ class KRTrader(BaseTrader):
     
     def calculate_ma(self, stock_code, period, period_div_code):
         """
-        주어진 종목의 이동평균선 계산
+        주어진 종목의 이동평균선 계산 (당일 계산한 값은 캐시에서 반환)
+        
+        전봉까지의 종가로만 계산하므로 같은 날에는 값이 변하지 않아, 같은 종목/기간을
+        여러 번 확인해도 시세 조회는 하루 한 번만 수행합니다.
+        Args:
+            stock_code: 종목코드
+            period: 이동평균 기간
+            period_div_code: 일/주 구분 코드
+        Returns:
+            (전전봉 이동평균, 전봉 이동평균)
+        """
+        current_date = datetime.now().strftime("%Y%m%d")
+        if self.ma_cache_date != current_date:
+            self.ma_cache = {}
+            self.ma_cache_date = current_date
+        
+        cache_key = (stock_code, period, period_div_code)
+        if cache_key in self.ma_cache:
+            return self.ma_cache[cache_key]
+        
+        ma_values = self._calculate_ma_from_api(stock_code, period, period_div_code)
+        # 조회 실패(None)는 캐시하지 않아 다음 호출에서 재시도
+        if ma_values is not None:
+            self.ma_cache[cache_key] = ma_values
+        return ma_values
+    
+    def _calculate_ma_from_api(self, stock_code, period, period_div_code):
+        """
+        일별/주별 시세를 조회하여 이동평균선 계산
         Args:
             stock_code: 종목코드
             period: 이동평균 기간
@@ -224,13 +265,8 @@ class KRTrader(BaseTrader):
                         # 정렬
                         df['stck_bsop_date'] = pd.to_datetime(df['stck_bsop_date'])
                         df = df.sort_values('stck_bsop_date', ascending=True).reset_index(drop=True)
-                        # 이동평균 계산
-                        df['stck_clpr'] = df['stck_clpr'].astype(float)
-                        ma_series = df['stck_clpr'].rolling(window=period).mean()
-                        # 전전일, 전일 이동평균값 반환
-                        ma_prev2 = ma_series.iloc[-3]  # 전전일
-                        ma_prev = ma_series.iloc[-2]   # 전일
-                        return (ma_prev2, ma_prev)
+                        # 전전일, 전일 이동평균값 반환 (전봉 구간 합계 하나로 두 값을 계산)
+                        return self._calculate_ma_from_closes(df['stck_clpr'].to_numpy(dtype=np.float64), period)
                     
                     self.logger.warning(f"{stock_code}: 일간 데이터 부족, 계산 불가 (현재: {len(hist_data) if hist_data is not None else 0}개, 필요: {period+2}개)")
                     return None
@@ -298,14 +334,8 @@ class KRTrader(BaseTrader):
                         self.logger.warning(f"{stock_code}: 일간 데이터 부족, 계산 불가 (현재: {len(combined_df)}개, 필요: {period+2}개)")
                         return None
                     
-                    # 이동평균 계산
-                    combined_df['stck_clpr'] = combined_df['stck_clpr'].astype(float)
-                    ma_series = combined_df['stck_clpr'].rolling(window=period).mean()
-                    
-                    # 전전일, 전일 이동평균값 반환
-                    ma_prev2 = ma_series.iloc[-3]  # 전전일
-                    ma_prev = ma_series.iloc[-2]   # 전일
-                    return (ma_prev2, ma_prev)
+                    # 전전일, 전일 이동평균값 반환 (전봉 구간 합계 하나로 두 값을 계산)
+                    return self._calculate_ma_from_closes(combined_df['stck_clpr'].to_numpy(dtype=np.float64), period)
                     
                 except Exception as e:
                     self.logger.error(f"{stock_code}: 일간 데이터 분할 조회 중 오류 발생 - {str(e)}")
@@ -336,19 +366,13 @@ class KRTrader(BaseTrader):
                         df['stck_bsop_date'] = pd.to_datetime(df['stck_bsop_date'])
                         df = df.sort_values('stck_bsop_date', ascending=True).reset_index(drop=True)
                         
-                        # 이동평균 계산
-                        df['stck_clpr'] = df['stck_clpr'].astype(float)
-                        ma_series = df['stck_clpr'].rolling(window=period).mean()
-                        
                         # 데이터가 충분한지 확인
                         if len(df) < period + 2:
                             self.logger.warning(f"{stock_code}: 주간 데이터 부족, 계산 불가 (현재: {len(df)}개, 필요: {period+2}개)")
                             return None
                         
-                        # 전전주, 전주 이동평균값 반환
-                        ma_prev2 = ma_series.iloc[-3]  # 전전주
-                        ma_prev = ma_series.iloc[-2]   # 전주
-                        return (ma_prev2, ma_prev)
+                        # 전전주, 전주 이동평균값 반환 (전봉 구간 합계 하나로 두 값을 계산)
+                        return self._calculate_ma_from_closes(df['stck_clpr'].to_numpy(dtype=np.float64), period)
                     
                     # 데이터가 부족하면 더 긴 기간으로 재시도 (아래 코드로 진행)
                     self.logger.debug(f"{stock_code}: 주간 데이터 부족, 더 긴 기간 조회 시도 (현재: {len(hist_data) if hist_data is not None else 0}개, 필요: {period+2}개)")
@@ -414,14 +438,8 @@ class KRTrader(BaseTrader):
                     self.logger.warning(f"{stock_code}: 주간 데이터 부족, 계산 불가 (현재: {len(combined_df)}개, 필요: {period+2}개)")
                     return None
                 
-                # 이동평균 계산
-                combined_df['stck_clpr'] = combined_df['stck_clpr'].astype(float)
-                ma_series = combined_df['stck_clpr'].rolling(window=period).mean()
-                
-                # 전전주, 전주 이동평균값 반환
-                ma_prev2 = ma_series.iloc[-3]  # 전전주
-                ma_prev = ma_series.iloc[-2]   # 전주
-                return (ma_prev2, ma_prev)
+                # 전전주, 전주 이동평균값 반환 (전봉 구간 합계 하나로 두 값을 계산)
+                return self._calculate_ma_from_closes(combined_df['stck_clpr'].to_numpy(dtype=np.float64), period)
             
             except Exception as e:
                 self.logger.error(f"{stock_code}: 주간 데이터 분할 조회 중 오류 발생 - {str(e)}")
@@ -440,7 +458,7 @@ class KRTrader(BaseTrader):
             # 캐시가 오늘 날짜의 데이터이고, 해당 종목의 최고가가 캐시에 있으면 캐시된 값 반환
             if (self.highest_price_cache_date == current_date and 
                 stock_code in self.highest_price_cache):
-                self.logger.debug(f"캐시된 최고가 사용: {stock_code}, {self.highest_price_cache[stock_code]}")
+                self.logger.debug("캐시된 최고가 사용: %s, %s", stock_code, self.highest_price_cache[stock_code])
                 return self.highest_price_cache[stock_code]
             
             # 날짜가 변경되었으면 캐시 초기화
@@ -512,7 +530,7 @@ class KRTrader(BaseTrader):
             
             # 캐시에 저장
             self.highest_price_cache[stock_code] = highest_price
-            self.logger.debug(f"최고가 캐시 업데이트: {stock_code}, {highest_price}")
+            self.logger.debug("최고가 캐시 업데이트: %s, %s", stock_code, highest_price)
             
             return highest_price
             
@@ -575,7 +593,7 @@ class KRTrader(BaseTrader):
                         is_above = ma_condition_prev > ma_target_prev
                         
                         if is_above:
-                            self.logger.info(f"매수 조건 충족: {stock_code}")
+                            self.logger.info("매수 조건 충족: %s", stock_code)
                             self.logger.info(f"- 전일: {condition_period}{period_unit}선(₩{ma_condition_prev:.2f}) > {ma_period}{period_unit}선(₩{ma_target_prev:.2f})")
                         
                         return is_above, ma_target_prev
@@ -587,7 +605,7 @@ class KRTrader(BaseTrader):
                         golden_cross = (ma_condition_prev2 < ma_target_prev2) and (ma_condition_prev > ma_target_prev)
                         
                         if golden_cross:
-                            self.logger.info(f"골든크로스 발생: {stock_code}")
+                            self.logger.info("골든크로스 발생: %s", stock_code)
                             self.logger.info(f"- 전전{period_unit}: {condition_period}{period_unit}선(₩{ma_condition_prev2:.2f}) < {ma_period}{period_unit}선(₩{ma_target_prev2:.2f})")
                             self.logger.info(f"- 전{period_unit}: {condition_period}{period_unit}선(₩{ma_condition_prev:.2f}) > {ma_period}{period_unit}선(₩{ma_target_prev:.2f})")
                         
@@ -661,7 +679,7 @@ class KRTrader(BaseTrader):
                         is_below = ma_condition_prev < ma_target_prev
                         
                         if is_below:
-                            self.logger.info(f"매도 조건 충족: {stock_code}")
+                            self.logger.info("매도 조건 충족: %s", stock_code)
                             self.logger.info(f"- 전일: {condition_period}{period_unit}선(₩{ma_condition_prev:.2f}) < {ma_period}{period_unit}선(₩{ma_target_prev:.2f})")
                         
                         return is_below, ma_target_prev
@@ -673,7 +691,7 @@ class KRTrader(BaseTrader):
                         dead_cross = (ma_condition_prev2 > ma_target_prev2) and (ma_condition_prev < ma_target_prev)
                         
                         if dead_cross:
-                            self.logger.info(f"데드크로스 발생: {stock_code}")
+                            self.logger.info("데드크로스 발생: %s", stock_code)
                             self.logger.info(f"- 전전{period_unit}: {condition_period}{period_unit}선(₩{ma_condition_prev2:.2f}) > {ma_period}{period_unit}선(₩{ma_target_prev2:.2f})")
                             self.logger.info(f"- 전{period_unit}: {condition_period}{period_unit}선(₩{ma_condition_prev:.2f}) < {ma_period}{period_unit}선(₩{ma_target_prev:.2f})")
                         
@@ -700,51 +718,8 @@ class KRTrader(BaseTrader):
         2. 월/일 (예: 12/15) - 매년 해당 월일에 리밸런싱
         3. 일 (예: 15) - 매월 해당 일자에 리밸런싱
         """
-        try:
-            # 현재 시간 확인
-            now = datetime.now()
-            
-            # 구글 시트에서 리밸런싱 일자 가져오기
-            rebalancing_date = str(self.settings.get('rebalancing_date', ''))
-            if not rebalancing_date:
-                return False
-                    
-            # 리밸런싱 일자 파싱
-            rebalancing_date_str = str(rebalancing_date).strip()
-            
-            # 구분자로 분리된 경우 (년/월/일 또는 월/일)
-            for sep in ['/', '-', '.']:
-                if sep in rebalancing_date_str:
-                    parts = rebalancing_date_str.split(sep)
-                    
-                    # 년/월/일 형식 (예: 2023/12/15)
-                    if len(parts) == 3:
-                        year, month, day = map(int, parts)
-                        if now.year == year and now.month == month and now.day == day:
-                            self.logger.info(f"리밸런싱 날짜 도달: {year}/{month}/{day}")
-                            return True
-                        return False
-                    
-                    # 월/일 형식 (예: 12/15)
-                    elif len(parts) == 2:
-                        month, day = map(int, parts)
-                        if now.month == month and now.day == day:
-                            self.logger.info(f"리밸런싱 날짜 도달: 매년 {month}/{day}")
-                            return True
-                        return False
-            
-            # 숫자만 있는 경우 (일자만 지정, 예: "15")
-            if rebalancing_date_str.isdigit():
-                day = int(rebalancing_date_str)
-                if now.day == day:
-                    self.logger.info(f"리밸런싱 날짜 도달: 매월 {day}일")
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"리밸런싱 일자 확인 중 오류 발생: {str(e)}")
-            return False
+        # 리밸런싱 일자는 load_settings에서 미리 파싱해 두고 오늘 날짜와 비교
+        return self._matches_rebalancing_date(datetime.now())
 
     def _rebalance_portfolio(self, balance: Dict):
         """포트폴리오 리밸런싱을 실행합니다."""
@@ -755,124 +730,125 @@ class KRTrader(BaseTrader):
             total_balance = float(balance['output2'][0]['tot_evlu_amt'])
             self.logger.info(f"총 평가금액: {total_balance:,.0f}원")
             
-            # 보유 종목별 현재 비율 계산
-            holdings = {}
+            # 리밸런싱 대상 보유 종목 (구글 스프레드시트에 목표 비율이 있는 종목만, 개별 종목 우선)
+            targets = []
             for holding in balance['output1']:
-                if int(holding.get('hldg_qty', 0)) > 0:
-                    stock_code = holding['pdno']
-                    current_price_data = self._retry_api_call(self.kr_api.get_stock_price, stock_code)
-                    if current_price_data is None:
-                        continue
-                        
-                    current_price = float(current_price_data['output']['stck_prpr'])
-                    quantity = int(holding['hldg_qty'])
-                    current_value = current_price * quantity
-                    current_ratio = current_value / total_balance * 100
-                    
-                    # 목표 비율 찾기
-                    target_ratio = 0
-                    stock_info = None
+                if int(holding.get('hldg_qty', 0)) <= 0:
+                    continue
+                stock_info = self.individual_stock_map.get(holding['pdno']) or self.pool_stock_map.get(holding['pdno'])
+                if stock_info is None:
+                    continue
+                target_ratio = float(stock_info['배분비율'])
+                if target_ratio > 0:
+                    targets.append((holding, target_ratio))
+            
+            # 현재가 병렬 조회 (조회 실패 또는 현재가가 0인 종목은 제외)
+            price_results = self._run_api_calls_concurrently(
+                self.kr_api.get_stock_price,
+                [(holding['pdno'],) for holding, _ in targets]
+            )
+            priced_targets = [
+                (holding, target_ratio, float(price_data['output']['stck_prpr']))
+                for (holding, target_ratio), price_data in zip(targets, price_results)
+                if price_data is not None and float(price_data['output']['stck_prpr']) > 0
+            ]
+            if not priced_targets:
+                self.logger.info("리밸런싱 대상 종목이 없습니다.")
+                return
+            
+            # 보유 종목별 현재 비중과 조정 수량 계산 (벡터 연산, 미국 시장과 동일하게 목표 - 현재)
+            quantities = np.array([int(holding['hldg_qty']) for holding, _, _ in priced_targets], dtype=np.int64)
+            current_prices = np.array([current_price for _, _, current_price in priced_targets], dtype=np.float64)
+            target_ratios = np.array([target_ratio for _, target_ratio, _ in priced_targets], dtype=np.float64)
+            current_values = quantities * current_prices
+            current_ratios = current_values / total_balance * 100
+            ratio_diffs = target_ratios - current_ratios
+            value_diffs = total_balance * (target_ratios / 100) - current_values
+            quantity_diffs = (np.abs(value_diffs) / current_prices).astype(np.int64)
+            
+            # 리밸런싱 실행 (비율 차이가 0.5% 이상이고 조정 수량이 있는 종목만)
+            for i in np.flatnonzero((np.abs(ratio_diffs) >= 0.5) & (quantity_diffs > 0)):
+                holding, _, current_price = priced_targets[i]
+                stock_code = holding['pdno']
+                quantity_diff = int(quantity_diffs[i])
+                value_diff = float(value_diffs[i])
+                info = {
+                    'name': holding['prdt_name'],
+                    'current_price': current_price,
+                    'quantity': int(quantities[i]),
+                    'current_ratio': float(current_ratios[i]),
+                    'target_ratio': float(target_ratios[i]),
+                    'current_value': float(current_values[i])
+                }
+                
+                if ratio_diffs[i] > 0:  # 매수 필요
+                    # 매수 시 지정가의 1% 높게 설정하여 시장가처럼 거래
+                    buy_price = info['current_price']
                     
-                    # 개별 종목에서 찾기
-                    individual_match = self.individual_stocks[self.individual_stocks['종목코드'] == stock_code]
-                    if not individual_match.empty:
-                        stock_info = individual_match.iloc[0]
-                        target_ratio = float(stock_info['배분비율'])
-                    else:
-                        # POOL 종목에서 찾기
-                        pool_match = self.pool_stocks[self.pool_stocks['종목코드'] == stock_code]
-                        if not pool_match.empty:
-                            stock_info = pool_match.iloc[0]
-                            target_ratio = float(stock_info['배분비율'])
+                    result = self._retry_api_call(
+                        self.kr_api.order_stock,
+                        stock_code,
+                        "BUY",
+                        quantity_diff
+                    )
                     
-                    if target_ratio > 0:
-                        holdings[stock_code] = {
-                            'name': holding['prdt_name'],
-                            'current_price': current_price,
-                            'quantity': quantity,
-                            'current_ratio': current_ratio,
-                            'target_ratio': target_ratio,
-                            'current_value': current_value
+                    if result:
+                        msg = f"리밸런싱 매수: {info['name']}({stock_code}) {quantity_diff}주"
+                        msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
+                        msg += f"\n- 현재가: {info['current_price']:,}원"
+                        msg += f"\n- 매수 금액: {value_diff:,.0f}원"
+                        self.logger.info(msg)
+                        
+                        # 거래 내역 저장
+                        trade_data = {
+                            "trade_type": "REBALANCE",
+                            "trade_action": "BUY",
+                            "stock_code": stock_code,
+                            "stock_name": info['name'],
+                            "quantity": quantity_diff,
+                            "price": buy_price,
+                            "total_amount": abs(value_diff),
+                            "reason": f"리밸런싱 매수: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
+                            "order_type": "BUY",
+                            "order_no": self._get_order_no(result)
                         }
-            
-            # 리밸런싱 실행
-            for stock_code, info in holdings.items():
-                # 목표 비율과 현재 비율의 차이 계산 (미국 시장과 동일하게 목표 - 현재)
-                ratio_diff = info['target_ratio'] - info['current_ratio']
-                
-                # 최소 리밸런싱 비율 차이 (0.5% 이상)
-                if abs(ratio_diff) >= 0.5:
-                    target_value = total_balance * (info['target_ratio'] / 100)
-                    value_diff = target_value - info['current_value']
-                    quantity_diff = int(abs(value_diff) / info['current_price'])
+                        self.trade_history.add_trade(trade_data)
+                        
+                else:  # 매도 필요
+                    # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
+                    sell_price = info['current_price']
                     
-                    if quantity_diff > 0:
-                        if ratio_diff > 0:  # 매수 필요
-                            # 매수 시 지정가의 1% 높게 설정하여 시장가처럼 거래
-                            buy_price = info['current_price']
-                            
-                            result = self._retry_api_call(
-                                self.kr_api.order_stock,
-                                stock_code,
-                                "BUY",
-                                quantity_diff
-                            )
-                            
-                            if result:
-                                msg = f"리밸런싱 매수: {info['name']}({stock_code}) {quantity_diff}주"
-                                msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
-                                msg += f"\n- 현재가: {info['current_price']:,}원"
-                                msg += f"\n- 매수 금액: {value_diff:,.0f}원"
-                                self.logger.info(msg)
-                                
-                                # 거래 내역 저장
-                                trade_data = {
-                                    "trade_type": "REBALANCE",
-                                    "trade_action": "BUY",
-                                    "stock_code": stock_code,
-                                    "stock_name": info['name'],
-                                    "quantity": quantity_diff,
-                                    "price": buy_price,
-                                    "total_amount": abs(value_diff),
-                                    "reason": f"리밸런싱 매수: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
-                                    "order_type": "BUY"
-                                }
-                                self.trade_history.add_trade(trade_data)
-                                
-                        else:  # 매도 필요
-                            # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
-                            sell_price = info['current_price']
-                            
-                            result = self._retry_api_call(
-                                self.kr_api.order_stock,
-                                stock_code,
-                                "SELL",
-                                quantity_diff
-                            )
-                            
-                            if result:
-                                msg = f"리밸런싱 매도: {info['name']}({stock_code}) {quantity_diff}주"
-                                msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
-                                msg += f"\n- 현재가: {info['current_price']:,}원"
-                                msg += f"\n- 매도 금액: {abs(value_diff):,.0f}원"
-                                self.logger.info(msg)
-                                
-                                # 당일 매도 종목 캐시에 추가
-                                self.sold_stocks_cache.append(stock_code)
-                                
-                                # 거래 내역 저장
-                                trade_data = {
-                                    "trade_type": "REBALANCE",
-                                    "trade_action": "SELL",
-                                    "stock_code": stock_code,
-                                    "stock_name": info['name'],
-                                    "quantity": quantity_diff,
-                                    "price": sell_price,
-                                    "total_amount": abs(value_diff),
-                                    "reason": f"리밸런싱 매도: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
-                                    "order_type": "SELL"
-                                }
-                                self.trade_history.add_trade(trade_data)
+                    result = self._retry_api_call(
+                        self.kr_api.order_stock,
+                        stock_code,
+                        "SELL",
+                        quantity_diff
+                    )
+                    
+                    if result:
+                        msg = f"리밸런싱 매도: {info['name']}({stock_code}) {quantity_diff}주"
+                        msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
+                        msg += f"\n- 현재가: {info['current_price']:,}원"
+                        msg += f"\n- 매도 금액: {abs(value_diff):,.0f}원"
+                        self.logger.info(msg)
+                        
+                        # 당일 매도 종목 캐시에 추가
+                        self.sold_stocks_cache.add(stock_code)
+                        
+                        # 거래 내역 저장
+                        trade_data = {
+                            "trade_type": "REBALANCE",
+                            "trade_action": "SELL",
+                            "stock_code": stock_code,
+                            "stock_name": info['name'],
+                            "quantity": quantity_diff,
+                            "price": sell_price,
+                            "total_amount": abs(value_diff),
+                            "reason": f"리밸런싱 매도: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
+                            "order_type": "SELL",
+                            "order_no": self._get_order_no(result)
+                        }
+                        self.trade_history.add_trade(trade_data)
             
             self.logger.info("포트폴리오 리밸런싱이 완료되었습니다.")
             
@@ -886,27 +862,23 @@ class KRTrader(BaseTrader):
         try:
             # 현재 날짜 및 시간 확인
             now = datetime.now()
-            current_time = now.strftime("%H%M")
+            current_clock = now.time().replace(second=0, microsecond=0)  # HHMM 단위 비교
             
             # 당일 최초 실행 여부 확인 및 초기화
             if self.execution_date != now.strftime("%Y-%m-%d"):
                 self.execution_date = now.strftime("%Y-%m-%d")
                 self.market_open_executed = False
                 self.market_close_executed = False
-                self.sold_stocks_cache = []  # 당일 매도 종목 캐시 초기화
+                self.sold_stocks_cache = set()  # 당일 매도 종목 캐시 초기화
                 self.sold_stocks_cache_time = 0  # 캐시 시간 초기화
                 self.logger.info(f"=== {self.execution_date} 매매 시작 ===")
             
             # 1. 스탑로스/트레일링 스탑 체크 (매 루프마다 실행)
             self._check_stop_conditions()
             
-            # 장 시작 시간 체크 (09:00)
-            market_open_time = self.config['trading']['kor_market_start']
-            market_open_end_time = f"{int(market_open_time) + 10:04d}"  # 10분 이내
-            
             # 장 시작 시간에 매매 실행 (아직 실행되지 않은 경우, 장 시작 시간부터 10분간만 허용)
-            if current_time >= market_open_time and current_time <= market_open_end_time and not self.market_open_executed:
-                self.logger.info(f"장 시작 시간 도달: {market_open_time[:2]}:{market_open_time[2:]}")
+            if self.market_start_time <= current_clock <= self.market_open_end_time and not self.market_open_executed:
+                self.logger.info(f"장 시작 시간 도달: {self.market_start_time.strftime('%H:%M')}")
                 
                 # 1. 시가 매도 실행
                 self.logger.info("1. 시가 매도 실행")
@@ -967,17 +939,30 @@ class KRTrader(BaseTrader):
             
             self.logger.info("매수 조건 체크 시작")
             
-            # 개별 종목 매수 조건 체크
-            for _, row in self.individual_stocks.iterrows():
-                candidates = self._check_stock_buy_condition(row, holdings, cash, 'individual')
-                if candidates:
-                    individual_candidates.extend(candidates)
-            
-            # POOL 종목 매수 조건 체크
-            for _, row in self.pool_stocks.iterrows():
-                candidates = self._check_stock_buy_condition(row, holdings, cash, 'pool')
-                if candidates:
-                    pool_candidates.extend(candidates)
+            # 당일 매도 종목 캐시를 미리 갱신해 스레드마다 중복 조회하지 않도록 함
+            self._refresh_sold_stocks_cache()
+            
+            # 개별/POOL 종목 매수 조건 체크는 조회만 하므로 병렬로 실행 (주문은 아래에서 우선순위 순서대로 순차 실행)
+            check_args = [(row, 'individual') for row in self.individual_stock_records]
+            check_args += [(row, 'pool') for row in self.pool_stock_records]
+            if check_args:
+                with ThreadPoolExecutor(max_workers=min(4, len(check_args))) as executor:
+                    futures = [
+                        executor.submit(self._check_stock_buy_condition, row, holdings, cash, stock_type)
+                        for row, stock_type in check_args
+                    ]
+                
+                for (row, stock_type), future in zip(check_args, futures):
+                    try:
+                        candidates = future.result()
+                    except Exception as e:
+                        self.logger.error(f"{row['종목명']}({row['종목코드']}) 매수 조건 체크 중 오류 발생: {str(e)}")
+                        continue
+                    if candidates:
+                        if stock_type == 'individual':
+                            individual_candidates.extend(candidates)
+                        else:
+                            pool_candidates.extend(candidates)
             
             # 개별 종목을 우선 처리하고, 그 다음 POOL 종목 처리
             buy_candidates = individual_candidates + pool_candidates
@@ -989,9 +974,9 @@ class KRTrader(BaseTrader):
             
             # 매수 후보 정렬 (구글 스프레드시트 순서대로)
             buy_candidates.sort(key=lambda x: (
-                self.individual_stocks[self.individual_stocks['종목코드'] == x['code']].index.min() 
+                self.individual_stock_order.get(x['code'], float('inf'))
                 if x['type'] == 'individual'
-                else self.pool_stocks[self.pool_stocks['종목코드'] == x['code']].index.min()
+                else self.pool_stock_order.get(x['code'], float('inf'))
             ))
             
             # 최대 종목 수 제한
@@ -999,8 +984,8 @@ class KRTrader(BaseTrader):
             max_pool = self.settings['max_pool_stocks']
             
             # 현재 보유 종목 수 확인
-            current_individual = sum(1 for code in holdings if code in self.individual_stocks['종목코드'].values)
-            current_pool = sum(1 for code in holdings if code in self.pool_stocks['종목코드'].values)
+            current_individual = sum(1 for code in holdings if code in self.individual_stock_codes)
+            current_pool = sum(1 for code in holdings if code in self.pool_stock_codes)
             
             # 매수 가능 종목 수 계산
             available_individual = max(0, max_individual - current_individual)
@@ -1024,10 +1009,10 @@ class KRTrader(BaseTrader):
                 
                 # 최대 종목 수 체크
                 if is_individual and available_individual <= 0:
-                    self.logger.info(f"{stock_name}({stock_code}) - 최대 개별 종목 수 초과")
+                    self.logger.info("%s(%s) - 최대 개별 종목 수 초과", stock_name, stock_code)
                     continue
                 elif not is_individual and available_pool <= 0:
-                    self.logger.info(f"{stock_name}({stock_code}) - 최대 POOL 종목 수 초과")
+                    self.logger.info("%s(%s) - 최대 POOL 종목 수 초과", stock_name, stock_code)
                     continue
                 
                 # 현금 확인
@@ -1042,7 +1027,7 @@ class KRTrader(BaseTrader):
                     pool_holdings = []
                     for holding_code, holding_info in holdings.items():
                         # POOL 종목인지 확인
-                        if holding_code in self.pool_stocks['종목코드'].values:
+                        if holding_code in self.pool_stock_codes:
                             pool_holdings.append({
                                 'code': holding_code,
                                 'name': holding_info['name'],
@@ -1052,8 +1037,7 @@ class KRTrader(BaseTrader):
                             })
                     
                     # 구글 스프레드시트 순서의 역순으로 정렬 (마지막에 추가된 종목부터 매도)
-                    pool_codes = self.pool_stocks['종목코드'].tolist()
-                    pool_holdings.sort(key=lambda x: pool_codes.index(x['code']) if x['code'] in pool_codes else float('inf'), reverse=True)
+                    pool_holdings.sort(key=lambda x: self.pool_stock_order.get(x['code'], float('inf')), reverse=True)
                     
                     cash_to_secure = required_cash - cash
                     secured_cash = 0
@@ -1145,7 +1129,8 @@ class KRTrader(BaseTrader):
                         "ma_period": ma_period,
                         "ma_value": ma_value,
                         "reason": reason,
-                        "order_type": "BUY"
+                        "order_type": "BUY",
+                        "order_no": self._get_order_no(order_result)
                     }
                     self.trade_history.add_trade(trade_data)
                     
@@ -1192,18 +1177,17 @@ class KRTrader(BaseTrader):
         # 매수 기간 체크 (설정된 경우)
         if 'buy_start_date' in row and 'buy_end_date' in row:
             if not self._is_within_buy_period(row):
-                self.logger.info(f"{stock_name}({stock_code}) - 매수 기간이 아님")
+                self.logger.info("%s(%s) - 매수 기간이 아님", stock_name, stock_code)
                 return candidates
         
         # 이미 보유 중인 종목은 스킵
         if stock_code in holdings:
-            self.logger.info(f"{stock_name}({stock_code}) - 이미 보유 중")
+            self.logger.info("%s(%s) - 이미 보유 중", stock_name, stock_code)
             return candidates
             
         # 당일 매도한 종목은 스킵
-        sold_stocks = self.get_today_sold_stocks()
-        if stock_code in sold_stocks:
-            self.logger.info(f"{stock_name}({stock_code}) - 당일 매도 종목 재매수 제한")
+        if self.is_sold_today(stock_code):
+            self.logger.info("%s(%s) - 당일 매도 종목 재매수 제한", stock_name, stock_code)
             return candidates
         
         # 매수 조건 관련 설정값 가져오기
@@ -1351,9 +1335,9 @@ class KRTrader(BaseTrader):
                         'ma_condition': "정상매도후재매수",
                         'type': stock_type
                     })
-                    self.logger.info(f"{stock_name}({stock_code}) - 정상 매도 후 재매수 후보에 추가됨 (매수조건 충족 여부와 관계없이)")
+                    self.logger.info("%s(%s) - 정상 매도 후 재매수 후보에 추가됨 (매수조건 충족 여부와 관계없이)", stock_name, stock_code)
                 else:
-                    self.logger.info(f"{stock_name}({stock_code}) - 추가 매수 수량이 0 또는 음수")
+                    self.logger.info("%s(%s) - 추가 매수 수량이 0 또는 음수", stock_name, stock_code)
                 
                 # 다른 매수 조건 확인 스킵
                 return candidates
@@ -1414,7 +1398,7 @@ class KRTrader(BaseTrader):
                     'type': stock_type
                 })
             else:
-                self.logger.info(f"{stock_name}({stock_code}) - 추가 매수 수량이 0 또는 음수")
+                self.logger.info("%s(%s) - 추가 매수 수량이 0 또는 음수", stock_name, stock_code)
         else:
             if ma_value:
                 miss_msg = f"{stock_name}({stock_code}) - 매수 조건 미충족"
@@ -1430,7 +1414,7 @@ class KRTrader(BaseTrader):
                         miss_msg += f": {ma_condition}{period_unit}선이 {ma_period}{period_unit}선과의 조건 미충족"
                 self.logger.info(miss_msg)
             else:
-                self.logger.info(f"{stock_name}({stock_code}) - 이동평균 계산 실패")
+                self.logger.info("%s(%s) - 이동평균 계산 실패", stock_name, stock_code)
                 
         return candidates
     
@@ -1453,14 +1437,8 @@ class KRTrader(BaseTrader):
             # 보유 종목 매도 조건 체크
             sell_candidates = []
             
-            # 구글 스프레드시트에 있는 종목 코드 리스트 생성
-            sheet_stock_codes = set()
-            # 개별 종목에서 종목 코드 추가
-            for _, row in self.individual_stocks.iterrows():
-                sheet_stock_codes.add(row['종목코드'])
-            # POOL 종목에서 종목 코드 추가
-            for _, row in self.pool_stocks.iterrows():
-                sheet_stock_codes.add(row['종목코드'])
+            # 구글 스프레드시트에 있는 종목 코드 집합 (개별 + POOL)
+            sheet_stock_codes = self.individual_stock_codes | self.pool_stock_codes
             
             # 각 종목별로 매도 조건 체크
             for holding in balance['output1']:
@@ -1482,7 +1460,7 @@ class KRTrader(BaseTrader):
                     
                     current_price = float(price_data['output']['stck_prpr'])
                     
-                    self.logger.info(f"{stock_name}({stock_code}) - 구글 스프레드시트에서 삭제된 종목이므로 매도 후보에 추가합니다.")
+                    self.logger.info("%s(%s) - 구글 스프레드시트에서 삭제된 종목이므로 매도 후보에 추가합니다.", stock_name, stock_code)
                     
                     sell_candidates.append({
                         'code': stock_code,
@@ -1503,16 +1481,13 @@ class KRTrader(BaseTrader):
                 ma_condition = "종가"  # 기본값
                 period_div_code = "D"  # 기본값
                 # 개별 종목에서 찾기
-                individual_match = self.individual_stocks[self.individual_stocks['종목코드'] == stock_code]
-                if not individual_match.empty:
+                row = self.individual_stock_map.get(stock_code)
+                if row is not None:
                     is_individual = True
-                    row = individual_match.iloc[0]
                 else:
                     # POOL 종목에서 찾기
-                    pool_match = self.pool_stocks[self.pool_stocks['종목코드'] == stock_code]
-                    if not pool_match.empty:
-                        row = pool_match.iloc[0]
-                    else:
+                    row = self.pool_stock_map.get(stock_code)
+                    if row is None:
                         # 기준을 찾을 수 없는 경우 (기본값 사용)
                         self.logger.warning(f"{stock_name}({stock_code}) - 매도 기준을 찾을 수 없어 기본값 사용: {ma_period}일선, 전일 종가")
                         # 다음 종목으로 넘어감
@@ -1592,7 +1567,7 @@ class KRTrader(BaseTrader):
                         
                         self.logger.info(miss_msg)
                     else:
-                        self.logger.info(f"{stock_name}({stock_code}) - 이동평균 계산 실패")
+                        self.logger.info("%s(%s) - 이동평균 계산 실패", stock_name, stock_code)
             
             # 매도 후보가 없으면 종료
             if not sell_candidates:
@@ -1658,7 +1633,8 @@ class KRTrader(BaseTrader):
                         "ma_period": ma_period,
                         "ma_value": ma_value,
                         "reason": reason,
-                        "order_type": "SELL"
+                        "order_type": "SELL",
+                        "order_no": self._get_order_no(order_result)
                     }
                     self.trade_history.add_trade(trade_data)
                     
@@ -1696,9 +1672,19 @@ class KRTrader(BaseTrader):
             if balance is None:
                 return
             
-            for holding in balance['output1']:
-                stock_code = holding['pdno']
-                current_price_data = self.kr_api.get_stock_price(stock_code)
+            # 보유 수량이 없는 종목(당일 전량 매도 등)은 스탑 조건 대상이 아니므로 현재가 조회 전에 제외
+            held_holdings = [
+                holding for holding in balance['output1']
+                if str(holding.get('hldg_qty', '')).strip().isdigit() and int(holding['hldg_qty']) > 0
+            ]
+            
+            # 보유 종목 현재가를 병렬로 조회한 뒤 종목별 조건 체크는 순차 실행
+            price_results = self._run_api_calls_concurrently(
+                self.kr_api.get_stock_price,
+                [(holding['pdno'],) for holding in held_holdings]
+            )
+            
+            for holding, current_price_data in zip(held_holdings, price_results):
                 if current_price_data is None:
                     continue
                 
@@ -1745,20 +1731,20 @@ class KRTrader(BaseTrader):
                         "total_amount": quantity * current_price,
                         "reason": f"스탑로스 매도: 손실률 {loss_pct:.2f}% (스탑로스 기준 {self.settings['stop_loss']}%)",
                         "profit_loss": (current_price - entry_price) * quantity,
-                        "profit_loss_pct": loss_pct
+                        "profit_loss_pct": loss_pct,
+                        "order_no": self._get_order_no(result)
                     }
                     self.trade_history.add_trade(trade_data)
                     
-                    # 잔고 재조회
-                    new_balance = self.kr_api.get_account_balance()
-                    total_balance = float(new_balance['output2'][0]['tot_evlu_amt'])
-                    d2_deposit = float(new_balance['output2'][0]['dnca_tot_amt'])
+                    # 총평가금액 조회 (캐시 사용)
+                    total_balance = self._get_cached_total_balance()
                     
                     msg = f"스탑로스 매도 실행: {name} {quantity}주"
                     msg += f"\n- 매도 사유: 손실률 {loss_pct:.2f}% (스탑로스 {self.settings['stop_loss']}% 도달)"
                     msg += f"\n- 매도 금액: {current_price * quantity:,.0f}원 (현재가 {current_price:,.0f}원)"
                     msg += f"\n- 매수 정보: 매수단가 {entry_price:,.0f}원 / 평가손익 {(current_price - entry_price) * quantity:,.0f}원"
-                    msg += f"\n- 계좌 상태: 총평가금액 {total_balance:,.0f}원"
+                    if total_balance is not None:
+                        msg += f"\n- 계좌 상태: 총평가금액 {total_balance:,.0f}원"
                     self.logger.info(msg)
                     # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                     self.sold_stocks_cache_time = 0
@@ -1795,7 +1781,8 @@ class KRTrader(BaseTrader):
                     self.highest_price_cache_date = current_date
                 
                 self.highest_price_cache[stock_code] = current_price
-                self.logger.debug(f"최고가 캐시 업데이트: {stock_code}, {current_price:,.0f}원")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"최고가 캐시 업데이트: {stock_code}, {current_price:,.0f}원")
             else:
                 # 목표가(trailing_start) 초과 여부 확인
                 profit_pct = (highest_price - entry_price) / entry_price * 100
@@ -1828,20 +1815,20 @@ class KRTrader(BaseTrader):
                                 "total_amount": quantity * current_price,
                                 "reason": f"트레일링 스탑 매도: 고점({highest_price:,.0f}원) 대비 하락률 {drop_pct:.2f}% (TS 기준 {self.settings['trailing_stop']}%)",
                                 "profit_loss": (current_price - entry_price) * quantity,
-                                "profit_loss_pct": (current_price - entry_price) / entry_price * 100
+                                "profit_loss_pct": (current_price - entry_price) / entry_price * 100,
+                                "order_no": self._get_order_no(result)
                             }
                             self.trade_history.add_trade(trade_data)
                             
-                            # 잔고 재조회
-                            new_balance = self.kr_api.get_account_balance()
-                            total_balance = float(new_balance['output2'][0]['tot_evlu_amt'])
-                            d2_deposit = float(new_balance['output2'][0]['dnca_tot_amt'])
+                            # 총평가금액 조회 (캐시 사용)
+                            total_balance = self._get_cached_total_balance()
                             
                             msg = f"트레일링 스탑 매도 실행: {name} {quantity}주"
                             msg += f"\n- 매도 사유: 고점 대비 하락률 {drop_pct:.3f}% (트레일링 스탑 {self.settings['trailing_stop']}% 도달)"
                             msg += f"\n- 매도 금액: {current_price * quantity:,.0f}원 (현재가 {current_price:,.0f}원)"
                             msg += f"\n- 매수 정보: 매수단가 {entry_price:,.0f}원 / 평가손익 {(current_price - entry_price) * quantity:,.0f}원"
-                            msg += f"\n- 계좌 상태: 총평가금액 {total_balance:,.0f}원"
+                            if total_balance is not None:
+                                msg += f"\n- 계좌 상태: 총평가금액 {total_balance:,.0f}원"
                             self.logger.info(msg)
                             # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                             self.sold_stocks_cache_time = 0
@@ -1853,29 +1840,46 @@ class KRTrader(BaseTrader):
             self.logger.error(f"스탑 조건 체크 중 오류 발생 ({stock_code}): {str(e)}")
             return False 
 
+    def _get_cached_total_balance(self) -> Optional[float]:
+        """총평가금액을 조회합니다. 조회 결과는 total_balance_cache_ttl 동안 재사용합니다.
+        
+        Returns:
+            Optional[float]: 총평가금액 (조회 실패 시 None)
+        """
+        if self.total_balance_cache is not None and time.time() - self.total_balance_cache_time < self.total_balance_cache_ttl:
+            return self.total_balance_cache
+        
+        balance = self._retry_api_call(self.kr_api.get_account_balance)
+        if not balance:
+            return None
+        
+        self.total_balance_cache = float(balance['output2'][0]['tot_evlu_amt'])
+        self.total_balance_cache_time = time.time()
+        return self.total_balance_cache
+    
     def get_today_sold_stocks(self) -> List[str]:
         """API를 통해 당일 매도한 종목 코드 목록을 조회합니다.
         
         Returns:
             List[str]: 당일 매도한 종목 코드 목록
         """
-        sold_stocks = []
+        sold_stocks = set()
         try:
             # 당일 체결 내역 조회
             executed_orders = self._retry_api_call(self.kr_api.get_today_executed_orders)
             
             if executed_orders and 'output1' in executed_orders:
                 for order in executed_orders['output1']:
-                    # 매도 주문만 필터링 (01: 매도)
-                    if order['sll_buy_dvsn_cd'] == '01':
-                        stock_code = order['pdno']
-                        # 체결 수량이 있는 경우만 추가
-                        if int(order['tot_ccld_qty']) > 0:
-                            if stock_code not in sold_stocks:
-                                sold_stocks.append(stock_code)
-                                self.logger.debug(f"당일 매도 종목 확인: {order['prdt_name']}({stock_code})")
-            
-            return sold_stocks
+                    # 매도 주문만 필터링 (01: 매도), 이미 확인한 종목은 체결 수량을 다시 변환하지 않음
+                    stock_code = order['pdno']
+                    if order['sll_buy_dvsn_cd'] != '01' or stock_code in sold_stocks:
+                        continue
+                    # 체결 수량이 있는 경우만 추가
+                    if int(order['tot_ccld_qty']) > 0:
+                        sold_stocks.add(stock_code)
+                        self.logger.debug("당일 매도 종목 확인: %s(%s)", order['prdt_name'], stock_code)
+            
+            return list(sold_stocks)
         except Exception as e:
             self.logger.error(f"당일 매도 종목 조회 중 오류 발생: {str(e)}")
             return []  # 오류 발생 시 빈 리스트 반환
@@ -1888,76 +1892,84 @@ class KRTrader(BaseTrader):
             if balance is None:
                 raise Exception("계좌 잔고 조회 실패")
             
-            # 보유 종목 데이터 생성
+            # 보유 종목 데이터 생성 (보유 수량이 있는 종목의 현재가를 병렬로 조회)
+            # 보유 종목 수만큼 응답 대기가 겹치도록 최대 8개까지 동시 호출 (호출 간격은 _wait_for_api_call로 유지)
+            holdings = [holding for holding in balance['output1'] if int(holding.get('hldg_qty', 0)) > 0]
+            price_results = self._run_api_calls_concurrently(
+                self.kr_api.get_stock_price,
+                [(holding['pdno'],) for holding in holdings],
+                max_workers=8
+            )
+            
+            # 보유 종목 행에 필요한 필드를 한 번에 추출
+            holding_fields = itemgetter('pdno', 'prdt_name', 'pchs_avg_pric', 'evlu_pfls_rt', 'hldg_qty',
+                                        'evlu_pfls_amt', 'pchs_amt', 'evlu_amt')
+            price_fields = itemgetter('stck_prpr', 'prdy_ctrt')
+            
             holdings_data = []
-            for holding in balance['output1']:
-                if int(holding.get('hldg_qty', 0)) <= 0:
-                    continue
-                
-                stock_code = holding['pdno']
-                current_price_data = self._retry_api_call(self.kr_api.get_stock_price, stock_code)
-                
+            for holding, current_price_data in zip(holdings, price_results):
                 if current_price_data:
-                    # 현재가
-                    current_price = round(float(current_price_data['output']['stck_prpr']), 2)
+                    stock_code, stock_name, avg_price, profit_rate, quantity, profit_amount, purchase_amount, eval_amount = holding_fields(holding)
+                    current_price, change_rate = price_fields(current_price_data['output'])
                     
                     holdings_data.append([
-                        stock_code,                                           # 종목코드
-                        holding['prdt_name'],                                # 종목명
-                        current_price,                                       # 현재가
-                        '',                                                  # 구분
-                        round(float(current_price_data['output']['prdy_ctrt']), 2),   # 등락률
-                        round(float(holding['pchs_avg_pric']), 2),                    # 평단가
-                        round(float(holding['evlu_pfls_rt']), 2),                     # 수익률
-                        int(holding['hldg_qty']),                           # 보유량
-                        round(float(holding['evlu_pfls_amt']), 2),                    # 평가손익
-                        round(float(holding['pchs_amt']), 2),                         # 매입금액
-                        round(float(holding['evlu_amt']), 2)                          # 평가금액
+                        stock_code,                           # 종목코드
+                        stock_name,                           # 종목명
+                        round(float(current_price), 2),       # 현재가
+                        '',                                   # 구분
+                        round(float(change_rate), 2),         # 등락률
+                        round(float(avg_price), 2),           # 평단가
+                        round(float(profit_rate), 2),         # 수익률
+                        int(quantity),                        # 보유량
+                        round(float(profit_amount), 2),       # 평가손익
+                        round(float(purchase_amount), 2),     # 매입금액
+                        round(float(eval_amount), 2)          # 평가금액
                     ])
             
-            # 주식현황 시트 업데이트
+            # 주식현황 시트 업데이트 (시트 쓰기를 모아 한 번에 전송)
             holdings_sheet = self._get_holdings_sheet()
-            self._update_holdings_sheet(holdings_data, holdings_sheet)
-            
-            # 요약 정보 계산
-            output2 = balance.get('output2', {})
-            
-            # 매입금액합계금액 - 보유 종목의 매입금액 합계
-            total_purchase_amount = float(output2[0].get('pchs_amt_smtl_amt', 0))
-            
-            # 평가금액합계금액 - 보유 종목의 평가금액 합계
-            total_eval_amount = float(output2[0].get('evlu_amt_smtl_amt', 0))
-            
-            # 총평가손익금액 - 보유 종목의 평가손익 합계
-            total_eval_profit_loss = float(output2[0].get('evlu_pfls_smtl_amt', 0))
-            
-            # 총자산금액 - 예수금 + 평가금액
-            total_asset_amount = float(output2[0].get('tot_evlu_amt', 0))
-            
-            # 총수익률 계산
-            total_profit_rate = 0
-            if total_purchase_amount > 0:
-                total_profit_rate = round((total_eval_profit_loss / total_purchase_amount) * 100, 2)
-            
-            # 요약 정보 반올림
-            total_purchase_amount = round(total_purchase_amount, 2)
-            total_eval_amount = round(total_eval_amount, 2)
-            total_eval_profit_loss = round(total_eval_profit_loss, 2)
-            total_asset_amount = round(total_asset_amount, 2)
-            
-            # 평가손익금액은 F6, 수익률은 G6에 출력
-            self.google_sheet.update_range(f"{holdings_sheet}!F6", [[total_eval_profit_loss]])
-            self.google_sheet.update_range(f"{holdings_sheet}!G6", [[total_profit_rate]])
-            
-            # 나머지 정보는 K5:K7에 출력
-            summary_data = [
-                [total_purchase_amount],  # 매입금액합계금액
-                [total_eval_amount],      # 평가금액합계금액
-                [total_asset_amount]      # 총자산금액
-            ]
-            
-            summary_range = f"{holdings_sheet}!K5:K7"
-            self.google_sheet.update_range(summary_range, summary_data)
+            with self.google_sheet.batched_writes():
+                self._update_holdings_sheet(holdings_data, holdings_sheet)
+                
+                # 요약 정보 계산
+                output2 = balance.get('output2', {})
+                
+                # 매입금액합계금액 - 보유 종목의 매입금액 합계
+                total_purchase_amount = float(output2[0].get('pchs_amt_smtl_amt', 0))
+                
+                # 평가금액합계금액 - 보유 종목의 평가금액 합계
+                total_eval_amount = float(output2[0].get('evlu_amt_smtl_amt', 0))
+                
+                # 총평가손익금액 - 보유 종목의 평가손익 합계
+                total_eval_profit_loss = float(output2[0].get('evlu_pfls_smtl_amt', 0))
+                
+                # 총자산금액 - 예수금 + 평가금액
+                total_asset_amount = float(output2[0].get('tot_evlu_amt', 0))
+                
+                # 총수익률 계산
+                total_profit_rate = 0
+                if total_purchase_amount > 0:
+                    total_profit_rate = round((total_eval_profit_loss / total_purchase_amount) * 100, 2)
+                
+                # 요약 정보 반올림
+                total_purchase_amount = round(total_purchase_amount, 2)
+                total_eval_amount = round(total_eval_amount, 2)
+                total_eval_profit_loss = round(total_eval_profit_loss, 2)
+                total_asset_amount = round(total_asset_amount, 2)
+                
+                # 평가손익금액은 F6, 수익률은 G6에 출력
+                self.google_sheet.update_range(f"{holdings_sheet}!F6", [[total_eval_profit_loss]])
+                self.google_sheet.update_range(f"{holdings_sheet}!G6", [[total_profit_rate]])
+                
+                # 나머지 정보는 K5:K7에 출력
+                summary_data = [
+                    [total_purchase_amount],  # 매입금액합계금액
+                    [total_eval_amount],      # 평가금액합계금액
+                    [total_asset_amount]      # 총자산금액
+                ]
+                
+                summary_range = f"{holdings_sheet}!K5:K7"
+                self.google_sheet.update_range(summary_range, summary_data)
             
         except Exception as e:
             self.logger.error(f"국내 주식 현황 업데이트 실패: {str(e)}")
@@ -2103,13 +2115,11 @@ class KRTrader(BaseTrader):
                 if 'stck_bsop_date' in df_for_ma.columns:
                     df_for_ma = df_for_ma.sort_values('stck_bsop_date', ascending=True)
                 
-                # 이동평균 계산
-                ma_series = df_for_ma['stck_clpr'].astype(float).rolling(window=ma_period).mean()
-                if len(ma_series) < 1 or pd.isna(ma_series.iloc[-1]):
+                # 이동평균 계산 (마지막 구간 종가만 float64 배열로 변환해 평균)
+                ma_value = float(df_for_ma['stck_clpr'].to_numpy()[-ma_period:].astype(np.float64).mean())
+                if np.isnan(ma_value):
                     continue
                 
-                ma_value = ma_series.iloc[-1]
-                
                 # 종가가 이동평균보다 낮으면 이탈 확인
                 if close < ma_value:
                     self.logger.info(f"{stock_code} - {date} 종가({close:,.0f}원)가 {ma_period}일선({ma_value:,.0f}원) 아래로 이탈 확인")
@@ -9,7 +9,6 @@ from src.korean.kr_trader import KRTrader
 from src.overseas.us_trader import USTrader
 from src.utils.logger import setup_logger
 from src.utils.google_sheet_manager import GoogleSheetManager
-from discord_webhook import DiscordWebhook
 
 def is_korean_market_time(kr_trader = None) -> bool:
     """한국 시장 운영 시간인지 확인합니다."""
@@ -74,11 +73,11 @@ def print_trading_settings(logger, market: str, trader) -> None:
     """트레이딩 설정을 출력합니다."""
     logger.info(f"\n=== {market} 시장 매매 설정 ===")
     logger.info("=== 개별 종목 매매 조건 ===")
-    for _, row in trader.individual_stocks.iterrows():
+    for row in trader.individual_stock_records:
         logger.info(f"{row['종목명']}({row['종목코드']}): {row['매매기준']}일선 / 배분비율 {row['배분비율']}% / 매수기간 {row.get('매수시작', '제한없음')}~{row.get('매수종료', '제한없음')}")
     
     logger.info("\n=== POOL 종목 매매 조건 ===")
-    for _, row in trader.pool_stocks.iterrows():
+    for row in trader.pool_stock_records:
         logger.info(f"{row['종목명']}({row['종목코드']}): {row['매매기준']}일선 / 배분비율 {row['배분비율']}%")
     
     logger.info("\n=== 공통 매매 조건 설정값 ===")
@@ -50,6 +50,9 @@ class KISUSAPIManager:
         
         # 미국 시간대 설정
         self.us_timezone = pytz.timezone("America/New_York")
+        
+        # 연결을 재사용하는 HTTP 세션 (호출마다 TCP/TLS 연결을 새로 맺지 않음)
+        self.session = requests.Session()
     
     def _get_headers(self, tr_id: str) -> Dict:
         """API 요청에 사용할 헤더를 생성합니다.
@@ -112,7 +115,7 @@ class KISUSAPIManager:
             "SYMB": self._get_symbol(stock_code)
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         time.sleep(self.api_call_interval)
         
         if response.status_code == 200:
@@ -163,7 +166,7 @@ class KISUSAPIManager:
             "CTX_AREA_NK200": ""     # 연속조회키
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         time.sleep(self.api_call_interval)
         
         if response.status_code == 200:
@@ -200,7 +203,7 @@ class KISUSAPIManager:
             params['CTX_AREA_FK200'] = ctx_area_fk200
             params['CTX_AREA_NK200'] = ctx_area_nk200
             
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             time.sleep(self.api_call_interval)
             
             if response.status_code == 200:
@@ -253,7 +256,7 @@ class KISUSAPIManager:
                 "OVRS_ORD_UNPR": "0"  # 주문단가 0으로 설정
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             time.sleep(self.api_call_interval)
             
             if response.status_code == 200:
@@ -310,7 +313,7 @@ class KISUSAPIManager:
             "ORD_DVSN": "00"                                          # 주문구분: 지정가 주문
         }
         
-        response = requests.post(url, headers=headers, data=json.dumps(data))
+        response = self.session.post(url, headers=headers, data=json.dumps(data))
         time.sleep(self.api_call_interval)
         
         if response.status_code == 200:
@@ -377,7 +380,7 @@ class KISUSAPIManager:
             }
             
             # API 호출 후 대기
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             time.sleep(self.api_call_interval)
             
             if response.status_code == 200:
@@ -396,11 +399,9 @@ class KISUSAPIManager:
                         df['xymd'] = pd.to_datetime(df['xymd'], format='%Y%m%d')
                         df = df.sort_values('xymd', ascending=True).reset_index(drop=True)
                         
-                        # 데이터 타입 변환
-                        numeric_columns = ['clos', 'diff', 'rate', 'open', 'high', 'low', 'tvol', 'tamt', 'pbid', 'vbid', 'pask', 'vask']
-                        for col in numeric_columns:
-                            if col in df.columns:
-                                df[col] = pd.to_numeric(df[col], errors='coerce')
+                        # 데이터 타입 변환 (숫자 컬럼을 한 번에 float64로 변환, 빈 값이나 숫자가 아닌 값은 NaN)
+                        numeric_columns = [col for col in ['clos', 'diff', 'rate', 'open', 'high', 'low', 'tvol', 'tamt', 'pbid', 'vbid', 'pask', 'vask'] if col in df.columns]
+                        df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce').astype('float64')
                         
                         return df
                     else:
@@ -517,7 +518,7 @@ class KISUSAPIManager:
             }
             
             # API 요청
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             time.sleep(self.api_call_interval)
             
             # 응답 확인
@@ -614,7 +615,7 @@ class KISUSAPIManager:
                 params["CCLD_NCCS_DVSN"] = "00"  # 모의투자는 전체 조회만 가능
             
             # API 요청
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             time.sleep(self.api_call_interval)
             
             # 응답 확인
@@ -652,7 +653,7 @@ class KISUSAPIManager:
         params['CTX_AREA_FK200'] = ctx_area_fk200
         params['CTX_AREA_NK200'] = ctx_area_nk200
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         time.sleep(self.api_call_interval)
         
         if response.status_code == 200:
@@ -8,9 +8,27 @@ import pytz
 from src.common.base_trader import BaseTrader
 from src.overseas.kis_us_api import KISUSAPIManager
 from src.utils.trade_history_manager import TradeHistoryManager
+from src.utils.file_cache import FileCache
 import time
 import exchange_calendars as xcals
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from operator import itemgetter
+
+# 주식현황 보유 종목 배열 구조 (구분 컬럼은 시트 출력 시 추가)
+HOLDING_DTYPE = np.dtype([
+    ('code', 'U16'),      # 종목코드
+    ('name', 'O'),        # 종목명
+    ('price', 'f8'),      # 현재가
+    ('rate', 'f8'),       # 등락률
+    ('avg', 'f8'),        # 평단가
+    ('pnl_rt', 'f8'),     # 수익률
+    ('qty', 'i8'),        # 보유량
+    ('pnl', 'f8'),        # 평가손익
+    ('cost', 'f8'),       # 매입금액
+    ('eval', 'f8'),       # 평가금액
+])
 
 class USTrader(BaseTrader):
     """미국 주식 트레이더"""
@@ -24,9 +42,6 @@ class USTrader(BaseTrader):
         self.us_api = KISUSAPIManager(config_path)
         self.us_timezone = pytz.timezone("America/New_York")
         
-        # 마지막 API 호출 시간
-        self.last_api_call_time = 0
-        
         # 거래 내역 관리자 초기화
         self.trade_history = TradeHistoryManager("USA")
         
@@ -46,16 +61,47 @@ class USTrader(BaseTrader):
         self.exchange_rate = None
         self.exchange_rate_date = None
         
+        # 달러 환산 총자산 캐시 (종목마다 체결기준현재잔고 API를 호출하지 않도록 짧게 재사용)
+        self.total_assets_cache = None
+        self.total_assets_cache_time = 0
+        self.total_assets_cache_ttl = 30  # 캐시 유효 시간 (초)
+        
+        # 종목별 최고가 캐시 (당일 유효, 신고가는 데이터베이스에도 저장되어 재시작 시 복원)
+        self.highest_price_cache = {}
+        self.highest_price_cache_date = None
+        self.pending_highest_prices = {}  # 스탑 체크 중 갱신된 신고가 (체크가 끝나면 DB에 한 번에 저장)
+        
+        # 루프 단위 현재 시각 (미국 현지 시각, 같은 루프 안에서 재사용)
+        self.tick_now = None
+        self.tick_now_time = 0
+        self.tick_now_ttl = 60  # 재사용 가능 시간 (초, 메인 루프 주기)
+        
+        # 현재가 캐시 (종목코드 → (조회 시각, 응답)), 같은 루프 안에서 중복 조회 방지
+        self.price_cache = {}
+        self.price_cache_ttl = 1.0  # 캐시 유효 시간 (초)
+        self.report_price_max_age = 30  # 주식현황 업데이트 시 재사용할 수 있는 현재가의 최대 경과 시간 (초)
+        
+        # 당일 체결내역 인덱스 캐시 (매도매수구분코드 → 종목코드 → 체결 주문 목록)
+        self.fills_index_cache = None
+        self.fills_index_cache_time = 0
+        self.fills_index_cache_ttl = 10  # 캐시 유효 시간 (초)
+        
+        # 이동평균 계산용 종가 캐시 (종목/주기별, 당일 유효)
+        self.daily_bars_cache = {}
+        self.daily_bars_cache_date = None
+        self.ma_cache = {}  # (종목코드, 기간구분, 기간) → (전전일 MA, 전일 MA), 날짜가 바뀌면 초기화
+        # 재시작 시에도 당일 종가를 재사용하기 위한 디스크 캐시 (1일 유효)
+        self.daily_bars_file_cache = FileCache(os.path.join("data", "cache", "us_daily"), ttl=86400)
+        # 확정된 과거 일봉 종가 이력 (다음 날에는 이후 일봉만 추가 조회해 이어 붙임, 1주일 유효)
+        self.daily_history_file_cache = FileCache(os.path.join("data", "cache", "us_daily_history"), ttl=7 * 86400)
+        
+        # 장 운영 시간과 시가 매매 시간 구간 (장 시작 ~ 장 시작 후 10분), 매 루프 문자열 비교 대신 time 객체로 미리 변환
+        self.market_start_time = self._parse_hhmm(self.config['trading']['usa_market_start'])
+        self.market_end_time = self._parse_hhmm(self.config['trading']['usa_market_end'])
+        self.market_open_end_time = (datetime.combine(datetime.min, self.market_start_time) + timedelta(minutes=10)).time()
+        
         self.logger.info(f"미국 시장 시간 설정: {self.config['trading']['usa_market_start']} ~ {self.config['trading']['usa_market_end']}")
     
-    def _wait_for_api_call(self):
-        """API 호출 간격을 제어합니다."""
-        current_time = time.time()
-        elapsed = current_time - self.last_api_call_time
-        if elapsed < self.api_call_interval:
-            time.sleep(self.api_call_interval - elapsed)
-        self.last_api_call_time = time.time()
-
     def _retry_api_call(self, func, *args, **kwargs):
         """API 호출을 재시도합니다."""
         for attempt in range(self.max_retries):
@@ -66,19 +112,72 @@ class USTrader(BaseTrader):
                     return result
             except Exception as e:
                 if "초당 거래건수를 초과" in str(e):
-                    wait_time = (attempt + 1) * self.api_call_interval
+                    wait_time = self.api_call_interval * (2 ** attempt)  # 지수적 대기 시간 증가
                     self.logger.warning(f"API 호출 제한 도달. {wait_time}초 대기 후 재시도 ({attempt + 1}/{self.max_retries})")
                     time.sleep(wait_time)
                     continue
                 raise
         return None
+    
+    def _get_cached_price_data(self, stock_code: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """유효 기간 이내의 캐시된 현재가 응답을 반환합니다.
         
-    def load_settings(self) -> None:
-        """구글 스프레드시트에서 설정을 로드합니다."""
+        Args:
+            stock_code (str): 종목코드 (예: AAPL.NASD)
+            max_age (Optional[float]): 허용할 최대 경과 시간 (초, 기본값 price_cache_ttl)
+        """
+        cached = self.price_cache.get(stock_code)
+        if cached is not None and time.monotonic() - cached[0] < (self.price_cache_ttl if max_age is None else max_age):
+            return cached[1]
+        return None
+    
+    def _get_stock_price(self, stock_code: str) -> Optional[Dict]:
+        """현재가를 조회합니다. price_cache_ttl 이내에 조회한 종목은 캐시된 응답을 반환합니다.
+        
+        Args:
+            stock_code (str): 종목코드 (예: AAPL.NASD)
+            
+        Returns:
+            Optional[Dict]: 현재가 응답 (조회 실패 시 None)
+        """
+        price_data = self._get_cached_price_data(stock_code)
+        if price_data is None:
+            price_data = self._retry_api_call(self.us_api.get_stock_price, stock_code)
+            if price_data is not None:
+                self.price_cache[stock_code] = (time.monotonic(), price_data)
+        return price_data
+    
+    def _get_stock_prices(self, stock_codes: List[str], max_workers: int = 4, max_age: Optional[float] = None) -> List[Optional[Dict]]:
+        """여러 종목의 현재가를 조회합니다. 캐시에 없는 종목만 병렬로 조회합니다.
+        
+        Args:
+            stock_codes (List[str]): 종목코드 목록 (예: AAPL.NASD)
+            max_workers (int): 최대 동시 호출 수
+            max_age (Optional[float]): 캐시된 현재가를 재사용할 최대 경과 시간 (초, 기본값 price_cache_ttl)
+            
+        Returns:
+            List[Optional[Dict]]: stock_codes와 같은 순서의 현재가 응답 (조회 실패 시 None)
+        """
+        results = [self._get_cached_price_data(stock_code, max_age) for stock_code in stock_codes]
+        missing = [i for i, price_data in enumerate(results) if price_data is None]
+        
+        fetched = self._run_api_calls_concurrently(self.us_api.get_stock_price, [(stock_codes[i],) for i in missing], max_workers)
+        now = time.monotonic()
+        for i, price_data in zip(missing, fetched):
+            results[i] = price_data
+            if price_data is not None:
+                self.price_cache[stock_codes[i]] = (now, price_data)
+        return results
+        
+    def load_settings(self, force_refresh: bool = False) -> None:
+        """구글 스프레드시트에서 설정을 로드합니다.
+        
+        Args:
+            force_refresh (bool): True이면 시트 조회 캐시를 무시하고 다시 조회
+        """
         try:
-            self.settings = self.google_sheet.get_settings(market_type="USA")
-            self.individual_stocks = self.google_sheet.get_individual_stocks(market_type="USA")
-            self.pool_stocks = self.google_sheet.get_pool_stocks(market_type="USA")
+            # 설정값과 개별/POOL 종목을 한 번의 요청으로 조회
+            self.settings, self.individual_stocks, self.pool_stocks = self.google_sheet.get_market_settings(market_type="USA", force_refresh=force_refresh)
             
             # 설정값이 없는 경우 기본값 설정
             if 'stop_loss' not in self.settings:
@@ -88,16 +187,54 @@ class USTrader(BaseTrader):
             if 'trailing_stop' not in self.settings:
                 self.settings['trailing_stop'] = -3.0  # 기본값 3%
             
+            # 종목코드 조회용 인덱스 생성 및 리밸런싱 일자 파싱
+            self._build_stock_indices()
+            self._parse_rebalancing_date()
+            
             self.logger.info(f"{self.market_type} 설정을 성공적으로 로드했습니다.")
         except Exception as e:
             self.logger.error(f"{self.market_type} 설정 로드 실패: {str(e)}")
             raise
         
+    @staticmethod
+    def _to_float(value) -> float:
+        """잔고 응답 값을 float으로 변환합니다. (None, 빈 문자열, 공백 문자열은 0)"""
+        value = str(value).strip() if value is not None else ''
+        return float(value) if value else 0.0
+    
+    @staticmethod
+    def _to_int(value) -> int:
+        """잔고 응답 값을 int로 변환합니다. (None, 빈 문자열, 공백 문자열은 0)"""
+        value = str(value).strip() if value is not None else ''
+        return int(value) if value else 0
+    
+    def _normalize_holdings(self, balance: Dict) -> None:
+        """잔고의 보유 종목마다 종목코드와 '종목코드.거래소' 형식 코드를 한 번만 계산해 저장합니다.
+        
+        - stock_code_only: 거래소를 제외한 종목코드
+        - stock_code: 종목코드.거래소 (NASD, NYSE, AMEX)
+        - entry_price: 매입평균가격 (float, 값이 없으면 0)
+        - quantity: 잔고수량 (int, 값이 없으면 0)
+        - orderable_quantity: 주문가능수량 (int, 값이 없으면 0)
+        
+        종목코드별 보유 종목 조회용으로 balance['holdings_by_code'] (종목코드 → 보유 종목)도 함께 만듭니다.
+        """
+        for holding in balance.get('output1', []):
+            if 'stock_code_only' in holding:
+                continue
+            holding['stock_code_only'] = holding['ovrs_pdno'].split('.')[0]
+            holding['stock_code'] = f"{holding['stock_code_only']}.{holding.get('ovrs_excg_cd', '')}"
+            holding['entry_price'] = self._to_float(holding.get('pchs_avg_pric'))
+            holding['quantity'] = self._to_int(holding.get('ovrs_cblc_qty'))
+            holding['orderable_quantity'] = self._to_int(holding.get('ord_psbl_qty'))
+        balance['holdings_by_code'] = {holding['stock_code_only']: holding for holding in balance.get('output1', [])}
+        
     def check_market_condition(self) -> bool:
         """현재 시장 상태를 확인합니다."""
         current_time = datetime.now(self.us_timezone)
         current_date = current_time.strftime('%Y-%m-%d')
         current_time_str = current_time.strftime('%H%M')
+        current_clock = current_time.time().replace(second=0, microsecond=0)  # HHMM 단위 비교
         
         # 날짜가 변경되었으면 market_open_executed 초기화
         if self.last_market_date != current_date:
@@ -119,10 +256,10 @@ class USTrader(BaseTrader):
                     self.logger.info(f"오늘({current_date})은 미국 증시 개장일입니다.")
             
             # 장 시작 시간과 종료 시간 체크 (config 설정값 사용)
-            if not (self.config['trading']['usa_market_start'] <= current_time_str <= self.config['trading']['usa_market_end']):
+            if not (self.market_start_time <= current_clock <= self.market_end_time):
                 self.logger.info(f"현재 미국 장 운영 시간이 아닙니다. (현재시간: {current_time_str}, 장 운영시간: {self.config['trading']['usa_market_start']}~{self.config['trading']['usa_market_end']})")
                 # 장 시간이 지나면 다음날을 위해 초기화
-                if current_time_str > self.config['trading']['usa_market_end']:
+                if current_clock > self.market_end_time:
                     self.market_open_executed = False
                 return False
             else:
@@ -142,10 +279,10 @@ class USTrader(BaseTrader):
                 return False
                 
             # 장 시작 시간과 종료 시간 체크 (config 설정값 사용)
-            if not (self.config['trading']['usa_market_start'] <= current_time_str <= self.config['trading']['usa_market_end']):
+            if not (self.market_start_time <= current_clock <= self.market_end_time):
                 self.logger.info(f"현재 미국 장 운영 시간이 아닙니다. (현재시간: {current_time_str}, 장 운영시간: {self.config['trading']['usa_market_start']}~{self.config['trading']['usa_market_end']})")
                 # 장 시간이 지나면 다음날을 위해 초기화
-                if current_time_str > self.config['trading']['usa_market_end']:
+                if current_clock > self.market_end_time:
                     self.market_open_executed = False
                 return False
             else:
@@ -155,18 +292,20 @@ class USTrader(BaseTrader):
                 
             return True
     
+    def _get_tick_now(self) -> datetime:
+        """현재 루프의 미국 현지 시각을 반환합니다. tick_now_ttl 이내에는 한 번 구한 시각을 재사용합니다."""
+        if self.tick_now is None or time.monotonic() - self.tick_now_time > self.tick_now_ttl:
+            self.tick_now = datetime.now(self.us_timezone)
+            self.tick_now_time = time.monotonic()
+        return self.tick_now
+    
     def _is_market_open_time(self) -> bool:
         """시가 매수 시점인지 확인합니다."""
-        # 미국 현지 시간으로 확인
-        current_time = datetime.now(self.us_timezone).strftime('%H%M')
-        start_time = self.config['trading']['usa_market_start']
+        # 미국 현지 시간으로 확인 (execute_trade 시작 시 갱신한 루프 시각 사용, HHMM 단위 비교)
+        current_time = self._get_tick_now().time().replace(second=0, microsecond=0)
         
         # 장 시작 후 10분 이내
-        return start_time <= current_time <= str(int(start_time) + 10).zfill(4)
-        
-    def _is_market_close_time(self) -> bool:
-        """장 마감 시간인지 확인합니다."""
-        return False  # 종가 매수 로직 사용하지 않음
+        return self.market_start_time <= current_time <= self.market_open_end_time
         
     def calculate_ma(self, stock_code: str, period: int = 20, period_div_code: str = "D") -> Optional[tuple]:
         """이동평균선을 계산합니다.
@@ -180,7 +319,33 @@ class USTrader(BaseTrader):
             Optional[tuple]: (전전일/전전주 이동평균값, 전일/전주 이동평균값) 또는 None
         """
         try:
-            end_date = datetime.now(self.us_timezone).strftime("%Y%m%d")
+            # 루프 시각을 한 번만 구해 기준일과 조회 기간 계산에 재사용
+            now = self._get_tick_now()
+            end_date = now.strftime("%Y%m%d")
+            
+            # 날짜가 바뀌면 종가 캐시 초기화
+            if self.daily_bars_cache_date != end_date:
+                self.daily_bars_cache = {}
+                self.ma_cache = {}
+                self.daily_bars_cache_date = end_date
+                self.daily_bars_file_cache.clear_expired()
+            
+            # 당일 이미 계산한 이동평균은 그대로 반환 (전일까지의 종가로만 계산되므로 하루 동안 변하지 않음)
+            ma_key = (stock_code, period_div_code, period)
+            if ma_key in self.ma_cache:
+                return self.ma_cache[ma_key]
+            
+            # 당일 이미 조회한 종가 데이터가 충분하면 API 호출 없이 계산 (메모리 → 디스크 순서로 확인)
+            cache_key = (stock_code, period_div_code)
+            cached_closes = self.daily_bars_cache.get(cache_key)
+            if cached_closes is None:
+                file_closes = self.daily_bars_file_cache.get(f"{stock_code}_{period_div_code}_{end_date}")
+                if file_closes:
+                    cached_closes = np.array(file_closes, dtype=np.float64)
+                    self.daily_bars_cache[cache_key] = cached_closes
+            if cached_closes is not None and len(cached_closes) >= period + 2:
+                self.ma_cache[ma_key] = self._calculate_ma_from_closes(cached_closes, period)
+                return self.ma_cache[ma_key]
             
             # 필요한 기간을 계산
             if period_div_code == "D": # 일별 데이터
@@ -198,13 +363,13 @@ class USTrader(BaseTrader):
                 
                 # API가 주간 데이터를 특정 시점(ex: 금요일)에 집계할 수 있으므로
                 # 현재 요일에 따라 필요한 날짜를 추가 보정
-                current_weekday = datetime.now(self.us_timezone).weekday()  # 0=월요일, 6=일요일
+                current_weekday = now.weekday()  # 0=월요일, 6=일요일
                 if current_weekday < 5:  # 월~금요일인 경우
                     # 금요일까지 도달하지 않았으므로 이번 주는 아직 데이터가 없을 수 있음
                     # 한 주 더 추가 (7일)
                     required_days += 7
                 
-            start_date = (datetime.now(self.us_timezone) - timedelta(days=required_days)).strftime("%Y%m%d")
+            start_date = (now - timedelta(days=required_days)).strftime("%Y%m%d")
             
             # API 제한(100일)을 고려한 효율적인 데이터 조회
             if period_div_code == "W":
@@ -223,25 +388,19 @@ class USTrader(BaseTrader):
                         )
                         
                         if hist_data is not None and len(hist_data) >= period + 2:
-                            # DataFrame으로 변환 (이미 DataFrame인 경우 그대로 사용)
+                            # API가 날짜 오름차순, 숫자형(float64) 컬럼으로 반환하므로 추가 변환 없이 사용
                             df = hist_data if isinstance(hist_data, pd.DataFrame) else pd.DataFrame(hist_data)
-                            # 정렬
-                            df['xymd'] = pd.to_datetime(df['xymd'])
-                            df = df.sort_values('xymd', ascending=True).reset_index(drop=True)
-                            
-                            # 이동평균 계산
-                            df['clos'] = df['clos'].astype(float)
-                            ma_series = df['clos'].rolling(window=period).mean()
                             
                             # 데이터가 충분한지 확인
                             if len(df) < period + 2:
                                 self.logger.warning(f"{stock_code}: 주간 데이터 부족, 계산 불가 (현재: {len(df)}개, 필요: {period+2}개)")
                                 return None
                             
-                            # 전전주, 전주 이동평균값 반환
-                            ma_prev2 = ma_series.iloc[-3]  # 전전주
-                            ma_prev = ma_series.iloc[-2]   # 전주
-                            return (ma_prev2, ma_prev)
+                            # 종가 캐시 저장 후 전전주, 전주 이동평균값 반환
+                            closes = df['clos'].to_numpy(dtype=np.float64)
+                            self._cache_daily_closes(stock_code, period_div_code, end_date, closes)
+                            self.ma_cache[ma_key] = self._calculate_ma_from_closes(closes, period)
+                            return self.ma_cache[ma_key]
                         
                         # 데이터가 부족하면 더 긴 기간으로 재시도 (아래 코드로 진행)
                         self.logger.debug(f"{stock_code}: 주간 데이터 부족, 더 긴 기간 조회 시도 (현재: {len(hist_data) if hist_data is not None else 0}개, 필요: {period+2}개)")
@@ -252,8 +411,8 @@ class USTrader(BaseTrader):
                 try:
                     # 분할 조회를 위한 설정
                     all_data = []
-                    current_end_date = datetime.now(self.us_timezone)
-                    start_datetime = datetime.now(self.us_timezone) - timedelta(days=required_days * 2)  # 넉넉히 2배 기간으로 설정
+                    current_end_date = now
+                    start_datetime = now - timedelta(days=required_days * 2)  # 넉넉히 2배 기간으로 설정
                     
                     while current_end_date.replace(tzinfo=None) >= start_datetime.replace(tzinfo=None):
                         # 현재 조회 기간의 시작일 계산 (최대 100주에 해당하는 700일)
@@ -306,14 +465,11 @@ class USTrader(BaseTrader):
                         self.logger.warning(f"{stock_code}: 주간 데이터 부족, 계산 불가 (현재: {len(combined_df)}개, 필요: {period+2}개)")
                         return None
                     
-                    # 이동평균 계산
-                    combined_df['clos'] = combined_df['clos'].astype(float)
-                    ma_series = combined_df['clos'].rolling(window=period).mean()
-                    
-                    # 전전주, 전주 이동평균값 반환
-                    ma_prev2 = ma_series.iloc[-3]  # 전전주
-                    ma_prev = ma_series.iloc[-2]   # 전주
-                    return (ma_prev2, ma_prev)
+                    # 종가 캐시 저장 후 전전주, 전주 이동평균값 반환
+                    closes = combined_df['clos'].to_numpy(dtype=np.float64)
+                    self._cache_daily_closes(stock_code, period_div_code, end_date, closes)
+                    self.ma_cache[ma_key] = self._calculate_ma_from_closes(closes, period)
+                    return self.ma_cache[ma_key]
                     
                 except Exception as e:
                     self.logger.error(f"{stock_code}: 주간 데이터 분할 조회 중 오류 발생 - {str(e)}")
@@ -322,8 +478,8 @@ class USTrader(BaseTrader):
             else:  # 일별 데이터 처리
                 # API 제한(100일)을 고려하여 데이터 조회
                 all_data = []
-                current_end_date = datetime.now(self.us_timezone)
-                start_datetime = datetime.now(self.us_timezone) - timedelta(days=required_days)
+                current_end_date = now
+                start_datetime = now - timedelta(days=required_days)
                 
                 # 필요한 기간이 100일 이하인 경우 한 번에 조회
                 if required_days <= 100:
@@ -339,20 +495,22 @@ class USTrader(BaseTrader):
                         self.logger.warning(f"{stock_code}: 이동평균 계산을 위한 데이터가 부족합니다. (필요: {period+2}개, 실제: {len(hist_data) if hist_data is not None else 0}개)")
                         return None
                     
-                    # DataFrame으로 변환 (이미 DataFrame인 경우 그대로 사용)   
+                    # API가 날짜 오름차순, 숫자형(float64) 컬럼으로 반환하므로 추가 변환 없이 사용
                     df = hist_data if isinstance(hist_data, pd.DataFrame) else pd.DataFrame(hist_data)
-                    # 정렬
-                    df['xymd'] = pd.to_datetime(df['xymd'])
-                    df = df.sort_values('xymd', ascending=True).reset_index(drop=True)
-                    # 이동평균 계산
-                    df['clos'] = df['clos'].astype(float)
-                    ma_series = df['clos'].rolling(window=period).mean()
-                    # 전전일, 전일 이동평균값 반환
-                    ma_prev2 = ma_series.iloc[-3]  # 전전일
-                    ma_prev = ma_series.iloc[-2]   # 전일
-                    return (ma_prev2, ma_prev)
-                
-                # 필요한 기간이 100일 초과인 경우 분할 조회
+                    # 종가 캐시 저장 후 전전일, 전일 이동평균값 반환
+                    closes = df['clos'].to_numpy(dtype=np.float64)
+                    self._cache_daily_closes(stock_code, period_div_code, end_date, closes)
+                    self.ma_cache[ma_key] = self._calculate_ma_from_closes(closes, period)
+                    return self.ma_cache[ma_key]
+                
+                # 필요한 기간이 100일 초과인 경우 저장된 종가 이력에 최근 일봉만 이어 붙여 계산
+                closes = self._extend_daily_history(stock_code, end_date, period)
+                if closes is not None:
+                    self._cache_daily_closes(stock_code, period_div_code, end_date, closes)
+                    self.ma_cache[ma_key] = self._calculate_ma_from_closes(closes, period)
+                    return self.ma_cache[ma_key]
+                
+                # 저장된 이력이 없거나 이어 붙일 수 없으면 분할 조회
                 while current_end_date.replace(tzinfo=None) >= start_datetime.replace(tzinfo=None):
                     # 현재 조회 기간의 시작일 계산 (최대 100일)
                     current_start_date = current_end_date - timedelta(days=99)
@@ -405,23 +563,116 @@ class USTrader(BaseTrader):
                     self.logger.warning(f"{stock_code}: 이동평균 계산을 위한 데이터가 부족합니다. (필요: {period+2}개, 실제: {len(combined_df)}개)")
                     return None
                 
-                # 이동평균 계산
-                combined_df['clos'] = combined_df['clos'].astype(float)
-                ma_series = combined_df['clos'].rolling(window=period).mean()
-                # 전전일, 전일 이동평균값 반환
-                ma_prev2 = ma_series.iloc[-3]  # 전전일
-                ma_prev = ma_series.iloc[-2]   # 전일
-                return (ma_prev2, ma_prev)
+                # 종가 캐시와 종가 이력 저장 후 전전일, 전일 이동평균값 반환
+                closes = combined_df['clos'].to_numpy(dtype=np.float64)
+                self._cache_daily_closes(stock_code, period_div_code, end_date, closes)
+                self._save_daily_history(stock_code, combined_df['xymd'].dt.strftime('%Y%m%d').tolist(), closes, end_date)
+                self.ma_cache[ma_key] = self._calculate_ma_from_closes(closes, period)
+                return self.ma_cache[ma_key]
             
         except Exception as e:
             self.logger.error(f"{period}{period_div_code} 이동평균 계산 실패 ({stock_code}): {str(e)}")
             return None
     
+    def _cache_daily_closes(self, stock_code: str, period_div_code: str, end_date: str, closes: np.ndarray) -> None:
+        """조회한 종가 배열을 메모리와 디스크 캐시에 저장합니다.
+        
+        Args:
+            stock_code (str): 종목코드
+            period_div_code (str): 기간 구분 코드 (D: 일봉, W: 주봉)
+            end_date (str): 조회 기준일 (YYYYMMDD)
+            closes (np.ndarray): 날짜 오름차순 종가 배열
+        """
+        self.daily_bars_cache[(stock_code, period_div_code)] = closes
+        self.daily_bars_file_cache.set(f"{stock_code}_{period_div_code}_{end_date}", closes.tolist())
+    
+    def _save_daily_history(self, stock_code: str, dates: List[str], closes: np.ndarray, end_date: str) -> None:
+        """확정된 일봉 종가 이력을 디스크에 저장합니다. 기준일(당일) 일봉은 장중 값일 수 있으므로 제외합니다.
+        
+        Args:
+            stock_code (str): 종목코드
+            dates (List[str]): 날짜 오름차순 일자 목록 (YYYYMMDD)
+            closes (np.ndarray): dates와 같은 순서의 종가 배열
+            end_date (str): 조회 기준일 (YYYYMMDD)
+        """
+        completed = [(date, close) for date, close in zip(dates, closes.tolist()) if date < end_date]
+        if completed:
+            self.daily_history_file_cache.set(stock_code, {
+                'dates': [date for date, _ in completed],
+                'closes': [close for _, close in completed]
+            })
+    
+    def _extend_daily_history(self, stock_code: str, end_date: str, period: int) -> Optional[np.ndarray]:
+        """저장된 일봉 종가 이력에 마지막 저장일 이후의 일봉만 조회해 이어 붙입니다.
+        
+        100일을 넘는 기간도 분할 조회 없이 최근 일봉 한 번만 조회하면 됩니다.
+        
+        Args:
+            stock_code (str): 종목코드
+            end_date (str): 조회 기준일 (YYYYMMDD)
+            period (int): 이동평균 기간
+        
+        Returns:
+            Optional[np.ndarray]: 날짜 오름차순 종가 배열 (이력이 없거나, 중간에 빈 구간이 있거나, 겹치는 일자의 종가가
+                수정주가 반영으로 달라졌거나, 데이터가 부족하면 None)
+        """
+        history = self.daily_history_file_cache.get(stock_code)
+        if not history or not history.get('dates'):
+            return None
+        last_date = history['dates'][-1]
+        
+        hist_data = self._retry_api_call(self.us_api.get_daily_price, stock_code, last_date, end_date, "D")
+        if hist_data is None or len(hist_data) == 0:
+            return None
+        
+        new_dates = hist_data['xymd'].dt.strftime('%Y%m%d')
+        # 최근 조회 구간이 저장된 마지막 일자와 이어지지 않으면 전체를 다시 조회
+        if new_dates.iloc[0] > last_date:
+            return None
+        
+        is_new = (new_dates > last_date).to_numpy()
+        new_closes = hist_data['clos'].to_numpy(dtype=np.float64)
+        
+        # 조회한 일봉은 수정주가이므로 겹치는 일자의 종가가 저장된 값과 다르면(액면분할/배당 반영 등) 저장된 이력을 버리고 전체를 다시 조회
+        stored_closes = dict(zip(history['dates'], history['closes']))
+        overlap = [
+            (stored_closes[date], close)
+            for date, close in zip(new_dates[~is_new].tolist(), new_closes[~is_new].tolist())
+            if date in stored_closes
+        ]
+        if not overlap:
+            return None
+        stored, fetched = np.array(overlap, dtype=np.float64).T
+        if not np.allclose(stored, fetched, rtol=1e-4, atol=1e-6):
+            self.logger.info(f"{stock_code}: 저장된 종가 이력이 수정주가와 달라 전체 이력을 다시 조회합니다.")
+            return None
+        
+        dates = history['dates'] + new_dates[is_new].tolist()
+        closes = np.concatenate([
+            np.array(history['closes'], dtype=np.float64),
+            new_closes[is_new]
+        ])
+        if len(closes) < period + 2:
+            return None
+        
+        self._save_daily_history(stock_code, dates, closes, end_date)
+        return closes
+    
     def get_highest_price_since_first_buy(self, stock_code: str) -> float:
         """최초 매수일 이후부터 어제까지의 최고가를 조회합니다."""
         try:
-            # 현재 날짜 확인
-            current_date = datetime.now(self.us_timezone).strftime("%Y-%m-%d")
+            # 현재 날짜 확인 (루프 시각 재사용)
+            now = self._get_tick_now()
+            current_date = now.strftime("%Y-%m-%d")
+            
+            # 캐시가 오늘 날짜의 데이터이고, 해당 종목의 최고가가 캐시에 있으면 시세 재조회 없이 반환
+            if self.highest_price_cache_date == current_date and stock_code in self.highest_price_cache:
+                return self.highest_price_cache[stock_code]
+            
+            # 날짜가 변경되었으면 캐시 초기화
+            if self.highest_price_cache_date != current_date:
+                self.highest_price_cache = {}
+                self.highest_price_cache_date = current_date
             
             # 먼저 데이터베이스에서 저장된 최고가 확인
             db_highest_price = self.trade_history.get_highest_price(stock_code)
@@ -434,7 +685,7 @@ class USTrader(BaseTrader):
             # 최초 매수일부터 어제까지의 일별 시세 조회
             first_date = datetime.strptime(first_buy_date, "%Y-%m-%d")
             # 어제 날짜 계산 (오늘 날짜에서 하루 빼기)
-            end_date = datetime.now(self.us_timezone) - timedelta(days=1)
+            end_date = now - timedelta(days=1)
             
             # 최초 매수일이 어제보다 늦은 경우(즉, 오늘 처음 매수한 경우) 최고가는 매수가로 설정
             if first_date > end_date.replace(tzinfo=None):
@@ -474,6 +725,7 @@ class USTrader(BaseTrader):
             
             # 조회된 데이터가 없는 경우 데이터베이스에 저장된 최고가 반환
             if not all_data:
+                self.highest_price_cache[stock_code] = db_highest_price
                 return db_highest_price
             
             # 모든 데이터 합치기
@@ -495,7 +747,10 @@ class USTrader(BaseTrader):
             # 데이터베이스 최고가 업데이트
             if highest_price > db_highest_price:
                 self.trade_history.update_highest_price(stock_code, highest_price)
-                self.logger.debug(f"최고가 데이터베이스 업데이트: {stock_code}, {highest_price}")
+                self.logger.debug("최고가 데이터베이스 업데이트: %s, %s", stock_code, highest_price)
+            
+            # 캐시에 저장
+            self.highest_price_cache[stock_code] = highest_price
             
             return highest_price
             
@@ -558,7 +813,7 @@ class USTrader(BaseTrader):
                         is_above = ma_condition_prev > ma_target_prev
                         
                         if is_above:
-                            self.logger.info(f"매수 조건 충족: {stock_code}")
+                            self.logger.info("매수 조건 충족: %s", stock_code)
                             self.logger.info(f"- 전일: {condition_period}{period_unit}선(${ma_condition_prev:.2f}) > {ma_period}{period_unit}선(${ma_target_prev:.2f})")
                         
                         return is_above, ma_target_prev
@@ -570,7 +825,7 @@ class USTrader(BaseTrader):
                         golden_cross = (ma_condition_prev2 < ma_target_prev2) and (ma_condition_prev > ma_target_prev)
                         
                         if golden_cross:
-                            self.logger.info(f"골든크로스 발생: {stock_code}")
+                            self.logger.info("골든크로스 발생: %s", stock_code)
                             self.logger.info(f"- 전전{period_unit}: {condition_period}{period_unit}선(${ma_condition_prev2:.2f}) < {ma_period}{period_unit}선(${ma_target_prev2:.2f})")
                             self.logger.info(f"- 전{period_unit}: {condition_period}{period_unit}선(${ma_condition_prev:.2f}) > {ma_period}{period_unit}선(${ma_target_prev:.2f})")
                         
@@ -644,7 +899,7 @@ class USTrader(BaseTrader):
                         is_below = ma_condition_prev < ma_target_prev
                         
                         if is_below:
-                            self.logger.info(f"매도 조건 충족: {stock_code}")
+                            self.logger.info("매도 조건 충족: %s", stock_code)
                             self.logger.info(f"- 전일: {condition_period}{period_unit}선(${ma_condition_prev:.2f}) < {ma_period}{period_unit}선(${ma_target_prev:.2f})")
                         
                         return is_below, ma_target_prev
@@ -656,7 +911,7 @@ class USTrader(BaseTrader):
                         dead_cross = (ma_condition_prev2 > ma_target_prev2) and (ma_condition_prev < ma_target_prev)
                         
                         if dead_cross:
-                            self.logger.info(f"데드크로스 발생: {stock_code}")
+                            self.logger.info("데드크로스 발생: %s", stock_code)
                             self.logger.info(f"- 전전{period_unit}: {condition_period}{period_unit}선(${ma_condition_prev2:.2f}) > {ma_period}{period_unit}선(${ma_target_prev2:.2f})")
                             self.logger.info(f"- 전{period_unit}: {condition_period}{period_unit}선(${ma_condition_prev:.2f}) < {ma_period}{period_unit}선(${ma_target_prev:.2f})")
                         
@@ -681,26 +936,43 @@ class USTrader(BaseTrader):
         Returns:
             List[str]: 당일 매도한 종목 코드 목록
         """
-        sold_stocks = []
         try:
-            # 당일 체결 내역 조회
-            executed_orders = self._retry_api_call(self.us_api.get_today_executed_orders)
-            
-            if executed_orders and 'output' in executed_orders:
-                for order in executed_orders['output']:
-                    # 매도 주문만 필터링 (01: 매도)
-                    if order['sll_buy_dvsn_cd'] == '01':
-                        stock_code = order['pdno']
-                        # 체결 수량이 있는 경우만 추가
-                        if int(order['ft_ccld_qty']) > 0:
-                            if stock_code not in sold_stocks:
-                                sold_stocks.append(stock_code)
-                                self.logger.debug(f"당일 매도 종목 확인: {order['prdt_name']}({stock_code})")
-            
-            return sold_stocks
+            # 매도 주문(01) 중 체결 수량이 있는 종목만 인덱스에 포함됨
+            sold_orders = self._get_todays_fills_index().get('01', {})
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for stock_code, orders in sold_orders.items():
+                    self.logger.debug("당일 매도 종목 확인: %s(%s)", orders[0]['prdt_name'], stock_code)
+            
+            return list(sold_orders)
         except Exception as e:
             self.logger.error(f"당일 매도 종목 조회 중 오류 발생: {str(e)}")
             return []  # 오류 발생 시 빈 리스트 반환
+    
+    def _get_todays_fills_index(self) -> Dict[str, Dict[str, List[Dict]]]:
+        """당일 체결내역을 한 번에 조회하여 매도매수구분코드/종목코드별로 인덱싱합니다.
+        
+        체결내역 API는 종목코드 없이 전종목을 반환하므로, 종목마다 호출하지 않고
+        fills_index_cache_ttl 동안 인덱스를 재사용합니다.
+        
+        Returns:
+            Dict[str, Dict[str, List[Dict]]]: {매도매수구분코드(01/02): {종목코드: [체결 주문, ...]}}
+        """
+        if self.fills_index_cache is not None and time.time() - self.fills_index_cache_time < self.fills_index_cache_ttl:
+            return self.fills_index_cache
+        
+        fills_index = {'01': defaultdict(list), '02': defaultdict(list)}
+        executed_orders = self._retry_api_call(self.us_api.get_today_executed_orders)
+        
+        if executed_orders and 'output' in executed_orders:
+            for order in executed_orders['output']:
+                side_orders = fills_index.get(order['sll_buy_dvsn_cd'])
+                # 체결 수량이 있는 매도/매수 주문만 인덱스에 추가
+                if side_orders is not None and int(order['ft_ccld_qty']) > 0:
+                    side_orders[order['pdno']].append(order)
+        
+        self.fills_index_cache = {side: dict(orders) for side, orders in fills_index.items()}
+        self.fills_index_cache_time = time.time()
+        return self.fills_index_cache
         
     def get_trailing_stop_sell_price(self, stock_code: str) -> Optional[float]:
         """트레일링 스탑으로 매도된 종목의 매도 가격을 조회합니다.
@@ -770,180 +1042,148 @@ class USTrader(BaseTrader):
         2. 월/일 (예: 12/15) - 매년 해당 월일에 리밸런싱
         3. 일 (예: 15) - 매월 해당 일자에 리밸런싱
         """
-        try:
-            # 리밸런싱 일자 확인
-            rebalancing_date = self.settings.get('rebalancing_date', '')
-            if not rebalancing_date:
-                return False
-            
-            # 현재 날짜/시간 확인 (미국 시간 기준)
-            now = datetime.now(self.us_timezone)
-            
-            # 리밸런싱 일자 파싱
-            rebalancing_date_str = str(rebalancing_date).strip()
-            
-            # 구분자로 분리된 경우 (년/월/일 또는 월/일)
-            for sep in ['/', '-', '.']:
-                if sep in rebalancing_date_str:
-                    parts = rebalancing_date_str.split(sep)
-                    
-                    # 년/월/일 형식 (예: 2023/12/15)
-                    if len(parts) == 3:
-                        year, month, day = map(int, parts)
-                        if now.year == year and now.month == month and now.day == day:
-                            self.logger.info(f"리밸런싱 날짜 도달: {year}/{month}/{day}")
-                            return True
-                        return False
-                    
-                    # 월/일 형식 (예: 12/15)
-                    elif len(parts) == 2:
-                        month, day = map(int, parts)
-                        if now.month == month and now.day == day:
-                            self.logger.info(f"리밸런싱 날짜 도달: 매년 {month}/{day}")
-                            return True
-                        return False
-            
-            # 숫자만 있는 경우 (일자만 지정, 예: "15")
-            if rebalancing_date_str.isdigit():
-                day = int(rebalancing_date_str)
-                if now.day == day:
-                    self.logger.info(f"리밸런싱 날짜 도달: 매월 {day}일")
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"리밸런싱 일자 확인 중 오류 발생: {str(e)}")
-            return False
+        # 리밸런싱 일자는 load_settings에서 미리 파싱해 두고 미국 현지 날짜와 비교
+        return self._matches_rebalancing_date(self._get_tick_now())
 
     def _rebalance_portfolio(self, balance: Dict):
         """포트폴리오 리밸런싱을 실행합니다."""
         try:
             self.logger.info("포트폴리오 리밸런싱을 시작합니다.")
             
-            # 총 평가금액 계산
-            total_balance = self._retry_api_call(self.us_api.get_total_balance)
-            if total_balance is None:
+            # 달러 환산 총자산 (짧은 시간 동안 캐시된 값 재사용)
+            total_assets = self._get_cached_total_assets()
+            if total_assets is None:
                 return
-
-            # 총자산금액을 환율로 나누어 달러로 환산
-            total_assets = float(total_balance['output3']['tot_asst_amt']) / self.exchange_rate
             
-            # 보유 종목별 현재 비율 계산
-            holdings = {}
+            # 리밸런싱 대상 보유 종목 (구글 스프레드시트에 있는 종목만)
+            targets = []
             for holding in balance['output1']:
-                if int(holding.get('ord_psbl_qty', 0)) > 0:
-                    stock_code = holding['ovrs_pdno']
-                    exchange = holding.get('ovrs_excg_cd', '')  # NASD, NYSE, AMEX
-                    full_stock_code = f"{stock_code}.{exchange}"
+                if holding['orderable_quantity'] <= 0:
+                    continue
+                stock_info = self.individual_stock_map.get(holding['stock_code_only'])
+                if stock_info is None:
+                    stock_info = self.pool_stock_map.get(holding['stock_code_only'])
+                if stock_info is not None:
+                    targets.append((holding, stock_info))
+            
+            # 현재가 병렬 조회 (조회 실패 또는 현재가가 0인 종목은 제외)
+            price_results = self._get_stock_prices([holding['stock_code'] for holding, _ in targets])
+            priced_targets = [
+                (holding, stock_info, float(price_data['output']['last']))
+                for (holding, stock_info), price_data in zip(targets, price_results)
+                if price_data is not None and float(price_data['output']['last']) > 0
+            ]
+            if not priced_targets:
+                self.logger.info("리밸런싱 대상 종목이 없습니다.")
+                return
+            
+            # 보유 종목별 현재 비중과 조정 수량 계산 (벡터 연산)
+            quantities = np.array([holding['orderable_quantity'] for holding, _, _ in priced_targets], dtype=np.int64)
+            current_prices = np.array([current_price for _, _, current_price in priced_targets], dtype=np.float64)
+            target_ratios = np.array([float(stock_info['배분비율']) for _, stock_info, _ in priced_targets], dtype=np.float64)
+            current_values = quantities * current_prices
+            current_ratios = current_values / total_assets * 100
+            value_diffs = total_assets * (target_ratios / 100) - current_values
+            quantity_diffs = (value_diffs / current_prices).astype(np.int64)  # 0 방향으로 절사
+            
+            # 리밸런싱 주문 목록 생성 (조정 수량이 있는 종목만)
+            orders = []
+            for i in np.flatnonzero(quantity_diffs):
+                holding, stock_info, current_price = priced_targets[i]
+                quantity_diff = int(quantity_diffs[i])
+                info = {
+                    'name': stock_info['종목명'],
+                    'current_price': current_price,
+                    'quantity': int(quantities[i]),
+                    'current_value': float(current_values[i]),
+                    'current_ratio': float(current_ratios[i]),
+                    'target_ratio': float(target_ratios[i])
+                }
+                
+                if quantity_diff > 0:  # 매수
+                    # 매수 시 지정가의 1% 높게 설정하여 시장가처럼 거래
+                    orders.append({
+                        'stock_code': holding['stock_code'],
+                        'info': info,
+                        'order_type': "BUY",
+                        'quantity': quantity_diff,
+                        'price': current_price * 1.01,
+                        'value_diff': float(value_diffs[i])
+                    })
+                else:  # 매도
+                    # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
+                    orders.append({
+                        'stock_code': holding['stock_code'],
+                        'info': info,
+                        'order_type': "SELL",
+                        'quantity': abs(quantity_diff),
+                        'price': current_price * 0.99,
+                        'value_diff': float(value_diffs[i])
+                    })
+            
+            # 일괄 주문 API가 없으므로 주문을 병렬로 전송 (호출 간격은 _wait_for_api_call에서 유지)
+            results = self._run_api_calls_concurrently(
+                self.us_api.order_stock,
+                [(order['stock_code'], order['order_type'], order['quantity'], round(order['price'], 2)) for order in orders]
+            )
+            
+            # 주문 결과 처리
+            for order, result in zip(orders, results):
+                if not result:
+                    continue
+                
+                stock_code = order['stock_code']
+                info = order['info']
+                quantity = order['quantity']
+                value_diff = order['value_diff']
+                
+                if order['order_type'] == "BUY":
+                    msg = f"리밸런싱 매수: {info['name']}({stock_code}) {quantity}주"
+                    msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
+                    msg += f"\n- 현재가: ${info['current_price']:.2f}"
+                    msg += f"\n- 매수 금액: ${value_diff:,.2f}"
+                    self.logger.info(msg)
                     
-                    current_price_data = self._retry_api_call(self.us_api.get_stock_price, full_stock_code)
-                    if current_price_data is None:
-                        continue
-                        
-                    current_price = float(current_price_data['output']['last'])
-                    quantity = int(holding['ord_psbl_qty'])
-                    current_value = current_price * quantity
-                    current_ratio = current_value / total_assets * 100
+                    # 거래 내역 저장
+                    trade_data = {
+                        "trade_type": "REBALANCE",
+                        "trade_action": "BUY",
+                        "stock_code": stock_code,
+                        "stock_name": info['name'],
+                        "quantity": quantity,
+                        "price": order['price'],
+                        "total_amount": abs(value_diff),
+                        "reason": f"리밸런싱 매수: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
+                        "order_type": "BUY",
+                        "order_no": self._get_order_no(result)
+                    }
+                    self.trade_history.add_trade(trade_data)
                     
-                    # 개별 종목에서 찾기
-                    individual_match = self.individual_stocks[self.individual_stocks['종목코드'] == stock_code]
-                    if not individual_match.empty:
-                        stock_info = individual_match.iloc[0]
-                        target_ratio = float(stock_info['배분비율'])
-                    else:
-                        # POOL 종목에서 찾기
-                        pool_match = self.pool_stocks[self.pool_stocks['종목코드'] == stock_code]
-                        if not pool_match.empty:
-                            stock_info = pool_match.iloc[0]
-                            target_ratio = float(stock_info['배분비율'])
+                else:
+                    msg = f"리밸런싱 매도: {info['name']}({stock_code}) {quantity}주"
+                    msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
+                    msg += f"\n- 현재가: ${info['current_price']:.2f}"
+                    msg += f"\n- 매도 금액: ${abs(value_diff):,.2f}"
+                    self.logger.info(msg)
                     
-                    if stock_info is not None:
-                        holdings[full_stock_code] = {
-                            'name': stock_info['종목명'],
-                            'current_price': current_price,
-                            'quantity': quantity,
-                            'current_value': current_value,
-                            'current_ratio': current_ratio,
-                            'target_ratio': target_ratio
-                        }
-            
-            # 리밸런싱 실행
-            for stock_code, info in holdings.items():
-                ratio_diff = info['target_ratio'] - info['current_ratio']
-                
-                # 최소 리밸런싱 비율 차이 (1% 이상)
-                if abs(ratio_diff) >= 0.0:
-                    target_value = total_assets * (info['target_ratio'] / 100)
-                    value_diff = target_value - info['current_value']
-                    quantity_diff = int(value_diff / info['current_price'])
+                    # 거래 내역 저장
+                    trade_data = {
+                        "trade_type": "REBALANCE",
+                        "trade_action": "SELL",
+                        "stock_code": stock_code,
+                        "stock_name": info['name'],
+                        "quantity": quantity,
+                        "price": order['price'],
+                        "total_amount": abs(value_diff),
+                        "reason": f"리밸런싱 매도: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
+                        "order_type": "SELL",
+                        "order_no": self._get_order_no(result)
+                    }
+                    self.trade_history.add_trade(trade_data)
                     
-                    if quantity_diff > 0:  # 매수
-                        # 매수 시 지정가의 1% 높게 설정하여 시장가처럼 거래
-                        buy_price = info['current_price'] * 1.01
-                        
-                        result = self._retry_api_call(
-                            self.us_api.order_stock,
-                            stock_code,
-                            "BUY",
-                            quantity_diff,
-                            round(buy_price, 2)
-                        )
-                        if result:
-                            msg = f"리밸런싱 매수: {info['name']}({stock_code}) {quantity_diff}주"
-                            msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
-                            msg += f"\n- 현재가: ${info['current_price']:.2f}"
-                            msg += f"\n- 매수 금액: ${value_diff:,.2f}"
-                            self.logger.info(msg)
-                            
-                            # 거래 내역 저장
-                            trade_data = {
-                                "trade_type": "REBALANCE",
-                                "trade_action": "BUY",
-                                "stock_code": stock_code,
-                                "stock_name": info['name'],
-                                "quantity": quantity_diff,
-                                "price": buy_price,
-                                "total_amount": abs(value_diff),
-                                "reason": f"리밸런싱 매수: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
-                                "order_type": "BUY"
-                            }
-                            self.trade_history.add_trade(trade_data)
-                            
-                    elif quantity_diff < 0:  # 매도
-                        # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
-                        sell_price = info['current_price'] * 0.99
-                        
-                        result = self._retry_api_call(
-                            self.us_api.order_stock,
-                            stock_code,
-                            "SELL",
-                            abs(quantity_diff),
-                            round(sell_price, 2)
-                        )
-                        if result:
-                            msg = f"리밸런싱 매도: {info['name']}({stock_code}) {abs(quantity_diff)}주"
-                            msg += f"\n- 현재 비중: {info['current_ratio']:.1f}% → 목표 비중: {info['target_ratio']:.1f}%"
-                            msg += f"\n- 현재가: ${info['current_price']:.2f}"
-                            msg += f"\n- 매도 금액: ${abs(value_diff):,.2f}"
-                            self.logger.info(msg)
-                            
-                            # 거래 내역 저장
-                            trade_data = {
-                                "trade_type": "REBALANCE",
-                                "trade_action": "SELL",
-                                "stock_code": stock_code,
-                                "stock_name": info['name'],
-                                "quantity": abs(quantity_diff),
-                                "price": sell_price,
-                                "total_amount": abs(value_diff),
-                                "reason": f"리밸런싱 매도: 비중 조정 {info['current_ratio']:.1f}% → {info['target_ratio']:.1f}%",
-                                "order_type": "SELL"
-                            }
-                            self.trade_history.add_trade(trade_data)
-                            
-                            # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
-                            self.sold_stocks_cache_time = 0
+                    # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
+                    self.sold_stocks_cache_time = 0
+                    self.fills_index_cache_time = 0
             
             self.logger.info("포트폴리오 리밸런싱이 완료되었습니다.")
             
@@ -953,8 +1193,10 @@ class USTrader(BaseTrader):
     def execute_trade(self):
         """매매를 실행합니다."""
         try:
-            # 현재 날짜 및 시간 확인 (미국 시간 기준)
+            # 현재 날짜 및 시간 확인 (미국 시간 기준), 루프 시각으로 저장하여 이후 단계에서 재사용
             now = datetime.now(self.us_timezone)
+            self.tick_now = now
+            self.tick_now_time = time.monotonic()
             
             # 당일 최초 실행 여부 확인 및 초기화
             if self.execution_date != now.strftime("%Y-%m-%d"):
@@ -969,6 +1211,9 @@ class USTrader(BaseTrader):
                 self._get_exchange_rate()
             
             
+            # 루프마다 현재가 캐시를 비워 이전 루프의 시세를 사용하지 않도록 함
+            self.price_cache = {}
+            
             # 1. 스탑로스/트레일링 스탑 체크 (매 루프마다 실행)
             self._check_stop_conditions()
             
@@ -984,6 +1229,7 @@ class USTrader(BaseTrader):
                 if balance is None:
                     self.logger.error("계좌 잔고 조회 실패")
                     return
+                self._normalize_holdings(balance)
                 
                 # 3-1. 매도 조건 처리
                 self.logger.info("1. 시가 매도 실행")
@@ -998,7 +1244,12 @@ class USTrader(BaseTrader):
                 
                 # 3-3. 매수 조건 처리
                 self.logger.info("3. 시가 매수 실행")
-                self._process_buy_conditions(balance)
+                # 총자산은 매수 루프 전에 한 번만 조회하여 종목별로 재사용
+                total_assets = self._get_cached_total_assets()
+                if total_assets is None:
+                    self.logger.error("총자산 조회 실패")
+                else:
+                    self._process_buy_conditions(balance, total_assets)
                 
                 self.market_open_executed = True
                 self.logger.info("장 시작 매매 실행 완료")
@@ -1011,39 +1262,32 @@ class USTrader(BaseTrader):
     def _process_sell_conditions(self, balance: Dict):
         """매도 조건 처리"""
         try:
-            # 구글 스프레드시트에 있는 종목 코드 리스트 생성
-            sheet_stock_codes = set()
-            # 개별 종목에서 종목 코드 추가
-            for _, row in self.individual_stocks.iterrows():
-                sheet_stock_codes.add(row['종목코드'])
-            # POOL 종목에서 종목 코드 추가
-            for _, row in self.pool_stocks.iterrows():
-                sheet_stock_codes.add(row['종목코드'])
+            # 구글 스프레드시트에 있는 종목 코드 집합 (개별 + POOL)
+            sheet_stock_codes = self.individual_stock_codes | self.pool_stock_codes
             
             # 보유 종목 확인
             for holding in balance['output1']:
                 # 거래 가능 수량이 있는 경우만 처리
-                quantity = int(holding.get('ord_psbl_qty', 0))
+                quantity = holding['orderable_quantity']
                 if quantity <= 0:
                     continue
                     
-                # 거래소와 종목코드 결합
-                exchange = holding.get('ovrs_excg_cd', '')  # NASD, NYSE, AMEX
-                stock_code_only = holding['ovrs_pdno']
-                stock_code = f"{stock_code_only}.{exchange}"
+                # 종목코드 (거래소 결합 코드는 잔고 조회 시 미리 계산됨)
+                stock_code_only = holding['stock_code_only']
+                stock_code = holding['stock_code']
                 stock_name = holding['ovrs_item_name']
                 
                 # 구글 스프레드시트에서 삭제된 종목 체크
                 if stock_code_only not in sheet_stock_codes:
                     # 현재가 조회
-                    current_price_data = self._retry_api_call(self.us_api.get_stock_price, stock_code)
+                    current_price_data = self._get_stock_price(stock_code)
                     if current_price_data is None:
                         self.logger.warning(f"{stock_name}({stock_code})의 현재가를 조회할 수 없습니다.")
                         continue
                         
                     current_price = float(current_price_data['output']['last'])
                     
-                    self.logger.info(f"{stock_name}({stock_code}) - 구글 스프레드시트에서 삭제된 종목이므로 매도합니다.")
+                    self.logger.info("%s(%s) - 구글 스프레드시트에서 삭제된 종목이므로 매도합니다.", stock_name, stock_code)
                     
                     # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
                     sell_price = current_price * 0.99
@@ -1053,7 +1297,7 @@ class USTrader(BaseTrader):
                     
                     if result:
                         # 매수 평균가 가져오기
-                        avg_price = float(holding.get('pchs_avg_pric', 0))
+                        avg_price = holding['entry_price']
                         if avg_price <= 0:
                             avg_price = current_price  # 매수 평균가가 없으면 현재가 사용
                         
@@ -1079,12 +1323,14 @@ class USTrader(BaseTrader):
                             "period_div_code": "",
                             "reason": "구글 스프레드시트에서 종목이 삭제됨",
                             "profit_loss": (current_price - avg_price) * quantity,
-                            "profit_loss_pct": (current_price - avg_price) / avg_price * 100
+                            "profit_loss_pct": (current_price - avg_price) / avg_price * 100,
+                            "order_no": self._get_order_no(result)
                         }
                         self.trade_history.add_trade(trade_data)
                         
                         # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                         self.sold_stocks_cache_time = 0
+                        self.fills_index_cache_time = 0
                     continue
                 
                 # 매도 조건 확인
@@ -1093,32 +1339,30 @@ class USTrader(BaseTrader):
                 period_div_code = "D"  # 기본값
                 
                 # 개별 종목에서 찾기
-                for _, row in self.individual_stocks.iterrows():
-                    if row['종목코드'] == holding['ovrs_pdno']:
+                row = self.individual_stock_map.get(stock_code_only)
+                if row is not None:
+                    ma_period = int(row['매도기준'])
+                    ma_condition = row.get('매도조건', '종가')
+                    period_div_code = row.get('매도기준2', '일')
+                    ma_timing = row.get('매도타이밍', '데드구간')  # 매도타이밍 값 사용
+                    period_div_code = "D" if period_div_code == "일" else "W"
+                
+                # 개별 종목에서 찾지 못한 경우 POOL 종목에서 찾기
+                if ma_period == 0:
+                    row = self.pool_stock_map.get(stock_code_only)
+                    if row is not None:
                         ma_period = int(row['매도기준'])
                         ma_condition = row.get('매도조건', '종가')
-                        period_div_code = row.get('매도기준2', '일')
+                        period_div_code = row.get('매도기준2', '주')
                         ma_timing = row.get('매도타이밍', '데드구간')  # 매도타이밍 값 사용
                         period_div_code = "D" if period_div_code == "일" else "W"
-                        break
-                
-                # 개별 종목에서 찾지 못한 경우 POOL 종목에서 찾기
-                if ma_period == 0:
-                    for _, row in self.pool_stocks.iterrows():
-                        if row['종목코드'] == holding['ovrs_pdno']:
-                            ma_period = int(row['매도기준'])
-                            ma_condition = row.get('매도조건', '종가')
-                            period_div_code = row.get('매도기준2', '주')
-                            ma_timing = row.get('매도타이밍', '데드구간')  # 매도타이밍 값 사용
-                            period_div_code = "D" if period_div_code == "일" else "W"
-                            break
                 
                 if ma_period == 0:
                     self.logger.warning(f"{stock_name}({stock_code})의 매도기준을 찾을 수 없습니다.")
                     continue
                 
                 # 현재가 조회
-                current_price_data = self._retry_api_call(self.us_api.get_stock_price, stock_code)
+                current_price_data = self._get_stock_price(stock_code)
                 if current_price_data is None:
                     self.logger.warning(f"{stock_name}({stock_code})의 현재가를 조회할 수 없습니다.")
                     continue
@@ -1169,7 +1413,7 @@ class USTrader(BaseTrader):
                         msg += f"\n- 매도 금액: ${current_price * quantity:,.2f} (현재가 ${current_price:.2f})"
                         
                         # 매수 평균가 가져오기
-                        avg_price = float(holding.get('pchs_avg_pric', 0))
+                        avg_price = holding['entry_price']
                         if avg_price <= 0:
                             avg_price = prev_close  # 매수 평균가가 없으면 전일 종가 사용
                             
@@ -1204,111 +1448,226 @@ class USTrader(BaseTrader):
                             "period_div_code": period_div_code,
                             "reason": reason,
                             "profit_loss": (current_price - avg_price) * quantity,
-                            "profit_loss_pct": (current_price - avg_price) / avg_price * 100
+                            "profit_loss_pct": (current_price - avg_price) / avg_price * 100,
+                            "order_no": self._get_order_no(result)
                         }
                         self.trade_history.add_trade(trade_data)
                         
                         # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                         self.sold_stocks_cache_time = 0
+                        self.fills_index_cache_time = 0
         
         except Exception as e:
             self.logger.error(f"매도 조건 처리 중 오류 발생: {str(e)}")
     
-    def _process_buy_conditions(self, balance: Dict):
-        """매수 조건을 체크하고 실행합니다."""
+    def _process_buy_conditions(self, balance: Dict, total_assets: float):
+        """매수 조건을 체크하고 실행합니다.
+        
+        Args:
+            balance (Dict): 계좌 잔고 정보
+            total_assets (float): 달러 환산 총자산
+        """
         try:
+            # 최대 보유 종목 수 체크용 보유 종목 수 (개별 종목과 POOL 종목 각각) - 루프 전에 한 번만 계산
+            total_individual_holdings = 0
+            total_pool_holdings = 0
+            for holding in balance['output1']:
+                if holding['orderable_quantity'] <= 0:
+                    continue
+                stock_code_only = holding['stock_code_only']
+                if stock_code_only in self.individual_stock_codes:
+                    total_individual_holdings += 1
+                if stock_code_only in self.pool_stock_codes:
+                    total_pool_holdings += 1
+            
+            # 보유하지 않은 매수 후보 종목의 현재가를 병렬로 미리 조회
+            candidate_codes = list(dict.fromkeys(
+                f"{row['종목코드']}.{row['거래소']}"
+                for row in self.individual_stock_records + self.pool_stock_records
+                if row['거래소'] != "KOR" and row['종목코드'] not in balance['holdings_by_code']
+            ))
+            price_results = self._get_stock_prices(candidate_codes)
+            prices = dict(zip(candidate_codes, price_results))
+            
+            # 현재가를 조회한 매수 후보 종목의 이동평균을 병렬로 미리 계산하고, 매수 신호를 한 번에 판정
+            ma_rows = [
+                row for row in self.individual_stock_records + self.pool_stock_records
+                if row['거래소'] != "KOR" and prices.get(f"{row['종목코드']}.{row['거래소']}") is not None
+                and not self.is_sold_today(row['종목코드'])
+            ]
+            self._prefetch_moving_averages(ma_rows)
+            buy_signals = self._evaluate_buy_signals(ma_rows, prices)
+            
             # 개별 종목 매수
-            for _, row in self.individual_stocks.iterrows():
+            for row in self.individual_stock_records:
                 if row['거래소'] != "KOR":  # 미국 주식만 처리
-                    self._process_single_stock_buy(row, balance)
+                    self._process_single_stock_buy(row, balance, total_assets, total_individual_holdings, total_pool_holdings, prices, buy_signals)
             
             # POOL 종목 매수
-            for _, row in self.pool_stocks.iterrows():
+            for row in self.pool_stock_records:
                 if row['거래소'] != "KOR":  # 미국 주식만 처리
-                    self._process_single_stock_buy(row, balance)
+                    self._process_single_stock_buy(row, balance, total_assets, total_individual_holdings, total_pool_holdings, prices, buy_signals)
         
         except Exception as e:
             self.logger.error(f"매수 조건 체크 중 오류 발생: {str(e)}")
     
-    def _process_single_stock_buy(self, row: pd.Series, balance: Dict):
-        """단일 종목의 매수를 처리합니다."""
-        try:
-            # 거래소와 종목코드 결합
+    def _get_buy_ma_params(self, row: Dict) -> tuple:
+        """종목 설정 행에서 매수 판단에 쓰는 이동평균 설정을 읽습니다.
+        
+        Args:
+            row (Dict): 종목 설정 행
+            
+        Returns:
+            tuple: (매수기준 기간, 매수조건, 매수타이밍, 기간 구분 코드(D/W))
+        """
+        stock_code_only = row['종목코드']
+        ma_period = int(row['매수기준']) if row['매수기준'] and str(row['매수기준']).strip() != '' else 20
+        ma_condition = row.get('매수조건', '종가')  # 기본값은 '종가'
+        ma_timing = row.get('매수타이밍', '골든구간')  # 기본값은 '골든구간'
+        
+        # 매수기준2의 값에 따라 일봉/주봉 결정 (개별 종목은 일봉, POOL 종목은 주봉이 기본)
+        if stock_code_only in self.individual_stock_codes:
+            match = self.individual_stock_map.get(stock_code_only)
+            default_div = '일'
+        else:
+            match = self.pool_stock_map.get(stock_code_only)
+            default_div = '주'
+        period_div_code_raw = match.get('매수기준2', default_div) if match is not None else default_div
+        period_div_code = "D" if period_div_code_raw == "일" else "W"
+        
+        return ma_period, ma_condition, ma_timing, period_div_code
+    
+    def _prefetch_moving_averages(self, rows: List[Dict]) -> None:
+        """매수 후보 종목들의 이동평균을 병렬로 미리 계산하여 캐시에 저장합니다.
+        
+        종목별 매수 처리에서 check_buy_condition이 호출될 때는 캐시된 값만 조회하므로
+        종목마다 순차적으로 시세를 조회하지 않습니다.
+        
+        Args:
+            rows (List[Dict]): 매수 후보 종목 설정 행 목록
+        """
+        ma_requests = set()
+        for row in rows:
             stock_code = f"{row['종목코드']}.{row['거래소']}"
-            ma_period = int(row['매수기준']) if row['매수기준'] and str(row['매수기준']).strip() != '' else 20
-            ma_condition = row.get('매수조건', '종가')  # 기본값은 '종가'
-            ma_timing = row.get('매수타이밍', '골든구간')  # 기본값은 '골든구간'
-            allocation_ratio = float(row['배분비율']) / 100 if row['배분비율'] and str(row['배분비율']).strip() != '' else 0.1
+            ma_period, ma_condition, _, period_div_code = self._get_buy_ma_params(row)
+            ma_requests.add((stock_code, ma_period, period_div_code))
+            if ma_condition != "종가" and str(ma_condition).strip().isdigit():
+                ma_requests.add((stock_code, int(ma_condition), period_div_code))
+        
+        if not ma_requests:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(ma_requests))) as executor:
+            futures = [executor.submit(self.calculate_ma, *ma_request) for ma_request in ma_requests]
+        for ma_request, future in zip(ma_requests, futures):
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"이동평균 병렬 계산 실패 ({ma_request[0]}): {str(e)}")
+    
+    def _evaluate_buy_signals(self, rows: List[Dict], prices: Dict) -> Dict[tuple, tuple]:
+        """미리 계산한 이동평균으로 매수 후보 종목들의 매수 신호를 한 번에 판정합니다.
+        
+        check_buy_condition과 같은 기준(종가/골든구간/골든크로스)을 종목별 분기 없이 배열 비교로 계산합니다.
+        이동평균이 없거나 매수조건/매수타이밍 값이 지원되지 않는 종목은 결과에서 제외되어
+        종목별 처리 시 check_buy_condition으로 판정합니다.
+        
+        Args:
+            rows (List[Dict]): 매수 후보 종목 설정 행 목록
+            prices (Dict): 종목별 현재가 응답 (종목코드.거래소 → 응답)
             
-            # 종목 유형에 따라 일간/주간 데이터 사용
-            is_individual = any(s['종목코드'] == stock_code.split('.')[0] for _, s in self.individual_stocks.iterrows())
+        Returns:
+            Dict[tuple, tuple]: {(종목코드.거래소, 매수기준, 매수조건, 매수타이밍, 기간 구분 코드): (매수 조건 충족 여부, 전봉 기준 이동평균)}
+        """
+        signal_keys = []
+        modes = []  # 0: 종가, 1: 골든구간, 2: 골든크로스
+        values = []  # (전일 종가, 기준선 전전봉, 기준선 전봉, 조건선 전전봉, 조건선 전봉)
+        for row in rows:
+            stock_code = f"{row['종목코드']}.{row['거래소']}"
+            price_data = prices.get(stock_code)
+            if price_data is None:
+                continue
+            ma_period, ma_condition, ma_timing, period_div_code = self._get_buy_ma_params(row)
+            ma_target_values = self.calculate_ma(stock_code, ma_period, period_div_code)
+            if ma_target_values is None:
+                continue
             
-            # 매수기준2의 값에 따라 일봉/주봉 결정 - 함수 상단에서 한번만 결정
-            if is_individual:
-                # 개별 종목인 경우 해당 종목 찾기
-                individual_match = self.individual_stocks[self.individual_stocks['종목코드'] == stock_code.split('.')[0]]
-                if not individual_match.empty:
-                    period_div_code_raw = individual_match.iloc[0].get('매수기준2', '일')
-                    period_div_code = "D" if period_div_code_raw == "일" else "W"
-                    period_unit = "일" if period_div_code == "D" else "주"
-                else:
-                    period_div_code = "D"  # 찾지 못한 경우 기본값
-                    period_unit = "일"
+            if ma_condition == "종가":
+                mode, ma_condition_values = 0, (np.nan, np.nan)
+            elif str(ma_condition).strip().isdigit() and ma_timing in ("골든구간", "골든크로스"):
+                ma_condition_values = self.calculate_ma(stock_code, int(ma_condition), period_div_code)
+                if ma_condition_values is None:
+                    continue
+                mode = 1 if ma_timing == "골든구간" else 2
             else:
-                # POOL 종목인 경우 해당 종목 찾기
-                pool_match = self.pool_stocks[self.pool_stocks['종목코드'] == stock_code.split('.')[0]]
-                if not pool_match.empty:
-                    period_div_code_raw = pool_match.iloc[0].get('매수기준2', '주')
-                    period_div_code = "D" if period_div_code_raw == "일" else "W"
-                    period_unit = "일" if period_div_code == "D" else "주"
-                else:
-                    period_div_code = "W"  # 찾지 못한 경우 기본값 (POOL은 주간이 기본)
-                    period_unit = "주"
+                continue
             
-            # 현재가 조회 (재시도 로직 적용)
-            current_price_data = self._retry_api_call(self.us_api.get_stock_price, stock_code)
-            if current_price_data is None:
-                return
+            signal_keys.append((stock_code, ma_period, ma_condition, ma_timing, period_div_code))
+            modes.append(mode)
+            values.append((float(price_data['output']['base']), *ma_target_values, *ma_condition_values))
+        
+        if not signal_keys:
+            return {}
+        
+        modes = np.array(modes)
+        prev_close, target_prev2, target_prev, condition_prev2, condition_prev = np.array(values, dtype=np.float64).T
+        is_above = condition_prev > target_prev
+        should_buy = np.where(
+            modes == 0, prev_close > target_prev,
+            np.where(modes == 1, is_above, (condition_prev2 < target_prev2) & is_above)
+        )
+        return {key: (bool(buy), float(ma)) for key, buy, ma in zip(signal_keys, should_buy, target_prev)}
+    
+    def _process_single_stock_buy(self, row: Dict, balance: Dict, total_assets: float, total_individual_holdings: int, total_pool_holdings: int, prices: Optional[Dict] = None, buy_signals: Optional[Dict] = None):
+        """단일 종목의 매수를 처리합니다.
+        
+        Args:
+            row (Dict): 종목 설정 행
+            balance (Dict): 계좌 잔고 정보
+            total_assets (float): 달러 환산 총자산
+            total_individual_holdings (int): 현재 보유 중인 개별 종목 수
+            total_pool_holdings (int): 현재 보유 중인 POOL 종목 수
+            prices (Optional[Dict]): 미리 조회한 종목별 현재가 응답 (종목코드.거래소 → 응답)
+            buy_signals (Optional[Dict]): _evaluate_buy_signals로 미리 판정한 매수 신호
+        """
+        try:
+            # 거래소와 종목코드 결합
+            stock_code_only = row['종목코드']
+            stock_code = f"{stock_code_only}.{row['거래소']}"
+            ma_period, ma_condition, ma_timing, period_div_code = self._get_buy_ma_params(row)
+            period_unit = "일" if period_div_code == "D" else "주"
+            allocation_ratio = float(row['배분비율']) / 100 if row['배분비율'] and str(row['배분비율']).strip() != '' else 0.1
             
-            current_price = float(current_price_data['output']['last'])
-            prev_close = float(current_price_data['output']['base'])
+            # 종목 유형 (개별/POOL)
+            is_individual = stock_code_only in self.individual_stock_codes
             
-            # 보유 종목 확인
-            holdings = [h for h in balance['output1'] if h['ovrs_pdno'] == stock_code.split('.')[0]]
-            is_holding = len(holdings) > 0
+            # 보유 종목 확인 (보유 중이면 현재가 조회 없이 종료)
+            is_holding = stock_code_only in balance['holdings_by_code']
             
             # 장 시작 시 매수 처리
             if is_holding:
                 return
             
-            # 당일 매도한 종목은 스킵
-            sold_stocks = self.get_today_sold_stocks()
-            if stock_code.split('.')[0] in sold_stocks:
-                self.logger.info(f"{row['종목명']}({stock_code}) - 당일 매도 종목 재매수 제한")
+            # 현재가 조회 (미리 조회한 값이 없으면 재시도 로직 적용하여 조회)
+            current_price_data = prices.get(stock_code) if prices else None
+            if current_price_data is None:
+                current_price_data = self._get_stock_price(stock_code)
+            if current_price_data is None:
                 return
             
-            # 매수 가능 금액 API로 환율 정보 조회
-            buyable_data = self._retry_api_call(self.us_api.get_psbl_amt, stock_code)
-            if buyable_data is None:
-                return
-                
-            # 총자산 계산 - 저장된 환율 정보 사용
-            total_balance = self._retry_api_call(self.us_api.get_total_balance)
-            if total_balance is None:
+            current_price = float(current_price_data['output']['last'])
+            prev_close = float(current_price_data['output']['base'])
+            
+            # 당일 매도한 종목은 스킵
+            if self.is_sold_today(stock_code_only):
+                self.logger.info(f"{row['종목명']}({stock_code}) - 당일 매도 종목 재매수 제한")
                 return
-                
-            # 클래스 변수에 저장된 환율 정보 사용 (만약 없다면 매수 가능 금액 API 환율로 대체)
-            if self.exchange_rate is None:
-                self.exchange_rate = float(buyable_data['output']['exrt'])
-                self.logger.info(f"저장된 환율 정보가 없어 현재 조회한 환율 사용: ${1:.2f} = ₩{self.exchange_rate:.2f}")
-                
-            total_assets = float(total_balance['output3']['tot_asst_amt']) / self.exchange_rate
             
             # 트레일링 스탑으로 매도된 종목 체크
-            trailing_stop_price = self.get_trailing_stop_sell_price(stock_code.split('.')[0])
+            trailing_stop_price = self.get_trailing_stop_sell_price(stock_code_only)
             if trailing_stop_price is not None:
                 # 마지막 TS 매도 날짜 조회
-                ts_sell_date = self.trade_history.get_last_ts_sell_date(stock_code.split('.')[0])
+                ts_sell_date = self.trade_history.get_last_ts_sell_date(stock_code_only)
                 if ts_sell_date is None:
                     self.logger.error(f"{row['종목명']}({stock_code}) - TS 매도 날짜 조회 실패")
                     return
@@ -1352,25 +1711,27 @@ class USTrader(BaseTrader):
                             )
                             
                             if result:
+                                order_amount = buy_quantity * current_price
                                 msg = f"매수 주문 실행: {row['종목명']}({stock_code}) {buy_quantity}주"
                                 msg += f"\n- 매수 사유: 트레일링 스탑 매도 후 재매수 ({price_period} 종가 > TS 매도가)"
-                                msg += f"\n- 매수 금액: ${buy_quantity * current_price:.2f}"
+                                msg += f"\n- 매수 금액: ${order_amount:.2f}"
                                 self.logger.info(msg)
                                 
                                 # 거래 내역 저장
                                 trade_data = {
                                     "trade_type": "BUY",
                                     "trade_action": "BUY",
-                                    "stock_code": stock_code.split('.')[0],
+                                    "stock_code": stock_code_only,
                                     "stock_name": row['종목명'],
                                     "quantity": buy_quantity,
                                     "price": current_price,
-                                    "total_amount": buy_quantity * current_price,
+                                    "total_amount": order_amount,
                                     "ma_period": ma_period,
                                     "ma_value": ma_value,
                                     "ma_condition": "트레일링스탑매도후재매수",
                                     "period_div_code": period_div_code,
-                                    "reason": f"TS 매도 후 재매수: {price_period} 종가 ${prev_close:.2f} > TS 매도가 ${trailing_stop_price:.2f}"
+                                    "reason": f"TS 매도 후 재매수: {price_period} 종가 ${prev_close:.2f} > TS 매도가 ${trailing_stop_price:.2f}",
+                                    "order_no": self._get_order_no(result)
                                 }
                                 self.trade_history.add_trade(trade_data)
                             
@@ -1392,7 +1753,7 @@ class USTrader(BaseTrader):
                     self.logger.info(f"{row['종목명']}({stock_code}) - 현재 {ma_period}{period_unit}선 아래에 있음, 매수 조건에 따라 결정")
 
             # 정상 매도된 종목 체크 (정상매도된 종목 재매수 조건)
-            last_normal_sell_price = self.get_last_normal_sell_price(stock_code.split('.')[0])
+            last_normal_sell_price = self.get_last_normal_sell_price(stock_code_only)
             if last_normal_sell_price is not None:
                 # 매수 조건 체크를 통해 정확한 이평선 값 얻기
                 should_buy, ma_value = self.check_buy_condition(stock_code, ma_period, prev_close, ma_condition, period_div_code, ma_timing)
@@ -1427,25 +1788,27 @@ class USTrader(BaseTrader):
                             )
                             
                             if result:
+                                order_amount = buy_quantity * current_price
                                 msg = f"매수 주문 실행: {row['종목명']}({stock_code}) {buy_quantity}주"
                                 msg += f"\n- 매수 사유: 정상 매도 후 재매수 ({price_period} 종가 > 이평선 && {price_period} 종가 > 정상 매도가)"
-                                msg += f"\n- 매수 금액: ${buy_quantity * current_price:.2f}"
+                                msg += f"\n- 매수 금액: ${order_amount:.2f}"
                                 self.logger.info(msg)
                                 
                                 # 거래 내역 저장
                                 trade_data = {
                                     "trade_type": "BUY",
                                     "trade_action": "BUY",
-                                    "stock_code": stock_code.split('.')[0],
+                                    "stock_code": stock_code_only,
                                     "stock_name": row['종목명'],
                                     "quantity": buy_quantity,
                                     "price": current_price,
-                                    "total_amount": buy_quantity * current_price,
+                                    "total_amount": order_amount,
                                     "ma_period": ma_period,
                                     "ma_value": ma_value,
                                     "ma_condition": "정상매도후재매수",
                                     "period_div_code": period_div_code,
-                                    "reason": f"정상 매도 후 재매수 조건 충족 ({price_period} 종가 ${prev_close:.2f} > MA {ma_period}{period_unit} ${ma_value:.2f} && {price_period} 종가 > 정상 매도가 ${last_normal_sell_price:.2f})"
+                                    "reason": f"정상 매도 후 재매수 조건 충족 ({price_period} 종가 ${prev_close:.2f} > MA {ma_period}{period_unit} ${ma_value:.2f} && {price_period} 종가 > 정상 매도가 ${last_normal_sell_price:.2f})",
+                                    "order_no": self._get_order_no(result)
                                 }
                                 self.trade_history.add_trade(trade_data)
                             
@@ -1454,13 +1817,16 @@ class USTrader(BaseTrader):
                         else:
                             self.logger.info(f"{row['종목명']}({stock_code}) - 추가 매수 수량이 0 또는 음수")
             
-            # 매수 조건 체크
-            should_buy, ma = self.check_buy_condition(stock_code, ma_period, prev_close, ma_condition, period_div_code, ma_timing)
+            # 매수 조건 체크 (미리 판정한 신호가 없으면 종목별로 판정)
+            buy_signal = buy_signals.get((stock_code, ma_period, ma_condition, ma_timing, period_div_code)) if buy_signals else None
+            if buy_signal is not None:
+                should_buy, ma = buy_signal
+            else:
+                should_buy, ma = self.check_buy_condition(stock_code, ma_period, prev_close, ma_condition, period_div_code, ma_timing)
             
             if should_buy and ma is not None:
                 # 당일 매도 종목 체크
-                sold_stocks = self.get_today_sold_stocks()
-                if stock_code.split('.')[0] in sold_stocks:
+                if self.is_sold_today(stock_code_only):
                     msg = f"당일 매도 종목 재매수 제한 - {row['종목명']}({stock_code})"
                     self.logger.info(msg)
                     return
@@ -1481,9 +1847,6 @@ class USTrader(BaseTrader):
                 self.logger.info(buy_msg)
                 
                 # 최대 보유 종목 수 체크 (개별 종목과 POOL 종목 각각 체크)
-                total_individual_holdings = len([h for h in balance['output1'] if int(h.get('ord_psbl_qty', 0)) > 0 and any(s['종목코드'] == h['ovrs_pdno'].split('.')[0] for _, s in self.individual_stocks.iterrows())])
-                total_pool_holdings = len([h for h in balance['output1'] if int(h.get('ord_psbl_qty', 0)) > 0 and any(s['종목코드'] == h['ovrs_pdno'].split('.')[0] for _, s in self.pool_stocks.iterrows())])
-                
                 # 현재 종목이 개별 종목인지 POOL 종목인지 확인
                 max_stocks = self.settings['max_individual_stocks'] if is_individual else self.settings['max_pool_stocks']
                 current_holdings = total_individual_holdings if is_individual else total_pool_holdings
@@ -1493,9 +1856,6 @@ class USTrader(BaseTrader):
                     self.logger.info(msg)
                     return
                 
-                # 주문가능금액은 상단에서 이미 얻은 buyable_data 재사용
-                available_cash = float(buyable_data['output']['frcr_ord_psbl_amt1'])     #주문가능금액 - 외화인경우 "ord_psbl_frcr_amt" / 통합증거금 "frcr_ord_psbl_amt1"
-                
                 # 매수 금액 계산 (총자산 * 배분비율)
                 buy_amount = total_assets * allocation_ratio
                 total_quantity = int(buy_amount / current_price)
@@ -1506,6 +1866,12 @@ class USTrader(BaseTrader):
                     self.logger.info(msg)
                     return
                 
+                # 매수 가능 금액 조회 (매수 수량이 확정된 경우에만 조회)
+                buyable_data = self._retry_api_call(self.us_api.get_psbl_amt, stock_code)
+                if buyable_data is None:
+                    return
+                available_cash = float(buyable_data['output']['frcr_ord_psbl_amt1'])     #주문가능금액 - 외화인경우 "ord_psbl_frcr_amt" / 통합증거금 "frcr_ord_psbl_amt1"
+                
                 # 현금 부족 시 POOL 종목 매도 로직
                 required_cash = total_quantity * current_price
                 
@@ -1516,22 +1882,20 @@ class USTrader(BaseTrader):
                     # POOL 종목 보유 현황 확인
                     pool_holdings = []
                     for holding in balance['output1']:
-                        if int(holding.get('ord_psbl_qty', 0)) > 0:
-                            stock_code_only = holding['ovrs_pdno']
+                        if holding['orderable_quantity'] > 0:
                             # POOL 종목인지 확인
-                            pool_match = self.pool_stocks[self.pool_stocks['종목코드'] == stock_code_only]
-                            if not pool_match.empty:
+                            if holding['stock_code_only'] in self.pool_stock_codes:
                                 # 현재가 조회
-                                exchange = holding.get('ovrs_excg_cd', '')
-                                full_code = f"{stock_code_only}.{exchange}"
-                                price_data = self._retry_api_call(self.us_api.get_stock_price, full_code)
+                                full_code = holding['stock_code']
+                                price_data = self._get_stock_price(full_code)
                                 if price_data is not None:
                                     current_price_pool = float(price_data['output']['last'])
-                                    quantity_pool = int(holding['ord_psbl_qty'])
+                                    quantity_pool = holding['orderable_quantity']
                                     value = current_price_pool * quantity_pool
                                     
                                     pool_holdings.append({
                                         'code': full_code,
+                                        'code_only': holding['stock_code_only'],
                                         'name': holding['ovrs_item_name'],
                                         'quantity': quantity_pool,
                                         'price': current_price_pool,
@@ -1539,33 +1903,31 @@ class USTrader(BaseTrader):
                                     })
                     
                     # 구글 스프레드시트 순서의 역순으로 정렬 (마지막에 추가된 종목부터 매도)
-                    pool_codes = self.pool_stocks['종목코드'].tolist()
-                    pool_holdings.sort(key=lambda x: pool_codes.index(x['code'].split('.')[0]) if x['code'].split('.')[0] in pool_codes else float('inf'), reverse=True)
+                    pool_holdings.sort(key=lambda x: self.pool_stock_order.get(x['code_only'], float('inf')), reverse=True)
                     
                     cash_to_secure = required_cash - available_cash
                     secured_cash = 0
                     sold_stocks = []
                     
-                    # 필요한 현금을 확보할 때까지 POOL 종목 매도
+                    # 필요한 현금을 확보할 때까지 매도할 POOL 종목을 먼저 선정
+                    sell_plan = []
+                    planned_cash = 0
                     for pool_stock in pool_holdings:
-                        if secured_cash >= cash_to_secure:
+                        if planned_cash >= cash_to_secure:
                             break
-                            
+                        sell_plan.append(pool_stock)
+                        planned_cash += pool_stock['quantity'] * pool_stock['price']
+                    
+                    # 매도 주문 병렬 실행 (매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래)
+                    sell_results = self._run_api_calls_concurrently(
+                        self.us_api.order_stock,
+                        [(pool_stock['code'], "SELL", pool_stock['quantity'], round(pool_stock['price'] * 0.99, 2)) for pool_stock in sell_plan]
+                    )
+                    
+                    for pool_stock, result in zip(sell_plan, sell_results):
                         sell_quantity = pool_stock['quantity']
                         expected_cash = sell_quantity * pool_stock['price']
                         
-                        # 매도 시 지정가의 1% 낮게 설정하여 시장가처럼 거래
-                        sell_price = pool_stock['price'] * 0.99
-                        
-                        # 매도 주문 실행
-                        result = self._retry_api_call(
-                            self.us_api.order_stock,
-                            pool_stock['code'],
-                            "SELL",
-                            sell_quantity,
-                            round(sell_price, 2)
-                        )
-                        
                         if result:
                             secured_cash += expected_cash
                             sold_stocks.append(f"{pool_stock['name']}({pool_stock['code']}) {sell_quantity}주 (${expected_cash:.2f})")
@@ -1580,12 +1942,15 @@ class USTrader(BaseTrader):
                                 "quantity": sell_quantity,
                                 "price": pool_stock['price'],
                                 "total_amount": expected_cash,
-                                "reason": f"현금 확보 매도: 개별 종목 {row['종목명']} 매수 자금 확보를 위한 POOL 종목 매도"
+                                "reason": f"현금 확보 매도: 개별 종목 {row['종목명']} 매수 자금 확보를 위한 POOL 종목 매도",
+                                "order_no": self._get_order_no(result)
                             }
                             self.trade_history.add_trade(trade_data)
-                            
-                            # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
-                            self.sold_stocks_cache_time = 0
+                    
+                    if sold_stocks:
+                        # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
+                        self.sold_stocks_cache_time = 0
+                        self.fills_index_cache_time = 0
                     
                     if secured_cash >= cash_to_secure:
                         self.logger.info(f"현금 확보 성공: ${secured_cash:.2f} (필요 금액: ${cash_to_secure:.2f})")
@@ -1595,7 +1960,7 @@ class USTrader(BaseTrader):
                         self.logger.info("매도 주문 체결 대기 중... (5초)")
                         time.sleep(5)  # 매도 주문 체결을 위해 5초 대기
                         
-                        # 주문가능금액 다시 확인 (POOL 종목 매도 후 갱신 필요)
+                        # 주문가능금액 다시 확인 (접수된 매도 주문이 모두 체결되었다고 보장할 수 없으므로 예상 매도 금액 대신 실제 금액 사용)
                         buyable_data = self._retry_api_call(self.us_api.get_psbl_amt, stock_code)
                         if buyable_data is None:
                             return
@@ -1630,6 +1995,7 @@ class USTrader(BaseTrader):
                 )
                 
                 if result:
+                    order_amount = buy_quantity * current_price
                     msg = f"매수 주문 실행: {row['종목명']}({stock_code}) {buy_quantity}주"
                     period_unit = "일" if period_div_code == "D" else "주"
                     # 매수 사유 메시지 수정 - 골든크로스와 골든구간을 구분
@@ -1641,7 +2007,7 @@ class USTrader(BaseTrader):
                         msg += f"\n- 매수 사유: 골든구간 진입 ({ma_condition}{period_unit}선이 {ma_period}{period_unit}선보다 높음)"
                     else:
                         msg += f"\n- 매수 사유: 이동평균 조건 충족"
-                    msg += f"\n- 매수 금액: ${buy_quantity * current_price:.2f}"
+                    msg += f"\n- 매수 금액: ${order_amount:.2f}"
                     msg += f"\n- 배분 비율: {allocation_ratio*100:.1f}%"
                     self.logger.info(msg)
                     
@@ -1670,13 +2036,14 @@ class USTrader(BaseTrader):
                         "stock_name": row['종목명'],
                         "quantity": buy_quantity,
                         "price": current_price,
-                        "total_amount": buy_quantity * current_price,
+                        "total_amount": order_amount,
                         "ma_period": ma_period,
                         "ma_value": ma,
                         "ma_condition": ma_condition,
                         "period_div_code": period_div_code,
                         "reason": reason,
-                        "order_type": "BUY"
+                        "order_type": "BUY",
+                        "order_no": self._get_order_no(result)
                     }
                     self.trade_history.add_trade(trade_data)
                     
@@ -1693,12 +2060,15 @@ class USTrader(BaseTrader):
             balance = self._retry_api_call(self.us_api.get_account_balance)
             if balance is None:
                 return
+            self._normalize_holdings(balance)
             
-            for holding in balance['output1']:
-                # 거래소와 종목코드 결합
-                exchange = holding.get('ovrs_excg_cd', '')  # NASD, NYSE, AMEX
-                stock_code = f"{holding['ovrs_pdno']}.{exchange}"
-                current_price_data = self._retry_api_call(self.us_api.get_stock_price, stock_code)
+            # 주문 가능 수량이 없는 종목(미체결 매도 주문 등)은 매도할 수 없으므로 현재가 조회 전에 제외
+            tradable_holdings = [holding for holding in balance['output1'] if holding['orderable_quantity'] > 0]
+            
+            # 보유 종목 현재가를 병렬로 조회한 뒤 종목별 조건 체크는 순차 실행
+            price_results = self._get_stock_prices([holding['stock_code'] for holding in tradable_holdings])
+            
+            for holding, current_price_data in zip(tradable_holdings, price_results):
                 if current_price_data is None:
                     continue
                 
@@ -1707,14 +2077,19 @@ class USTrader(BaseTrader):
                 
         except Exception as e:
             self.logger.error(f"스탑 조건 체크 중 오류 발생: {str(e)}")
+        finally:
+            # 이번 체크에서 갱신된 신고가를 한 번의 트랜잭션으로 저장
+            if self.pending_highest_prices:
+                self.trade_history.update_highest_prices(self.pending_highest_prices)
+                self.pending_highest_prices = {}
     
     def _check_stop_conditions_for_stock(self, holding: Dict, current_price: float) -> bool:
         """개별 종목의 스탑로스와 트레일링 스탑 조건을 체크합니다."""
         try:
-            exchange = holding.get('ovrs_excg_cd', '')  # NASD, NYSE, AMEX
-            stock_code = f"{holding['ovrs_pdno']}.{exchange}"
-            entry_price = float(holding.get('pchs_avg_pric', 0)) if holding.get('pchs_avg_pric') and str(holding.get('pchs_avg_pric')).strip() != '' else 0
-            quantity = int(holding.get('ovrs_cblc_qty', 0)) if holding.get('ovrs_cblc_qty') and str(holding.get('ovrs_cblc_qty')).strip() != '' else 0
+            stock_code = holding['stock_code']
+            # 숫자 필드는 _normalize_holdings에서 한 번만 변환
+            entry_price = holding['entry_price']
+            quantity = holding['quantity']
             name = holding.get('ovrs_item_name', stock_code)
             
             # 보유 수량이 없는 경우는 정상적인 상황이므로 조용히 리턴
@@ -1726,15 +2101,7 @@ class USTrader(BaseTrader):
                 self.logger.warning(f"매수 평균가(${entry_price:.2f})가 유효하지 않습니다: {name}")
                 return False
             
-            # 계좌 잔고 조회
-            total_balance = self._retry_api_call(self.us_api.get_total_balance)
-            if total_balance is None:
-                return False
-
-            # 총자산금액을 환율로 나누어 달러로 환산
-            total_assets = float(total_balance['output3']['tot_asst_amt']) / self.exchange_rate
-            
-            # 스탑로스 체크
+            # 스탑로스 체크 (총자산은 매도가 실행된 경우 메시지 작성 시에만 조회)
             loss_pct = (current_price - entry_price) / entry_price * 100
             if loss_pct <= self.settings['stop_loss']:
                 trade_msg = f"스탑로스 조건 성립 - {name}({stock_code}): 손실률 {loss_pct:.2f}% <= {self.settings['stop_loss']}%"
@@ -1745,11 +2112,17 @@ class USTrader(BaseTrader):
                 # 스탑로스 매도
                 result = self._retry_api_call(self.us_api.order_stock, stock_code, "SELL", quantity, round(sell_price, 2))
                 if result:
+                    # 메시지와 거래 내역에 함께 쓰는 금액은 한 번만 계산
+                    sell_amount = current_price * quantity
+                    profit_loss = (current_price - entry_price) * quantity
+                    
                     msg = f"스탑로스 매도 실행: {name} {quantity}주 (지정가)"
                     msg += f"\n- 매도 사유: 손실률 {loss_pct:.2f}% (스탑로스 {self.settings['stop_loss']}% 도달)"
-                    msg += f"\n- 매도 금액: ${current_price * quantity:,.2f} (현재가 ${current_price:,.2f})"
-                    msg += f"\n- 매수 정보: 매수단가 ${entry_price:,.2f} / 평가손익 ${(current_price - entry_price) * quantity:,.2f}"
-                    msg += f"\n- 계좌 상태: 총평가금액 ${total_assets:,.2f}"
+                    msg += f"\n- 매도 금액: ${sell_amount:,.2f} (현재가 ${current_price:,.2f})"
+                    msg += f"\n- 매수 정보: 매수단가 ${entry_price:,.2f} / 평가손익 ${profit_loss:,.2f}"
+                    total_assets = self._get_cached_total_assets()
+                    if total_assets is not None:
+                        msg += f"\n- 계좌 상태: 총평가금액 ${total_assets:,.2f}"
                     self.logger.info(msg)
                     
                     # 거래 내역 저장
@@ -1760,15 +2133,17 @@ class USTrader(BaseTrader):
                         "stock_name": name,
                         "quantity": quantity,
                         "price": current_price,
-                        "total_amount": quantity * current_price,
+                        "total_amount": sell_amount,
                         "reason": f"스탑로스 매도: 손실률 {loss_pct:.2f}% (스탑로스 기준 {self.settings['stop_loss']}%)",
-                        "profit_loss": (current_price - entry_price) * quantity,
-                        "profit_loss_pct": loss_pct
+                        "profit_loss": profit_loss,
+                        "profit_loss_pct": loss_pct,
+                        "order_no": self._get_order_no(result)
                     }
                     self.trade_history.add_trade(trade_data)
                     
                     # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                     self.sold_stocks_cache_time = 0
+                    self.fills_index_cache_time = 0
                 return True
             
             # 트레일링 스탑 체크
@@ -1792,20 +2167,22 @@ class USTrader(BaseTrader):
                         msg += f"\n- 트레일링 스탑: 현재가 기준 {abs(self.settings['trailing_stop']):.1f}% 하락 시 매도"
                         self.logger.info(msg)
                 
-                # 현재가를 새로운 최고가로 사용하고 데이터베이스에 저장
+                # 현재가를 새로운 최고가로 사용하고 캐시에 저장 (데이터베이스는 스탑 체크가 끝난 뒤 한 번에 저장)
                 highest_price = current_price
-                self.trade_history.update_highest_price(stock_code, current_price)
-                self.logger.debug(f"최고가 데이터베이스 업데이트: {stock_code}, ${current_price:.2f}")
+                self.highest_price_cache[stock_code] = current_price
+                self.pending_highest_prices[stock_code] = current_price
+                self.logger.debug("최고가 캐시 업데이트: %s, $%.2f", stock_code, current_price)
             else:
                 # 목표가(trailing_start) 초과 여부 확인
                 profit_pct = (highest_price - entry_price) / entry_price * 100
                 if profit_pct >= self.settings['trailing_start']:  # 목표가 초과 시에만 트레일링 스탑 체크
                     drop_pct = (current_price - highest_price) / highest_price * 100
+                    current_profit_pct = (current_price - entry_price) / entry_price * 100
                     
                     # 1% 이상 하락 시 메시지 출력
                     if drop_pct <= -1.0:
                         msg = f"고점 대비 하락 - {name}({stock_code})"
-                        msg += f"\n- 현재 수익률: +{((current_price - entry_price) / entry_price * 100):.3f}%"
+                        msg += f"\n- 현재 수익률: +{current_profit_pct:.3f}%"
                         msg += f"\n- 고점 대비 하락: {drop_pct:.3f}% (고점 ${highest_price:,.2f} → 현재가 ${current_price:,.2f})"
                         msg += f"\n- 트레일링 스탑까지: {(self.settings['trailing_stop'] - drop_pct):.3f}% 더 하락하면 매도"
                         self.logger.info(msg)
@@ -1816,11 +2193,17 @@ class USTrader(BaseTrader):
                         
                         result = self._retry_api_call(self.us_api.order_stock, stock_code, "SELL", quantity, round(sell_price, 2))
                         if result:
+                            # 메시지와 거래 내역에 함께 쓰는 금액은 한 번만 계산
+                            sell_amount = current_price * quantity
+                            profit_loss = (current_price - entry_price) * quantity
+                            
                             msg = f"트레일링 스탑 매도 실행: {name} {quantity}주 (지정가)"
                             msg += f"\n- 매도 사유: 고점 대비 하락률 {drop_pct:.3f}% (트레일링 스탑 {self.settings['trailing_stop']}% 도달)"
-                            msg += f"\n- 매도 금액: ${current_price * quantity:,.2f} (현재가 ${current_price:,.2f})"
-                            msg += f"\n- 매수 정보: 매수단가 ${entry_price:,.2f} / 평가손익 ${(current_price - entry_price) * quantity:,.2f}"
-                            msg += f"\n- 계좌 상태: 총평가금액 ${total_assets:,.2f}"
+                            msg += f"\n- 매도 금액: ${sell_amount:,.2f} (현재가 ${current_price:,.2f})"
+                            msg += f"\n- 매수 정보: 매수단가 ${entry_price:,.2f} / 평가손익 ${profit_loss:,.2f}"
+                            total_assets = self._get_cached_total_assets()
+                            if total_assets is not None:
+                                msg += f"\n- 계좌 상태: 총평가금액 ${total_assets:,.2f}"
                             self.logger.info(msg)
                             
                             # 거래 내역 저장
@@ -1831,15 +2214,17 @@ class USTrader(BaseTrader):
                                 "stock_name": name,
                                 "quantity": quantity,
                                 "price": current_price,
-                                "total_amount": quantity * current_price,
+                                "total_amount": sell_amount,
                                 "reason": f"트레일링 스탑 매도: 고점 ${highest_price:.2f} 대비 하락률 {drop_pct:.2f}% 도달 (트레일링 스탑 기준 {self.settings['trailing_stop']}%)",
-                                "profit_loss": (current_price - entry_price) * quantity,
-                                "profit_loss_pct": (current_price - entry_price) / entry_price * 100
+                                "profit_loss": profit_loss,
+                                "profit_loss_pct": current_profit_pct,
+                                "order_no": self._get_order_no(result)
                             }
                             self.trade_history.add_trade(trade_data)
                             
                             # 캐시 초기화하여 다음 API 호출 시 최신 정보 조회하도록 함
                             self.sold_stocks_cache_time = 0
+                            self.fills_index_cache_time = 0
                         return True
             
             return False
@@ -1851,82 +2236,93 @@ class USTrader(BaseTrader):
     def update_stock_report(self) -> None:
         """미국 주식 현황을 구글 스프레드시트에 업데이트합니다."""
         try:
-            # 계좌 잔고 조회 (inquire-present-balance API 사용)
-            balance = self.us_api.get_total_balance()
+            # 요약 정보(inquire-present-balance)와 보유 종목(get_account_balance) 잔고를 동시에 조회
+            # 호출 시작 간격은 _wait_for_api_call로 유지되고 응답 대기 시간만 겹침
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                balance_future = executor.submit(self._retry_api_call, self.us_api.get_total_balance)
+                account_balance_future = executor.submit(self._retry_api_call, self.us_api.get_account_balance)
+            
+            balance = balance_future.result()
             if balance is None:
                 raise Exception("계좌 잔고 조회 실패")
             
-            # 기존 get_account_balance API로 보유 종목 데이터 가져오기
-            account_balance = self.us_api.get_account_balance()
+            account_balance = account_balance_future.result()
             if account_balance is None:
                 raise Exception("계좌 잔고 조회 실패")
             
-            # 보유 종목 데이터 생성
-            holdings_data = []
-            for holding in account_balance['output1']:
-                if int(holding.get('ovrs_cblc_qty', 0)) <= 0:
-                    continue
-                
-                full_stock_code = f"{holding['ovrs_pdno']}.{holding['ovrs_excg_cd']}"
-                current_price_data = self._retry_api_call(self.us_api.get_stock_price, full_stock_code)
-                
-                if current_price_data:
-                    # 현재가
-                    current_price = round(float(current_price_data['output']['last']), 2)
-                    stock_code = holding['ovrs_pdno']
-                    stock_name = holding['ovrs_item_name']
-                    
-                    holdings_data.append([
-                        stock_code,                                           # 종목코드
-                        stock_name,                                          # 종목명
-                        current_price,                                       # 현재가
-                        '',                                                  # 구분
-                        round(float(current_price_data['output']['rate']), 2),         # 등락률
-                        round(float(holding['pchs_avg_pric']), 2),                     # 평단가
-                        round(float(holding['evlu_pfls_rt']), 2),                      # 수익률
-                        int(holding['ovrs_cblc_qty']),                       # 보유량
-                        round(float(holding['frcr_evlu_pfls_amt']), 2),               # 평가손익
-                        round(float(holding['frcr_pchs_amt1']), 2),                   # 매입금액
-                        round(float(holding['ovrs_stck_evlu_amt']), 2)                # 평가금액
-                    ])
-            
-            # 주식현황 시트 업데이트
-            holdings_sheet = self._get_holdings_sheet()
-            self._update_holdings_sheet(holdings_data, holdings_sheet)
-            
-
-            # inquire-present-balance API에서 제공하는 요약 정보 가져오기
-            output3 = balance.get('output3', [{}])
-            
-            # 매입금액합계금액 (pchs_amt_smtl)
-            total_purchase_amount = round(float(output3.get('pchs_amt_smtl_amt', 0)), 2)
-            
-            # 평가금액합계금액 (evlu_amt_smtl)
-            total_eval_amount = round(float(output3.get('evlu_amt_smtl_amt', 0)), 2)
-            
-            # 총평가손익금액 (tot_evlu_pfls_amt)
-            total_eval_profit_loss = round(float(output3.get('tot_evlu_pfls_amt', 0)), 2)
+            # 보유 종목 데이터 생성 (보유 수량이 있는 종목의 현재가를 병렬로 조회)
+            # 직전 매매 루프(스탑 체크 등)에서 report_price_max_age 이내에 조회한 현재가는 다시 조회하지 않고,
+            # 나머지만 최대 8개까지 동시 호출 (호출 간격은 _wait_for_api_call로 유지)
+            holdings = [holding for holding in account_balance['output1'] if int(holding.get('ovrs_cblc_qty', 0)) > 0]
+            price_results = self._get_stock_prices(
+                [f"{holding['ovrs_pdno']}.{holding['ovrs_excg_cd']}" for holding in holdings],
+                max_workers=8,
+                max_age=self.report_price_max_age
+            )
             
-            # 총자산금액 (tot_asst_amt)
-            total_asset_amount = round(float(output3.get('tot_asst_amt', 0)), 2)
+            # 보유 종목 행에 필요한 필드를 한 번에 추출
+            holding_fields = itemgetter('ovrs_pdno', 'ovrs_item_name', 'pchs_avg_pric', 'evlu_pfls_rt', 'ovrs_cblc_qty',
+                                        'frcr_evlu_pfls_amt', 'frcr_pchs_amt1', 'ovrs_stck_evlu_amt')
+            price_fields = itemgetter('last', 'rate')
             
-            # 총수익률 계산 (evlu_erng_rt1) - 퍼센트 값이므로 변환 불필요
-            total_profit_rate = round(float(output3.get('evlu_erng_rt1', 0)), 2)
+            # 보유 종목을 구조화 배열에 한 번 채워 두고, 시트 출력용 행은 배열에서 생성
+            holdings_array = np.empty(len(holdings), dtype=HOLDING_DTYPE)
+            count = 0
+            for holding, current_price_data in zip(holdings, price_results):
+                if current_price_data:
+                    stock_code, stock_name, avg_price, profit_rate, quantity, profit_amount, purchase_amount, eval_amount = holding_fields(holding)
+                    current_price, change_rate = price_fields(current_price_data['output'])
+                    
+                    holdings_array[count] = (
+                        stock_code, stock_name, float(current_price), float(change_rate), float(avg_price),
+                        float(profit_rate), int(quantity), float(profit_amount), float(purchase_amount), float(eval_amount)
+                    )
+                    count += 1
             
-            # 요약 정보 업데이트
-            # 평가손익금액은 F6, 수익률은 G6에 출력
-            self.google_sheet.update_range(f"{holdings_sheet}!F6", [[total_eval_profit_loss]])
-            self.google_sheet.update_range(f"{holdings_sheet}!G6", [[total_profit_rate]])
+            holdings_array = holdings_array[:count]
+            for column in ('price', 'rate', 'avg', 'pnl_rt', 'pnl', 'cost', 'eval'):
+                holdings_array[column] = np.round(holdings_array[column], 2)
             
-            # 나머지 정보는 K5:K7에 출력
-            summary_data = [
-                [total_purchase_amount],  # 매입금액합계금액 (달러)
-                [total_eval_amount],      # 평가금액합계금액 (달러)
-                [total_asset_amount]      # 총자산금액 (달러)
-            ]
+            # 시트 행: 종목코드, 종목명, 현재가, 구분, 등락률, 평단가, 수익률, 보유량, 평가손익, 매입금액, 평가금액
+            holdings_data = [[code, name, price, ''] + rest for code, name, price, *rest in holdings_array.tolist()]
             
-            summary_range = f"{holdings_sheet}!K5:K7"
-            self.google_sheet.update_range(summary_range, summary_data)
+            # 주식현황 시트 업데이트 (시트 쓰기를 모아 한 번에 전송)
+            holdings_sheet = self._get_holdings_sheet()
+            with self.google_sheet.batched_writes():
+                self._update_holdings_sheet(holdings_data, holdings_sheet)
+                
+                # inquire-present-balance API에서 제공하는 요약 정보 가져오기
+                output3 = balance.get('output3', [{}])
+                
+                # 매입금액합계금액 (pchs_amt_smtl)
+                total_purchase_amount = round(float(output3.get('pchs_amt_smtl_amt', 0)), 2)
+                
+                # 평가금액합계금액 (evlu_amt_smtl)
+                total_eval_amount = round(float(output3.get('evlu_amt_smtl_amt', 0)), 2)
+                
+                # 총평가손익금액 (tot_evlu_pfls_amt)
+                total_eval_profit_loss = round(float(output3.get('tot_evlu_pfls_amt', 0)), 2)
+                
+                # 총자산금액 (tot_asst_amt)
+                total_asset_amount = round(float(output3.get('tot_asst_amt', 0)), 2)
+                
+                # 총수익률 계산 (evlu_erng_rt1) - 퍼센트 값이므로 변환 불필요
+                total_profit_rate = round(float(output3.get('evlu_erng_rt1', 0)), 2)
+                
+                # 요약 정보 업데이트
+                # 평가손익금액은 F6, 수익률은 G6에 출력
+                self.google_sheet.update_range(f"{holdings_sheet}!F6", [[total_eval_profit_loss]])
+                self.google_sheet.update_range(f"{holdings_sheet}!G6", [[total_profit_rate]])
+                
+                # 나머지 정보는 K5:K7에 출력
+                summary_data = [
+                    [total_purchase_amount],  # 매입금액합계금액 (달러)
+                    [total_eval_amount],      # 평가금액합계금액 (달러)
+                    [total_asset_amount]      # 총자산금액 (달러)
+                ]
+                
+                summary_range = f"{holdings_sheet}!K5:K7"
+                self.google_sheet.update_range(summary_range, summary_data)
             
         except Exception as e:
             self.logger.error(f"미국 주식 현황 업데이트 실패: {str(e)}")
@@ -1940,7 +2336,7 @@ class USTrader(BaseTrader):
         """주식현황 시트를 업데이트합니다."""
         try:
             # 마지막 업데이트 시간 갱신
-            now = datetime.now(self.us_timezone)
+            now = self._get_tick_now()
             update_time = now.strftime("%Y-%m-%d %H:%M:%S")
             self.google_sheet.update_last_update_time(update_time, holdings_sheet)
             
@@ -1973,7 +2369,7 @@ class USTrader(BaseTrader):
         """
         try:
             # TS 매도 이후의 시세 데이터 조회
-            end_date = datetime.now(self.us_timezone).strftime("%Y%m%d")
+            end_date = self._get_tick_now().strftime("%Y%m%d")
             sell_date_obj = datetime.strptime(ts_sell_date, "%Y-%m-%d")
             start_date = sell_date_obj.strftime("%Y%m%d")
             
@@ -2029,15 +2425,11 @@ class USTrader(BaseTrader):
                 ma_df['xymd'] = pd.to_datetime(ma_df['xymd'])
                 ma_df = ma_df.sort_values('xymd', ascending=True)
                 
-                # 이동평균 계산
-                ma_df['clos'] = ma_df['clos'].astype(float)
-                ma_series = ma_df['clos'].rolling(window=ma_period).mean()
-                
-                if len(ma_series) < 1 or pd.isna(ma_series.iloc[-1]):
+                # 이동평균 계산 (clos는 API에서 float64로 변환됨, 마지막 구간만 평균)
+                ma_value = float(ma_df['clos'].to_numpy(dtype=np.float64)[-ma_period:].mean())
+                if np.isnan(ma_value):
                     continue
                 
-                ma_value = ma_series.iloc[-1]
-                
                 # 종가가 이동평균보다 낮으면 이탈 확인
                 period_unit = "일" if period_div_code == "D" else "주"
                 if close < ma_value:
@@ -2052,10 +2444,63 @@ class USTrader(BaseTrader):
             self.logger.error(f"{stock_code} - 이평선 이탈 확인 중 오류 발생: {str(e)}")
             return False
 
+    def _get_cached_total_assets(self) -> Optional[float]:
+        """달러 환산 총자산을 조회합니다. 조회 결과는 total_assets_cache_ttl 동안 재사용합니다.
+        
+        Returns:
+            Optional[float]: 달러 환산 총자산 (조회 실패 시 None)
+        """
+        if self.total_assets_cache is not None and time.time() - self.total_assets_cache_time < self.total_assets_cache_ttl:
+            return self.total_assets_cache
+        
+        total_balance = self._retry_api_call(self.us_api.get_total_balance)
+        if total_balance is None:
+            return None
+        
+        # 저장된 환율이 없으면 먼저 조회 (실패 시 통화별 잔고의 환율 사용)
+        if self.exchange_rate is None:
+            self._get_exchange_rate()
+        
+        total_assets = self._get_total_assets_usd(total_balance)
+        self.total_assets_cache = total_assets
+        self.total_assets_cache_time = time.time()
+        return total_assets
+    
+    def _index_balance_output2(self, total_balance: Dict) -> Dict[str, Dict]:
+        """체결기준현재잔고의 통화별 잔고(output2)를 한 번 순회하여 통화코드별로 인덱싱합니다.
+        
+        Args:
+            total_balance (Dict): get_total_balance() 응답
+            
+        Returns:
+            Dict[str, Dict]: {통화코드(crcy_cd): 통화별 잔고} (output2는 실전계좌만 제공, 없으면 빈 딕셔너리)
+        """
+        return {item['crcy_cd']: item for item in total_balance.get('output2') or []}
+    
+    def _get_total_assets_usd(self, total_balance: Dict) -> float:
+        """체결기준현재잔고의 총자산금액(원화)을 달러로 환산합니다.
+        
+        저장된 환율이 없으면 통화별 잔고(output2)의 USD 최초고시환율을 환율로 저장해 사용합니다.
+        
+        Args:
+            total_balance (Dict): get_total_balance() 응답
+            
+        Returns:
+            float: 달러 환산 총자산
+        """
+        if self.exchange_rate is None:
+            usd_balance = self._index_balance_output2(total_balance).get('USD')
+            if usd_balance and float(usd_balance.get('frst_bltn_exrt') or 0) > 0:
+                self.exchange_rate = float(usd_balance['frst_bltn_exrt'])
+                self.exchange_rate_date = self._get_tick_now().strftime("%Y-%m-%d")
+                self.logger.info(f"저장된 환율 정보가 없어 통화별 잔고의 환율 사용: ${1:.2f} = ₩{self.exchange_rate:.2f}")
+        
+        return float(total_balance['output3']['tot_asst_amt']) / self.exchange_rate
+    
     def _get_exchange_rate(self) -> bool:
         """원달러 환율 정보를 조회합니다. (나스닥, 애플 종목의 주문가능금액API 활용)"""
         try:
-            current_date = datetime.now(self.us_timezone).strftime("%Y-%m-%d")
+            current_date = self._get_tick_now().strftime("%Y-%m-%d")
             
             # 오늘 이미 조회한 경우 재사용
             if self.exchange_rate is not None and self.exchange_rate_date == current_date:
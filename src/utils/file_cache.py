@@ -0,0 +1,101 @@
+import os
+import json
+import time
+import tempfile
+from typing import Any, Optional
+
+try:
+    import orjson  # 설치되어 있으면 더 빠른 JSON 직렬화 사용 (선택 사항)
+except ImportError:
+    orjson = None
+
+
+def dumps_json(value: Any) -> bytes:
+    """값을 JSON 바이트로 직렬화합니다. orjson이 없으면 표준 json을 사용합니다."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """JSON 바이트를 값으로 변환합니다. orjson이 없으면 표준 json을 사용합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FileCache:
+    """키별로 JSON 파일에 값을 저장하는 간단한 디스크 캐시입니다.
+
+    프로그램을 재시작해도 유효 기간(TTL) 이내의 값은 다시 사용할 수 있습니다.
+    """
+
+    def __init__(self, cache_dir: str, ttl: int = 86400, file_mode: Optional[int] = None):
+        """
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리
+            ttl (int): 캐시 유효 기간 (초, 기본값 1일)
+            file_mode (Optional[int]): 캐시 파일 권한 (예: 0o600, 지정하지 않으면 기본 권한)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.file_mode = file_mode
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        """캐시 키에 해당하는 파일 경로를 반환합니다."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[Any]: 캐시된 값 (없거나 만료된 경우 None)
+        """
+        path = self._get_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return None
+            with open(path, 'rb') as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 캐시에 저장합니다. 고유한 임시 파일에 기록한 뒤 교체하여 중간에 끊기거나 동시에 저장해도 파일이 깨지지 않습니다.
+
+        Args:
+            key (str): 캐시 키
+            value (Any): JSON으로 직렬화 가능한 값
+        """
+        path = self._get_path(key)
+        temp_path = None
+        try:
+            data = dumps_json(value)
+            # 같은 키를 여러 스레드가 동시에 저장할 수 있으므로 호출마다 고유한 임시 파일 사용
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if self.file_mode is not None:
+                os.chmod(temp_path, self.file_mode)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def clear_expired(self) -> None:
+        """유효 기간이 지난 캐시 파일을 삭제합니다."""
+        now = time.time()
+        try:
+            for file_name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, file_name)
+                try:
+                    if now - os.path.getmtime(path) > self.ttl:
+                        os.remove(path)
+                except OSError:
+                    continue
+        except OSError:
+            pass
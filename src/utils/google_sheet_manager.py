@@ -1,12 +1,91 @@
 import os
+import re
+import time
+import random
+import threading
+import functools
 import yaml
 import pandas as pd
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from discord_webhook import DiscordWebhook
+
+# 매수 기간 날짜 형식 (예: 3/15, 03-15, 3.15, 3,15)
+TRADING_DATE_PATTERN = re.compile(r'^\s*(\d{1,2})\s*[/\-.,]\s*(\d{1,2})')
+# 매수 기간 MMDD 형식 (예: 0315)
+MMDD_PATTERN = re.compile(r'^\d{4}$')
+
+# A1 표기 셀 주소 (예: H10)
+A1_CELL_PATTERN = re.compile(r'^([A-Z]+)(\d+)$')
+
+# 설정값 좌표 키 (_parse_settings가 같은 순서로 해석)
+SETTINGS_KEYS = ['max_individual_stocks', 'max_pool_stocks', 'stop_loss', 'trailing_start', 'trailing_stop', 'rebalancing_date']
+
+# 미국 시장 종목 목록에서 허용하는 거래소 코드 (개별/POOL 시트 표기가 다름)
+INDIVIDUAL_US_EXCHANGES = ('NYSE', 'NASD', 'AMEX')
+POOL_US_EXCHANGES = ('NYSE', 'NAS', 'AMEX')
+
+# 종목 목록 좌표 키별 (구분 이름, 미국 거래소 코드 목록)
+STOCK_SHEETS = {
+    'individual_stocks': ("개별", INDIVIDUAL_US_EXCHANGES),
+    'pool_stocks': ("POOL", POOL_US_EXCHANGES),
+}
+
+# 종목 목록 컬럼 순서
+STOCK_COLUMNS = ['거래소', '종목코드', '종목명', '매수시작', '매수종료', '배분비율', '매수조건', '매수기준', '매수타이밍', '매수기준2', '매수설명', '매도조건', '매도기준', '매도타이밍', '매도기준2', '매도설명']
+
+# 시트에 컬럼이 없을 때 사용할 기본값
+STOCK_COLUMN_DEFAULTS = {
+    '매수조건': '종가',
+    '매도조건': '종가',
+    '매수기준2': '일',
+    '매도기준2': '일',
+    '매수타이밍': '골든구간',
+    '매도타이밍': '데드구간',
+}
+
+# 숫자로 변환할 컬럼과 비어 있거나 숫자가 아닐 때의 기본값
+STOCK_NUMERIC_DEFAULTS = {
+    '매수기준': 20.0,
+    '매도기준': 20.0,
+    '배분비율': 10.0,
+}
+
+# 설정/종목 시트 조회 시 값 렌더링 방식
+# UNFORMATTED_VALUE는 숫자 서식의 종목코드 앞자리 0(예: 005930 → 5930)과 날짜 서식의 매수시작/매수종료(일련번호로 반환)를 깨뜨리므로
+# 표시 문자열 그대로 받고, 숫자 컬럼은 _parse_stock_values에서 벡터화해 변환
+SHEET_VALUE_RENDER_OPTION = 'FORMATTED_VALUE'
+
+@functools.lru_cache(maxsize=8)
+def load_config(config_path: str, mtime: float) -> dict:
+    """설정 파일을 읽습니다. 같은 파일(경로, 수정 시각)은 한 번만 파싱합니다."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))  # libyaml이 있으면 C 로더 사용
+
+@functools.lru_cache(maxsize=8)
+def load_credentials(creds_path: str, mtime: float) -> ServiceAccountCredentials:
+    """서비스 계정 인증 정보를 만듭니다. 같은 키 파일(경로, 수정 시각)은 한 번만 파싱합니다."""
+    return ServiceAccountCredentials.from_service_account_file(
+        creds_path,
+        scopes=['https://www.googleapis.com/auth/spreadsheets']
+    )
+
+@functools.lru_cache(maxsize=8)
+def build_sheets_service(creds: ServiceAccountCredentials):
+    """인증 정보별 Sheets API 서비스를 만듭니다. 같은 인증 정보로 생성하는 관리자들은 서비스를 공유합니다.
+    
+    라이브러리에 포함된 정적 discovery 문서를 사용하여 시작 시 discovery 문서를 내려받지 않고,
+    인증된 HTTP 객체 하나를 전달하여 모든 Sheets 요청이 같은 keep-alive 연결(TLS 세션)을 재사용합니다.
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+    return build('sheets', 'v4', http=http, cache_discovery=False, static_discovery=True)
 
 class GoogleSheetManager:
     """구글 스프레드시트 관리자 클래스"""
@@ -18,9 +97,9 @@ class GoogleSheetManager:
         """
         self.logger = logging.getLogger('google_sheet_manager')
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
-            self.logger.info("설정 파일을 로드했습니다: %s", config_path)
+        # 국내/미국 트레이더가 같은 설정 파일로 각각 생성하므로 파싱 결과를 공유
+        self.config = load_config(config_path, os.path.getmtime(config_path))
+        self.logger.info("설정 파일을 로드했습니다: %s", config_path)
         
         self.spreadsheet_id = self.config['google_sheet']['spreadsheet_id']
         self.sheets = self.config['google_sheet']['sheets']
@@ -28,87 +107,304 @@ class GoogleSheetManager:
         
         # 서비스 계정 인증
         creds_path = self.config['google_sheet']['credentials_path']
-        creds = ServiceAccountCredentials.from_service_account_file(
-            creds_path,
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
+        self.creds = load_credentials(creds_path, os.path.getmtime(creds_path))
         self.logger.info("구글 서비스 계정 인증이 완료되었습니다.")
         
-        # 스프레드시트 서비스 생성
-        self.service = build('sheets', 'v4', credentials=creds)
+        # 스프레드시트 서비스 생성 (같은 인증 정보의 서비스는 재사용)
+        self.service = build_sheets_service(self.creds)
+        self.thread_local = threading.local()  # 보조 스레드별 HTTP 객체 (httplib2.Http는 스레드 간 공유 불가)
         self.sheet = self.service.spreadsheets()
         self.logger.info("스프레드시트 서비스가 초기화되었습니다. (Spreadsheet ID: %s)", self.spreadsheet_id)
         
         # 디스코드 웹훅 URL
         self.discord_webhook_url = self.config['discord']['webhook_url']
+        
+        # 설정/종목 조회 결과 캐시 ((메서드명, 시장 유형) -> (조회 시각, 값))
+        self.read_cache = {}
+        self.read_cache_ttl = self.config['google_sheet'].get('cache_ttl', 60)  # 캐시 유효 시간 (초)
+        self.settings_sheet_names = {self.sheets['settings_kr'], self.sheets['settings_us']}  # 쓰기 시 캐시를 비울 시트
+        
+        # 설정값/종목 목록을 모두 포함하는 설정 시트 범위 (지정 시 한 번의 values().get으로 조회)
+        self.settings_block_range = self.config['google_sheet'].get('settings_block_range')
+        
+        # 시트 이름과 좌표 키별 A1 범위 문자열 (예: ('주식현황[KOR]', 'last_update') -> '주식현황[KOR]!B5')
+        # 실행 중 바뀌지 않으므로 한 번만 만들고, 좌표 설정 오류는 시작 시점에 확인
+        self.range_strings = {}
+        for sheet_key, sheet_name in self.sheets.items():
+            coordinate_group = sheet_key.rsplit('_', 1)[0]  # settings_kr -> settings, holdings_us -> holdings
+            for field, coordinate in self.coordinates.get(coordinate_group, {}).items():
+                self.range_strings[(sheet_name, field)] = f"{sheet_name}!{coordinate}"
+        
+        # 보유 종목 리스트 범위 크기 (행 수, 열 수), 빈칸으로 채워 덮어쓰면 별도 지우기 요청이 필요 없음
+        (start_row, start_col), (end_row, end_col) = (
+            self._a1_to_index(cell) for cell in self.coordinates['holdings']['stock_list'].split(':')
+        )
+        self.holdings_list_shape = (end_row - start_row + 1, end_col - start_col + 1)
+        
+        # 설정 시트 블록의 시작 위치와 설정 좌표별 (시작, 끝) 인덱스
+        self.settings_block_origin = None
+        self.settings_bounds = {}
+        if self.settings_block_range:
+            self.settings_block_origin = self._a1_to_index(self.settings_block_range.partition(':')[0])
+            for field, coordinate in self.coordinates['settings'].items():
+                start_cell, _, end_cell = coordinate.partition(':')
+                self.settings_bounds[field] = (self._a1_to_index(start_cell), self._a1_to_index(end_cell or start_cell))
+        
+        # Sheets API 분당 할당량을 넘지 않도록 요청 종류별 토큰 버킷으로 호출 속도 제어
+        # 쓰기: 분당 60회, 읽기: 분당 300회 (버킷 용량만큼은 대기 없이 연속 호출 가능)
+        now = time.monotonic()
+        self.quota_lock = threading.Lock()
+        self.quota_buckets = {
+            'write': {'rate': 60 / 60.0, 'capacity': 60, 'tokens': 60, 'last_refill': now},
+            'read': {'rate': 300 / 60.0, 'capacity': 300, 'tokens': 300, 'last_refill': now},
+        }
+        
+        # batched_writes 블록 안에서 모아 둔 쓰기 요청 (블록 밖에서는 None)
+        self.pending_clears = None
+        self.pending_writes = None
     
-    def get_settings(self, market_type: str = "KOR") -> dict:
-        """구글 스프레드시트에서 설정값을 가져옵니다.
+    def _get_cached(self, key: tuple):
+        """유효 기간 이내의 캐시 값을 반환합니다. 없거나 만료된 경우 None을 반환합니다."""
+        cached = self.read_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] >= self.read_cache_ttl:
+            return None
+        return cached[1]
+    
+    def _set_cached(self, key: tuple, value) -> None:
+        """조회 결과를 캐시에 저장합니다."""
+        self.read_cache[key] = (time.monotonic(), value)
+    
+    def invalidate_cache(self) -> None:
+        """설정/종목 조회 캐시를 모두 비웁니다."""
+        self.read_cache.clear()
+    
+    def _invalidate_cache_for(self, range_name: str) -> None:
+        """쓰기 대상 범위가 설정 시트이면 설정/종목 조회 캐시를 비웁니다."""
+        if range_name.split('!', 1)[0] in self.settings_sheet_names:
+            self.invalidate_cache()
+    
+    def _wait_for_quota(self, kind: str) -> None:
+        """요청 종류(read/write)별 토큰 버킷에서 토큰을 하나 사용합니다. 토큰이 없으면 충전될 때까지 대기합니다."""
+        with self.quota_lock:
+            bucket = self.quota_buckets[kind]
+            now = time.monotonic()
+            bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['last_refill']) * bucket['rate'])
+            bucket['last_refill'] = now
+            if bucket['tokens'] < 1:
+                wait_time = (1 - bucket['tokens']) / bucket['rate']
+                self.logger.debug("Sheets API %s 할당량 대기: %.1f초", kind, wait_time)
+                time.sleep(wait_time)
+                bucket['tokens'] = 1
+                bucket['last_refill'] = time.monotonic()
+            bucket['tokens'] -= 1
+    
+    def _execute_with_backoff(self, request, is_write: bool = False, max_retries: int = 5):
+        """Sheets API 요청을 실행합니다. 429(할당량 초과)와 일시적인 5xx 오류는 지수 백오프로 재시도합니다.
+        
+        실행 전 요청 종류별 토큰 버킷으로 분당 할당량을 넘지 않도록 대기합니다.
+        
+        Args:
+            request: execute()를 호출할 googleapiclient 요청 객체
+            is_write (bool): 쓰기 요청 여부 (update/clear/batchUpdate/batchClear)
+            max_retries (int): 최대 재시도 횟수
+            
+        Returns:
+            dict: API 응답
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                self._wait_for_quota('write' if is_write else 'read')
+                return request.execute(http=self._get_thread_http())
+            except HttpError as e:
+                if e.resp.status not in (429, 500, 503) or attempt == max_retries:
+                    raise
+                wait_time = min(64, 2 ** attempt + random.uniform(0, 1))  # 동시 재시도가 몰리지 않도록 지터 추가
+                self.logger.warning("Sheets API 일시 오류 (HTTP %s), %.1f초 후 재시도합니다. (%d/%d)",
+                                    e.resp.status, wait_time, attempt + 1, max_retries)
+                time.sleep(wait_time)
+    
+    def _get_thread_http(self):
+        """현재 스레드에서 요청에 사용할 HTTP 객체를 반환합니다.
+        
+        메인 스레드는 서비스에 연결된 공유 HTTP 객체를 그대로 쓰도록 None을 반환하고,
+        보조 스레드는 스레드마다 인증된 HTTP 객체를 한 번 만들어 재사용합니다.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return None
+        http = getattr(self.thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=30))
+            self.thread_local.http = http
+        return http
+    
+    def _get_settings_sheet(self, market_type: str) -> str:
+        """시장 유형에 맞는 설정 시트 이름을 반환합니다."""
+        if market_type == "KOR":
+            return self.sheets['settings_kr']  # 투자설정[KOR]
+        elif market_type == "USA":
+            return self.sheets['settings_us']  # 투자설정[USA]
+        raise ValueError(f"지원하지 않는 시장 유형입니다: {market_type}")
+    
+    @staticmethod
+    def _a1_to_index(cell: str) -> tuple:
+        """A1 표기 셀 주소를 0부터 시작하는 (행, 열) 인덱스로 변환합니다."""
+        match = A1_CELL_PATTERN.match(cell.strip().upper())
+        if not match:
+            raise ValueError(f"지원하지 않는 셀 주소입니다: {cell}")
+        column = 0
+        for char in match[1]:
+            column = column * 26 + (ord(char) - ord('A') + 1)
+        return int(match[2]) - 1, column - 1
+    
+    def _slice_block(self, block_values: list, block_origin: tuple, bounds: tuple) -> dict:
+        """설정 시트 블록에서 하위 범위 값을 잘라 batchGet 응답과 같은 형태로 반환합니다.
+        
+        Sheets API와 같이 각 행 끝의 빈 셀과 범위 끝의 빈 행은 제거합니다.
+        
+        Args:
+            block_values (list): 블록 전체 값
+            block_origin (tuple): 블록 시작 셀의 (행, 열) 인덱스
+            bounds (tuple): 하위 범위의 ((시작 행, 시작 열), (끝 행, 끝 열)) 인덱스
+        """
+        (start_row, start_col), (end_row, end_col) = bounds
+        row_offset, col_offset = block_origin
+        
+        values = []
+        for row in block_values[start_row - row_offset:end_row - row_offset + 1]:
+            cells = row[start_col - col_offset:end_col - col_offset + 1]
+            while cells and cells[-1] == '':
+                cells = cells[:-1]
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+        return {'values': values} if values else {}
+    
+    def _fetch_settings_ranges(self, market_type: str, keys: list) -> list:
+        """설정 시트에서 좌표 키 목록에 해당하는 범위들을 한 번의 요청으로 조회합니다.
+        
+        settings_block_range가 지정되어 있으면 블록 전체를 values().get으로 한 번 읽어 잘라 쓰고,
+        아니면 values().batchGet으로 각 범위를 조회합니다.
         
         Args:
             market_type (str): 시장 유형 (KOR/USA)
+            keys (list): coordinates['settings']의 좌표 키 목록
             
         Returns:
-            dict: 설정값 딕셔너리
+            list: keys와 같은 순서의 범위 값 ({'values': [...]} 형태)
+        """
+        settings_sheet = self._get_settings_sheet(market_type)
+        
+        if self.settings_block_range:
+            result = self._execute_with_backoff(self.sheet.values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{settings_sheet}!{self.settings_block_range}",
+                valueRenderOption=SHEET_VALUE_RENDER_OPTION
+            ))
+            block_values = result.get('values', [])
+            return [self._slice_block(block_values, self.settings_block_origin, self.settings_bounds[key]) for key in keys]
+        
+        result = self._execute_with_backoff(self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[self.range_strings[(settings_sheet, key)] for key in keys],
+            valueRenderOption=SHEET_VALUE_RENDER_OPTION
+        ))
+        return result.get('valueRanges', [])
+    
+    def _parse_settings(self, value_ranges: list) -> dict:
+        """조회한 설정값 범위들(SETTINGS_KEYS 순서)을 설정 딕셔너리로 변환합니다."""
+        return {
+            # 'max_individual_stocks': int(value_ranges[0]['values'][0][0]) if value_ranges[0].get('values') else 5,
+            # 'max_pool_stocks': int(value_ranges[1]['values'][0][0]) if value_ranges[1].get('values') else 5,
+            'max_individual_stocks': 99,
+            'max_pool_stocks': 99,
+            'stop_loss': float(value_ranges[2]['values'][0][0]) if value_ranges[2].get('values') else 5.0,
+            'trailing_start': float(value_ranges[3]['values'][0][0]) if value_ranges[3].get('values') else 10.0,
+            'trailing_stop': float(value_ranges[4]['values'][0][0]) if value_ranges[4].get('values') else 5.0,
+            'rebalancing_date': value_ranges[5]['values'][0][0] if value_ranges[5].get('values') else "",
+        }
+    
+    def _send_error_message(self, error_msg: str) -> None:
+        """디스코드로 에러 메시지를 전송합니다. 전송은 백그라운드 스레드에서 처리해 호출자가 응답을 기다리지 않습니다."""
+        if not self.discord_webhook_url:
+            return
+        webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
+        threading.Thread(target=self._execute_webhook, args=(webhook,), name="sheet-error-webhook", daemon=True).start()
+    
+    def _execute_webhook(self, webhook: DiscordWebhook) -> None:
+        """디스코드 웹훅을 실행합니다. (백그라운드 스레드용)"""
+        try:
+            webhook.execute()
+        except Exception as e:
+            self.logger.error(f"디스코드 에러 메시지 전송 실패: {str(e)}")
+    
+    def get_market_settings(self, market_type: str = "KOR", force_refresh: bool = False) -> tuple:
+        """설정값, 개별 종목, POOL 종목을 한 번의 요청으로 가져옵니다.
+        
+        조회 결과는 read_cache_ttl 동안 캐시되며, 반환값은 호출자가 수정해도 캐시에 영향이 없도록 복사본입니다.
+        
+        Args:
+            market_type (str): 시장 유형 (KOR/USA)
+            force_refresh (bool): True이면 캐시를 무시하고 시트에서 다시 조회
+            
+        Returns:
+            tuple: (설정값 딕셔너리, 개별 종목 데이터프레임, POOL 종목 데이터프레임)
             
         Raises:
             Exception: 설정 로드 중 오류 발생 시
         """
+        cache_key = ('get_market_settings', market_type)
+        cached = None if force_refresh else self._get_cached(cache_key)
+        if cached is not None:
+            settings, individual_stocks, pool_stocks = cached
+            return dict(settings), individual_stocks.copy(), pool_stocks.copy()
+        
         try:
-            self.logger.info(f"{market_type} 시장 설정을 로드합니다.")
-            
-            # 시장 유형에 따른 설정 시트 선택
-            if market_type == "KOR":
-                settings_sheet = self.config['google_sheet']['sheets']['settings_kr']
-            elif market_type == "USA":
-                settings_sheet = self.config['google_sheet']['sheets']['settings_us']
-            else:
-                raise ValueError(f"지원하지 않는 시장 유형입니다: {market_type}")
-            
-            # 설정값 범위 지정
-            ranges = [
-                f"{settings_sheet}!{self.coordinates['settings']['max_individual_stocks']}",
-                f"{settings_sheet}!{self.coordinates['settings']['max_pool_stocks']}",
-                f"{settings_sheet}!{self.coordinates['settings']['stop_loss']}",
-                f"{settings_sheet}!{self.coordinates['settings']['trailing_start']}",
-                f"{settings_sheet}!{self.coordinates['settings']['trailing_stop']}",
-                f"{settings_sheet}!{self.coordinates['settings']['rebalancing_date']}",
-            ]
-
-            # 설정값 조회
-            result = self.service.spreadsheets().values().batchGet(
-                spreadsheetId=self.spreadsheet_id,
-                ranges=ranges
-            ).execute()
-            
-            value_ranges = result.get('valueRanges', [])
-            
-            # 설정값 파싱
-            settings = {
-                # 'max_individual_stocks': int(value_ranges[0]['values'][0][0]) if value_ranges[0].get('values') else 5,
-                # 'max_pool_stocks': int(value_ranges[1]['values'][0][0]) if value_ranges[1].get('values') else 5,
-                'max_individual_stocks': 99,
-                'max_pool_stocks': 99,
-                'stop_loss': float(value_ranges[2]['values'][0][0]) if value_ranges[2].get('values') else 5.0,
-                'trailing_start': float(value_ranges[3]['values'][0][0]) if value_ranges[3].get('values') else 10.0,
-                'trailing_stop': float(value_ranges[4]['values'][0][0]) if value_ranges[4].get('values') else 5.0,
-                'rebalancing_date': value_ranges[5]['values'][0][0] if value_ranges[5].get('values') else "",
-            }
-
-            return settings
+            self.logger.debug("%s 시장 설정과 종목 정보를 로드합니다.", market_type)
+            value_ranges = self._fetch_settings_ranges(market_type, SETTINGS_KEYS + list(STOCK_SHEETS))
             
         except Exception as e:
             error_msg = f"설정 로드 중 오류 발생: {str(e)}"
             self.logger.error(error_msg)
-            from discord_webhook import DiscordWebhook
-            webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
-            webhook.execute()
+            self._send_error_message(error_msg)
             raise Exception(f"구글 시트에서 설정을 로드하지 못했습니다: {str(e)}")
+        
+        try:
+            settings = self._parse_settings(value_ranges)
+        except Exception as e:
+            error_msg = f"설정 로드 중 오류 발생: {str(e)}"
+            self.logger.error(error_msg)
+            self._send_error_message(error_msg)
+            raise Exception(f"구글 시트에서 설정을 로드하지 못했습니다: {str(e)}")
+        
+        individual_stocks, pool_stocks = (
+            self._parse_stock_values(value_range.get('values', []), market_type, label, us_exchanges)
+            for value_range, (label, us_exchanges) in zip(value_ranges[len(SETTINGS_KEYS):], STOCK_SHEETS.values())
+        )
+        self._set_cached(cache_key, (settings, individual_stocks, pool_stocks))
+        return dict(settings), individual_stocks.copy(), pool_stocks.copy()
+    
+    def get_settings(self, market_type: str = "KOR", force_refresh: bool = False) -> dict:
+        """구글 스프레드시트에서 설정값을 가져옵니다.
+        
+        캐시가 없으면 get_market_settings로 설정값과 개별/POOL 종목을 한 번에 조회해 함께 캐시합니다.
+        
+        Args:
+            market_type (str): 시장 유형 (KOR/USA)
+            force_refresh (bool): True이면 캐시를 무시하고 시트에서 다시 조회
+            
+        Returns:
+            dict: 설정값 딕셔너리
+            
+        Raises:
+            Exception: 설정 로드 중 오류 발생 시
+        """
+        return self.get_market_settings(market_type, force_refresh)[0]
 
     def _parse_date(self, date_str) -> str:
         """다양한 형식의 날짜를 MMDD 형식으로 변환합니다."""
         try:
-            if pd.isna(date_str) or str(date_str).strip() == '':
+            # None/NaN/NaT 확인 (NaN은 자기 자신과 같지 않음, pd.isna보다 가벼운 비교)
+            if date_str is None or date_str != date_str or str(date_str).strip() == '':
                 return ''
             
             # datetime 객체인 경우
@@ -117,32 +413,35 @@ class GoogleSheetManager:
             
             date_str = str(date_str).strip()
             
-            # 구분자로 분리된 경우 (예: 3/15, 3-15, 3.15)
-            for sep in ['/', '-', '.', ',']:
-                if sep in date_str:
-                    parts = date_str.split(sep)
-                    if len(parts) >= 2:
-                        month = str(int(parts[0])).zfill(2)  # 앞의 0 제거 후 다시 추가
-                        day = str(int(parts[1])).zfill(2)    # 앞의 0 제거 후 다시 추가
-                        return f"{month}{day}"
+            # 구분자로 분리된 경우 (예: 3/15, 3-15, 3.15) - 미리 컴파일한 정규식으로 한 번에 확인
+            match = TRADING_DATE_PATTERN.match(date_str)
+            if match:
+                return f"{int(match[1]):02d}{int(match[2]):02d}"
             
             # MMDD 형식인 경우
-            if len(date_str) == 4 and date_str.isdigit():
+            if MMDD_PATTERN.match(date_str):
                 return date_str
             
             return ''
         except:
             return ''
 
-    def _check_trading_period(self, start_date: str, end_date: str) -> bool:
-        """매수 기간을 체크합니다."""
+    def _check_trading_period(self, start_date: str, end_date: str, current_mmdd: str = None) -> bool:
+        """매수 기간을 체크합니다.
+        
+        Args:
+            start_date (str): 매수 시작일
+            end_date (str): 매수 종료일
+            current_mmdd (str): 기준 월일 (MMDD, 여러 종목을 확인할 때 한 번만 계산해 전달)
+        """
         try:
             # 날짜가 없으면 True 반환 (제한 없음)
             if not start_date or not end_date:
                 return True
             
             # 현재 날짜의 월일 추출
-            current_mmdd = datetime.now().strftime("%m%d")
+            if current_mmdd is None:
+                current_mmdd = datetime.now().strftime("%m%d")
             
             # 시작일과 종료일을 MMDD 형식으로 변환
             start_mmdd = self._parse_date(start_date)
@@ -164,288 +463,276 @@ class GoogleSheetManager:
             self.logger.error(f"매수 기간 체크 중 오류 발생: {str(e)}")
             return True
 
-    def get_individual_stocks(self, market_type: str = "KOR") -> pd.DataFrame:
-        """개별 종목 정보를 가져옵니다.
+    def _parse_stock_values(self, values: list, market_type: str, label: str, us_exchanges: tuple) -> pd.DataFrame:
+        """시트에서 읽은 종목 목록 값을 데이터프레임으로 변환하고 유효한 종목만 남깁니다.
         
         Args:
+            values (list): 시트 범위 값 (2차원 리스트)
             market_type (str): 시장 유형 (KOR/USA)
+            label (str): 종목 구분 이름 (개별/POOL, 오류 메시지용)
+            us_exchanges (tuple): 미국 시장에서 허용하는 거래소 코드 목록
             
         Returns:
-            pd.DataFrame: 개별 종목 정보 데이터프레임
+            pd.DataFrame: 종목 정보 데이터프레임
             
         Raises:
-            Exception: 데이터 로드 중 오류 발생 시
+            Exception: 데이터가 없거나 변환 중 오류 발생 시
         """
         try:
-            self.logger.info(f"{market_type} 시장의 개별 종목 정보를 로드합니다...")
-            
-            # 시장별 설정 시트 선택
-            if market_type == "KOR":
-                settings_sheet = self.sheets['settings_kr']  # 투자설정[KOR]
-            elif market_type == "USA":
-                settings_sheet = self.sheets['settings_us']  # 투자설정[USA]
-            else:
-                raise ValueError(f"지원하지 않는 시장 유형입니다: {market_type}")
-            
-            result = self.sheet.values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{settings_sheet}!{self.coordinates['settings']['individual_stocks']}"
-            ).execute()
-            
-            values = result.get('values', [])
-            columns = ['거래소', '종목코드', '종목명', '매수시작', '매수종료', '배분비율', '매수조건', '매수기준', '매수타이밍', '매수기준2', '매수설명', '매도조건', '매도기준', '매도타이밍', '매도기준2', '매도설명']
             if not values:
-                error_msg = "개별 종목 시트에 데이터가 없습니다. 설정을 확인해주세요."
+                error_msg = f"{label} 종목 시트에 데이터가 없습니다. 설정을 확인해주세요."
                 self.logger.error(error_msg)
-                from discord_webhook import DiscordWebhook
-                webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
-                webhook.execute()
-                raise Exception("구글 시트에서 개별 종목 정보를 가져오지 못했습니다.")
+                self._send_error_message(error_msg)
+                raise Exception(f"구글 시트에서 {label} 종목 정보를 가져오지 못했습니다.")
             
             # 첫 행이 헤더인지 확인하고 처리
             if '종목코드' in values[0]:
-                df = pd.DataFrame(values[1:], columns=values[0])
+                header, rows = values[0], values[1:]
             else:
-                df = pd.DataFrame(values, columns=columns)
+                header, rows = STOCK_COLUMNS, values
+            
+            # 시트에 없는 컬럼의 기본값
+            defaults = {column: value for column, value in STOCK_COLUMN_DEFAULTS.items() if column not in header}
+            allowed_exchanges = ("KOR",) if market_type == "KOR" else us_exchanges
+            current_mmdd = datetime.now().strftime("%m%d")  # 매수 기간 확인 기준일은 한 번만 계산
+            period_results = {}  # (매수시작, 매수종료) → 매수 기간 유효 여부 (대부분 비어 있거나 같은 값이라 한 번만 확인)
+            
+            # 거래소/종목코드 컬럼 위치 (원본 리스트 단계에서 먼저 거르기 위함)
+            exchange_index = header.index('거래소') if '거래소' in header else None
+            code_index = header.index('종목코드') if '종목코드' in header else None
+            
+            # 종목 수가 적어 DataFrame 연산 대신 행 단위로 필터링/변환
+            records = []
+            for row in rows:
+                # 시장 타입에 맞는 종목만 필터링 (다른 시장 행과 빈 행은 딕셔너리를 만들지 않고 제외)
+                if exchange_index is None or exchange_index >= len(row) or row[exchange_index] not in allowed_exchanges:
+                    continue
+                
+                # 빈 데이터 처리
+                if code_index is None or code_index >= len(row) or str(row[code_index]).strip() == '':
+                    continue
+                
+                record = dict(zip(header, row))
+                
+                # 매수 기간이 유효한 종목만 필터링
+                period = (record.get('매수시작'), record.get('매수종료'))
+                if period not in period_results:
+                    period_results[period] = self._check_trading_period(period[0], period[1], current_mmdd)
+                if not period_results[period]:
+                    continue
+                
+                record.update(defaults)
+                records.append(record)
             
-            # 빈 데이터 처리
-            df = df.dropna(subset=['종목코드'])
-            df = df[df['종목코드'].str.strip() != '']
+            # 컬럼 순서를 맞춰 데이터프레임으로 한 번만 생성
+            df = pd.DataFrame(records, columns=STOCK_COLUMNS)
             
-            # 시장 타입에 맞는 종목만 필터링
-            if market_type == "KOR":
-                df = df[df['거래소'] == "KOR"]
-            else:  # US
-                df = df[df['거래소'].isin(['NYSE', 'NASD', 'AMEX'])]
-            
-            # 데이터 타입 변환 및 유효성 검사
-            def safe_numeric_conversion(value, default):
-                try:
-                    if pd.isna(value) or str(value).strip() == '':
-                        return default
-                    return float(value)
-                except (ValueError, TypeError):
-                    return default
-            
-            # 매수/매도 기준과 배분비율의 유효성 검사 및 변환
-            df['매수기준'] = df['매수기준'].apply(lambda x: safe_numeric_conversion(x, 20))
-            df['매도기준'] = df['매도기준'].apply(lambda x: safe_numeric_conversion(x, 20))
-            df['배분비율'] = df['배분비율'].apply(lambda x: safe_numeric_conversion(x, 10))
-            
-            # 매수/매도 조건과 기준2가 없는 경우 기본값 설정
-            if '매수조건' not in df.columns:
-                df['매수조건'] = '종가'
-            if '매도조건' not in df.columns:
-                df['매도조건'] = '종가'
-            if '매수기준2' not in df.columns:
-                df['매수기준2'] = '일'
-            if '매도기준2' not in df.columns:
-                df['매도기준2'] = '일'
-            if '매수타이밍' not in df.columns:
-                df['매수타이밍'] = '골든구간'
-            if '매도타이밍' not in df.columns:
-                df['매도타이밍'] = '데드구간'
-            
-            # 매수 기간이 유효한 종목만 필터링
-            valid_period = df.apply(lambda x: self._check_trading_period(x['매수시작'], x['매수종료']), axis=1)
-            df = df[valid_period]
-            
-            # 컬럼 순서 재정렬
-            df = df.reindex(columns=columns)
+            # 매수/매도 기준과 배분비율의 유효성 검사 및 변환 (행별 예외 처리 없이 컬럼 단위로 변환)
+            for column, default in STOCK_NUMERIC_DEFAULTS.items():
+                df[column] = pd.to_numeric(df[column].astype(str).str.strip(), errors='coerce').fillna(default).astype('float64')
             
             return df
             
         except Exception as e:
-            error_msg = f"개별 종목 로드 실패: {str(e)}\n구글 스프레드시트 '개별 종목' 설정을 확인해주세요."
+            error_msg = f"{label} 종목 로드 실패: {str(e)}\n구글 스프레드시트 '{label} 종목' 설정을 확인해주세요."
             self.logger.error(error_msg)
-            from discord_webhook import DiscordWebhook
-            webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
-            webhook.execute()
-            raise Exception(f"구글 시트에서 개별 종목 정보를 로드하지 못했습니다: {str(e)}")
+            self._send_error_message(error_msg)
+            raise Exception(f"구글 시트에서 {label} 종목 정보를 로드하지 못했습니다: {str(e)}")
     
-    def get_pool_stocks(self, market_type: str = "KOR") -> pd.DataFrame:
-        """POOL 종목 정보를 가져옵니다.
+    def get_individual_stocks(self, market_type: str = "KOR", force_refresh: bool = False) -> pd.DataFrame:
+        """개별 종목 정보를 가져옵니다. 캐시가 없으면 설정값, POOL 종목과 함께 한 번에 조회합니다.
         
         Args:
             market_type (str): 시장 유형 (KOR/USA)
+            force_refresh (bool): True이면 캐시를 무시하고 시트에서 다시 조회
             
         Returns:
-            pd.DataFrame: POOL 종목 정보 데이터프레임
+            pd.DataFrame: 개별 종목 정보 데이터프레임
+        """
+        return self.get_market_settings(market_type, force_refresh)[1]
+    
+    def get_pool_stocks(self, market_type: str = "KOR", force_refresh: bool = False) -> pd.DataFrame:
+        """POOL 종목 정보를 가져옵니다. 캐시가 없으면 설정값, 개별 종목과 함께 한 번에 조회합니다.
+        
+        Args:
+            market_type (str): 시장 유형 (KOR/USA)
+            force_refresh (bool): True이면 캐시를 무시하고 시트에서 다시 조회
             
-        Raises:
-            Exception: 데이터 로드 중 오류 발생 시
+        Returns:
+            pd.DataFrame: POOL 종목 정보 데이터프레임
+        """
+        return self.get_market_settings(market_type, force_refresh)[2]
+    
+    @contextmanager
+    def batched_writes(self):
+        """블록 안의 셀/범위 쓰기를 모아 블록이 끝날 때 한 번에 전송합니다.
+        
+        지우기 요청은 values().batchClear, 쓰기 요청은 values().batchUpdate로 각각 한 번씩 전송되며,
+        지우기가 먼저 실행됩니다. 블록 안에서 예외가 발생해도 그때까지 모은 요청은 전송합니다.
+        
+        Example:
+            with google_sheet.batched_writes():
+                google_sheet.update_last_update_time(update_time, holdings_sheet)
+                google_sheet.update_holdings(holdings_data, holdings_sheet)
         """
+        if self.pending_writes is not None:
+            # 이미 batched_writes 블록 안이면 바깥 블록에서 함께 전송
+            yield
+            return
+        
+        self.pending_clears = []
+        self.pending_writes = []
+        body_failed = False
         try:
-            self.logger.info(f"{market_type} 시장의 POOL 종목 정보를 로드합니다...")
-            
-            # 시장별 설정 시트 선택
-            if market_type == "KOR":
-                settings_sheet = self.sheets['settings_kr']  # 투자설정[KOR]
-            elif market_type == "USA":
-                settings_sheet = self.sheets['settings_us']  # 투자설정[USA]
-            else:
-                raise ValueError(f"지원하지 않는 시장 유형입니다: {market_type}")
-            
-            result = self.sheet.values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{settings_sheet}!{self.coordinates['settings']['pool_stocks']}"
-            ).execute()
-            
-            values = result.get('values', [])
-            columns = ['거래소', '종목코드', '종목명', '매수시작', '매수종료', '배분비율', '매수조건', '매수기준', '매수타이밍', '매수기준2', '매수설명', '매도조건', '매도기준', '매도타이밍', '매도기준2', '매도설명']
-            if not values:
-                error_msg = "POOL 종목 시트에 데이터가 없습니다. 설정을 확인해주세요."
-                self.logger.error(error_msg)
-                from discord_webhook import DiscordWebhook
-                webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
-                webhook.execute()
-                raise Exception("구글 시트에서 POOL 종목 정보를 가져오지 못했습니다.")
-            
-            # 첫 행이 헤더인지 확인하고 처리
-            if '종목코드' in values[0]:
-                df = pd.DataFrame(values[1:], columns=values[0])
-            else:
-                df = pd.DataFrame(values, columns=columns)
-            
-            # 빈 데이터 처리
-            df = df.dropna(subset=['종목코드'])
-            df = df[df['종목코드'].str.strip() != '']
-            
-            # 시장 타입에 맞는 종목만 필터링
-            if market_type == "KOR":
-                df = df[df['거래소'] == "KOR"]
-            else:  # US
-                df = df[df['거래소'].isin(['NYSE', 'NAS', 'AMEX'])]
-            
-            # 데이터 타입 변환 및 유효성 검사
-            def safe_numeric_conversion(value, default):
-                try:
-                    if pd.isna(value) or str(value).strip() == '':
-                        return default
-                    return float(value)
-                except (ValueError, TypeError):
-                    return default
-            
-            # 매수/매도 기준과 배분비율의 유효성 검사 및 변환
-            df['매수기준'] = df['매수기준'].apply(lambda x: safe_numeric_conversion(x, 20))
-            df['매도기준'] = df['매도기준'].apply(lambda x: safe_numeric_conversion(x, 20))
-            df['배분비율'] = df['배분비율'].apply(lambda x: safe_numeric_conversion(x, 10))
-            
-            # 매수/매도 조건과 기준2가 없는 경우 기본값 설정
-            if '매수조건' not in df.columns:
-                df['매수조건'] = '종가'
-            if '매도조건' not in df.columns:
-                df['매도조건'] = '종가'
-            if '매수기준2' not in df.columns:
-                df['매수기준2'] = '일'
-            if '매도기준2' not in df.columns:
-                df['매도기준2'] = '일'
-            if '매수타이밍' not in df.columns:
-                df['매수타이밍'] = '골든구간'
-            if '매도타이밍' not in df.columns:
-                df['매도타이밍'] = '데드구간'
-            
-            # 매수 기간이 유효한 종목만 필터링
-            valid_period = df.apply(lambda x: self._check_trading_period(x['매수시작'], x['매수종료']), axis=1)
-            df = df[valid_period]
-            
-            # 컬럼 순서 재정렬
-            df = df.reindex(columns=columns)
-            
-            return df
-            
-        except Exception as e:
-            error_msg = f"POOL 종목 로드 실패: {str(e)}\n구글 스프레드시트 'POOL 종목' 설정을 확인해주세요."
-            self.logger.error(error_msg)
-            from discord_webhook import DiscordWebhook
-            webhook = DiscordWebhook(url=self.discord_webhook_url, content=f"```diff\n- {error_msg}\n```")
-            webhook.execute()
-            raise Exception(f"구글 시트에서 POOL 종목 정보를 로드하지 못했습니다: {str(e)}")
+            yield
+        except Exception:
+            body_failed = True
+            raise
+        finally:
+            pending_clears, pending_writes = self.pending_clears, self.pending_writes
+            self.pending_clears = None
+            self.pending_writes = None
+            try:
+                self._flush_writes(pending_clears, pending_writes)
+            except Exception as e:
+                if not body_failed:
+                    raise
+                self.logger.error(f"일괄 쓰기 전송 실패: {str(e)}")
+    
+    def _flush_writes(self, pending_clears: list, pending_writes: list) -> None:
+        """모아 둔 지우기/쓰기 요청을 batchClear, batchUpdate로 전송합니다.
+        
+        같은 범위에 여러 번 쓴 경우 마지막 값만 전송합니다. (예: 한 블록에서 에러 메시지를 지웠다가 다시 쓰는 경우)
+        """
+        pending_clears = list(dict.fromkeys(pending_clears or []))
+        pending_writes = list(dict(pending_writes or []).items())
+        try:
+            if pending_clears:
+                self.logger.debug("범위 일괄 지우기를 시작합니다. (%d개 범위)", len(pending_clears))
+                self._execute_with_backoff(self.service.spreadsheets().values().batchClear(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={'ranges': pending_clears}
+                ), is_write=True)
+            
+            if pending_writes:
+                self.logger.debug("범위 일괄 업데이트를 시작합니다. (%d개 범위)", len(pending_writes))
+                self._execute_with_backoff(self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={
+                        'valueInputOption': 'USER_ENTERED',
+                        'data': [{'range': range_name, 'values': values} for range_name, values in pending_writes]
+                    }
+                ), is_write=True)
+                self.logger.debug("범위 일괄 업데이트가 완료되었습니다.")
+                
+        except HttpError as e:
+            self.logger.error("범위 일괄 업데이트 실패: %s", str(e))
+            raise Exception(f"범위 일괄 업데이트 실패: {str(e)}")
+    
+    def _get_range(self, sheet_name: str, field: str, coordinate_group: str = 'holdings') -> str:
+        """시트 이름과 좌표 키에 해당하는 A1 범위 문자열을 반환합니다.
+        
+        설정 파일의 시트 목록에 없는 시트 이름이면 처음 사용할 때 만들어 range_strings에 저장합니다.
+        """
+        range_name = self.range_strings.get((sheet_name, field))
+        if range_name is None:
+            range_name = f"{sheet_name}!{self.coordinates[coordinate_group][field]}"
+            self.range_strings[(sheet_name, field)] = range_name
+        return range_name
     
     def update_last_update_time(self, value: str, holdings_sheet: str) -> None:
         """마지막 업데이트 시간을 갱신합니다."""
         try:
-            self.update_cell(
-                f"{holdings_sheet}!{self.coordinates['holdings']['last_update']}", 
-                value
-            )
+            self.update_cell(self._get_range(holdings_sheet, 'last_update'), value)
         except Exception as e:
             self.logger.error(f"마지막 업데이트 시간 갱신 실패: {str(e)}")
     
     def update_error_message(self, value: str, holdings_sheet: str) -> None:
         """에러 메시지를 갱신합니다."""
         try:
-            self.update_cell(
-                f"{holdings_sheet}!{self.coordinates['holdings']['error_message']}", 
-                value
-            )
+            self.update_cell(self._get_range(holdings_sheet, 'error_message'), value)
         except Exception as e:
             self.logger.error(f"에러 메시지 갱신 실패: {str(e)}")
     
     def update_holdings(self, values: list, holdings_sheet: str) -> None:
-        """보유 종목 리스트를 갱신합니다."""
+        """보유 종목 리스트를 갱신합니다.
+        
+        남는 행과 열을 빈칸으로 채워 범위 전체를 한 번에 덮어쓰므로, 지우기 요청 없이 기존 데이터가 정리되고
+        시트가 잠시 비어 보이는 구간도 생기지 않습니다.
+        """
         try:
-            # 보유 종목 리스트 영역 초기화
-            range_name = f"{holdings_sheet}!{self.coordinates['holdings']['stock_list']}"
-            self.sheet.values().clear(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
-            
-            self.logger.debug(f"보유 종목 리스트 영역 초기화 완료: {range_name}")
+            range_name = self._get_range(holdings_sheet, 'stock_list')
+            row_count, column_count = self.holdings_list_shape
             
-            # 새로운 보유 종목 리스트 업데이트
-            self.update_range(range_name, values)
+            # 범위 크기에 맞춰 빈칸으로 채운 보유 종목 리스트 업데이트
+            padded_values = [list(row) + [''] * (column_count - len(row)) for row in values]
+            padded_values += [[''] * column_count for _ in range(row_count - len(padded_values))]
+            self.update_range(range_name, padded_values)
         except Exception as e:
             self.logger.error(f"보유 종목 리스트 갱신 실패: {str(e)}")
         
     def update_cell(self, range_name: str, value: str) -> None:
-        """특정 셀의 값을 업데이트합니다."""
+        """특정 셀의 값을 업데이트합니다. batched_writes 블록 안에서는 요청을 모아 둡니다."""
+        self._invalidate_cache_for(range_name)
+        if self.pending_writes is not None:
+            self.pending_writes.append((range_name, [[value]]))
+            return
+        
         try:
-            self.logger.info("셀 업데이트를 시작합니다. (범위: %s, 값: %s)", range_name, value)
+            self.logger.debug("셀 업데이트를 시작합니다. (범위: %s, 값: %s)", range_name, value)
             body = {
                 'values': [[value]]
             }
-            self.service.spreadsheets().values().update(
+            self._execute_with_backoff(self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
-            self.logger.info("셀 업데이트가 완료되었습니다.")
+            ), is_write=True)
+            self.logger.debug("셀 업데이트가 완료되었습니다.")
             
         except HttpError as e:
             self.logger.error("셀 업데이트 실패: %s", str(e))
             raise Exception(f"셀 업데이트 실패: {str(e)}")
     
     def update_range(self, range_name: str, values: list) -> None:
-        """특정 범위의 값을 업데이트합니다."""
+        """특정 범위의 값을 업데이트합니다. batched_writes 블록 안에서는 요청을 모아 둡니다."""
+        self._invalidate_cache_for(range_name)
+        if self.pending_writes is not None:
+            self.pending_writes.append((range_name, values))
+            return
+        
         try:
-            self.logger.info("범위 업데이트를 시작합니다. (범위: %s)", range_name)
+            self.logger.debug("범위 업데이트를 시작합니다. (범위: %s)", range_name)
             body = {
                 'values': values
             }
-            self.service.spreadsheets().values().update(
+            self._execute_with_backoff(self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
-            self.logger.info("범위 업데이트가 완료되었습니다.")
+            ), is_write=True)
+            self.logger.debug("범위 업데이트가 완료되었습니다.")
             
         except HttpError as e:
             self.logger.error("범위 업데이트 실패: %s", str(e))
             raise Exception(f"범위 업데이트 실패: {str(e)}")
     
     def clear_range(self, range_name: str) -> None:
-        """특정 범위의 값을 지웁니다."""
+        """특정 범위의 값을 지웁니다. batched_writes 블록 안에서는 요청을 모아 둡니다."""
+        self._invalidate_cache_for(range_name)
+        if self.pending_clears is not None:
+            self.pending_clears.append(range_name)
+            return
+        
         try:
-            self.logger.info("범위 지우기를 시작합니다. (범위: %s)", range_name)
-            self.service.spreadsheets().values().clear(
+            self.logger.debug("범위 지우기를 시작합니다. (범위: %s)", range_name)
+            self._execute_with_backoff(self.service.spreadsheets().values().clear(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
-            self.logger.info("범위 지우기가 완료되었습니다.")
+            ), is_write=True)
+            self.logger.debug("범위 지우기가 완료되었습니다.")
             
         except HttpError as e:
             self.logger.error("범위 지우기 실패: %s", str(e))
@@ -474,15 +761,15 @@ class GoogleSheetManager:
             range_name = f"{settings_sheet}!{cell}"
             
             # 셀 값 조회
-            result = self.service.spreadsheets().values().get(
+            result = self._execute_with_backoff(self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             values = result.get('values', [])
             
             if not values:
-                self.logger.debug(f"셀 {cell}에 값이 없습니다.")
+                self.logger.debug("셀 %s에 값이 없습니다.", cell)
                 return ""
                 
             return str(values[0][0]) if values[0] else ""
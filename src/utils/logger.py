@@ -1,8 +1,39 @@
 import os
+import re
+import atexit
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+import queue
+import threading
 import time
-from datetime import datetime
-from discord_webhook import DiscordWebhook
+import requests
+
+# 디스코드 전송/포맷 판단에 쓰는 키워드 ('장 시작'은 '시작'에 포함되므로 따로 두지 않음)
+DISCORD_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, [
+    "매수", "매도", "스탑로스", "트레일링 스탑", "오류", "실패", "에러", "시작", "종료", "장 마감", "자금 부족"
+])))
+ERROR_KEYWORDS = frozenset(["오류", "실패", "에러"])  # 나머지 키워드는 매매/프로그램 상태/자금 부족 알림
+ERROR_LEVELS = frozenset(["ERROR", "CRITICAL"])
+
+# 매매 관련 키워드별 (이모지, 코드 블록 포맷), 앞에 있는 키워드가 우선
+TRADE_MESSAGE_FORMATS = [
+    ("매수", "🟢", "ini"),
+    ("매도", "🔴", "ini"),
+    ("스탑로스", "⛔", "diff"),
+    ("트레일링 스탑", "🔻", "diff"),
+]
+
+# 일정 간격으로만 전송하는 시장 상태 메시지 키워드
+MARKET_STATUS_PATTERN = re.compile('|'.join(map(re.escape, [
+    "현재 장 운영 시간이 아닙니다",
+    "현재 운영 중인 시장이 없습니다",
+    "주말은 거래일이 아닙니다",
+    "오늘은 개장일이 아닙니다",
+    "휴장"
+])))
+
+# 메모리에 모아 둔 파일 로그를 주기적으로 기록하는 간격 (초)
+LOG_FLUSH_INTERVAL = 2.0
 
 class CustomLogger:
     """통합 로깅 시스템"""
@@ -22,11 +53,26 @@ class CustomLogger:
         
         # 로거 초기화
         self.logger = self._setup_logger()
+        self.info_enabled_flag = self.logger.isEnabledFor(logging.INFO)  # INFO 출력 여부 (setLevel에서 갱신)
+        
+        # 메모리에 모아 둔 파일 로그를 일정 간격으로 기록 (로그가 적은 시간대에도 파일 기록이 늦어지지 않도록)
+        self.flush_stop = threading.Event()
+        threading.Thread(target=self._flush_worker, name=f"log-flush-{market_type.lower()}", daemon=True).start()
         
         # 시장 상태 메시지 관리를 위한 변수 추가
         self.last_market_status_message = ""
         self.last_market_status_time = 0
         self.market_status_interval = 3600  # 1시간(3600초) 간격
+        
+        # 디스코드 전송은 큐에 넣고 백그라운드 스레드에서 처리 (매매 루프가 HTTPS 응답을 기다리지 않도록)
+        self.discord_max_length = 1900  # Discord 메시지 길이 제한(2000글자)에 여유분을 둔 값
+        self.discord_batch_wait = 1.0  # 연속된 메시지를 한 번에 묶어 보낼 대기 시간 (초)
+        self.discord_batch_size = 10  # 한 번에 묶는 최대 메시지 수 (가득 차면 대기 시간 전이라도 전송)
+        self.discord_queue = queue.Queue(maxsize=1000)
+        self.discord_session = requests.Session()  # keep-alive 연결 재사용
+        if self.discord_webhook_url:
+            threading.Thread(target=self._discord_worker, name=f"discord-{market_type.lower()}", daemon=True).start()
+            atexit.register(self.flush_discord)
     
     def _setup_logger(self) -> logging.Logger:
         """기본 로거를 설정합니다."""
@@ -37,7 +83,10 @@ class CustomLogger:
         log_level = getattr(logging, self.config['logging']['level'].upper(), logging.INFO)
         logger.setLevel(log_level)
         
-        # 이미 핸들러가 있다면 제거
+        # 이미 핸들러가 있다면 제거 (이전 리스너가 있으면 남은 로그를 기록하고 정지)
+        if getattr(self, 'log_listener', None):
+            atexit.unregister(self.close)
+            self.close()
         if logger.handlers:
             logger.handlers.clear()
         
@@ -54,73 +103,71 @@ class CustomLogger:
                                         datefmt='%Y-%m-%d %H:%M:%S')
         
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # 파일 쓰기는 메모리에 모았다가 50건마다 또는 WARNING 이상 로그가 들어오면 한 번에 기록 (쓰기 시스템 호출 감소)
+        # 그 사이의 매매 실행 로그도 LOG_FLUSH_INTERVAL마다 기록되므로 비정상 종료 시 잃는 로그는 최대 몇 초 분량
+        self.memory_handler = MemoryHandler(capacity=50, flushLevel=logging.WARNING, target=file_handler)
         
         # 콘솔 출력 설정
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        
+        # 파일/콘솔 쓰기는 백그라운드 리스너가 처리하고 로거는 큐에 넣기만 함 (매매 루프에서 디스크 I/O 대기 제거)
+        self.log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(self.log_queue, self.memory_handler, console_handler, respect_handler_level=True)
+        self.log_listener.start()
+        atexit.register(self.close)
+        logger.addHandler(QueueHandler(self.log_queue))
         
         # propagate 설정
         logger.propagate = False
         
         return logger
     
-    def _format_discord_message(self, message: str, level: str) -> str:
-        """디스코드 메시지 포맷을 지정합니다."""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # 메시지 종류에 따른 이모지와 포맷 선택
-        if "매수" in message:
-            emoji = "🟢"
-            format_type = "ini"
-        elif "매도" in message:
-            emoji = "🔴"
-            format_type = "ini"
-        elif "스탑로스" in message:
-            emoji = "⛔"
-            format_type = "diff"
-        elif "트레일링 스탑" in message:
-            emoji = "🔻"
-            format_type = "diff"
-        elif level == "ERROR" or "오류" in message:
-            emoji = "⚠️"
-            format_type = "diff"
-        elif level == "WARNING":
-            emoji = "⚠️"
-            format_type = "fix"
-        elif "시작" in message:
-            emoji = "🎯"
-            format_type = "yaml"
-        elif "종료" in message:
-            emoji = "🏁"
-            format_type = "yaml"
-        elif "장 시작" in message:
-            emoji = "⏰"
-            format_type = "fix"
+    def _format_discord_message(self, message: str, level: str, now: str = None) -> str:
+        """디스코드 메시지 포맷을 지정합니다.
+        
+        Args:
+            message (str): 메시지
+            level (str): 로그 레벨
+            now (str): 메시지 발생 시각 (기본값: 현재 시각)
+        """
+        if now is None:
+            now = time.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # 메시지 종류에 따른 이모지와 포맷 선택 (키워드는 정규식 한 번으로 찾음)
+        found = set(DISCORD_KEYWORD_PATTERN.findall(message))
+        emoji, format_type = "🔄", "ini"
+        for keyword, trade_emoji, trade_format in TRADE_MESSAGE_FORMATS:
+            if keyword in found:
+                emoji, format_type = trade_emoji, trade_format
+                break
         else:
-            emoji = "🔄"
-            format_type = "ini"
+            if level == "ERROR" or "오류" in found:
+                emoji, format_type = "⚠️", "diff"
+            elif level == "WARNING":
+                emoji, format_type = "⚠️", "fix"
+            elif "시작" in found:
+                emoji, format_type = "🎯", "yaml"
+            elif "종료" in found:
+                emoji, format_type = "🏁", "yaml"
         
         return f"```{format_type}\n[{now}] {emoji} {message}\n```"
     
     def _should_send_to_discord(self, message: str, level: str) -> bool:
         """디스코드로 전송해야 하는 메시지인지 확인합니다."""
-        # 에러 메시지는 항상 전송
-        if level in ["ERROR", "CRITICAL"] or "오류" in message or "실패" in message or "에러" in message:
+        # 에러 레벨은 키워드 검사 없이 바로 전송
+        if level in ERROR_LEVELS:
             return True
         
-        # 마켓 상태 메시지 체크
-        market_status_keywords = [
-            "현재 장 운영 시간이 아닙니다",
-            "현재 운영 중인 시장이 없습니다",
-            "주말은 거래일이 아닙니다",
-            "오늘은 개장일이 아닙니다",
-            "휴장"
-        ]
-        
-        # 마켓 상태 메시지인 경우 특별 처리
-        if any(keyword in message for keyword in market_status_keywords):
+        # 키워드는 첫 일치에서 검색을 멈춤 (대부분의 일반 로그는 일치 없이 한 번의 스캔으로 끝남)
+        has_keyword = DISCORD_KEYWORD_PATTERN.search(message) is not None
+        
+        # 마켓 상태 메시지인 경우 특별 처리 (에러 키워드가 함께 있으면 항상 전송)
+        if MARKET_STATUS_PATTERN.search(message):
+            if has_keyword and ERROR_KEYWORDS.intersection(DISCORD_KEYWORD_PATTERN.findall(message)):
+                return True
+            
             current_time = time.time()
             
             # 동일한 메시지이고 시간 간격이 충분하지 않은 경우 전송하지 않음
@@ -133,103 +180,198 @@ class CustomLogger:
             self.last_market_status_time = current_time
             return True
         
-        # 매매 관련 메시지
-        if any(keyword in message for keyword in ["매수", "매도", "스탑로스", "트레일링 스탑"]):
-            return True
-        
-        # 프로그램 상태 메시지
-        if any(keyword in message for keyword in ["시작", "종료", "장 시작", "장 마감"]):
-            return True
-        
-        # 자금 부족 등 중요 알림
-        if "자금 부족" in message:
-            return True
-            
-        return False
+        # 에러, 매매 관련 메시지, 프로그램 상태 메시지(시작/종료/장 마감), 자금 부족 등 중요 알림
+        return has_keyword
     
     def _send_to_discord(self, message: str, level: str):
-        """디스코드로 메시지를 전송합니다."""
+        """디스코드 전송 큐에 메시지를 넣습니다. 실제 전송은 백그라운드 스레드에서 처리합니다."""
         try:
-            formatted_message = self._format_discord_message(message, level)
-            
-            # Discord 메시지 길이 제한 (2000글자)
-            max_length = 1900  # 여유분을 두고 1900글자로 제한
+            self.discord_queue.put_nowait((message, level, time.strftime("%Y-%m-%d %H:%M:%S")))
+        except queue.Full:
+            self.logger.warning("디스코드 전송 대기열이 가득 차 메시지를 버립니다.")
+    
+    def _split_discord_message(self, message: str, level: str, now: str) -> list:
+        """메시지를 디스코드 길이 제한에 맞는 포맷된 메시지 목록으로 나눕니다."""
+        formatted_message = self._format_discord_message(message, level, now)
+        if len(formatted_message) <= self.discord_max_length:
+            return [formatted_message]
+        
+        # 메시지가 길면 원본 메시지를 분할
+        chunks = []
+        lines = message.split('\n')
+        current_message = ""
+        message_count = 1
+        
+        for line in lines:
+            # 현재 메시지에 줄을 추가했을 때 길이 확인
+            test_message = current_message + line + '\n'
+            formatted_test = self._format_discord_message(test_message, level, now)
             
-            if len(formatted_message) <= max_length:
-                # 메시지가 제한보다 짧으면 그대로 전송
-                webhook = DiscordWebhook(
-                    url=self.discord_webhook_url,
-                    content=formatted_message,
-                    rate_limit_retry=True
-                )
-                response = webhook.execute()
+            if len(formatted_test) <= self.discord_max_length:
+                current_message += line + '\n'
             else:
-                # 메시지가 길면 원본 메시지를 분할해서 전송
-                lines = message.split('\n')
-                current_message = ""
-                message_count = 1
-                
-                for line in lines:
-                    # 현재 메시지에 줄을 추가했을 때 길이 확인
-                    test_message = current_message + line + '\n'
-                    formatted_test = self._format_discord_message(test_message, level)
-                    
-                    if len(formatted_test) <= max_length:
-                        current_message += line + '\n'
-                    else:
-                        # 현재 메시지를 전송
-                        if current_message:
-                            header = f"📄 로그 {message_count}/분할 "
-                            formatted_current = self._format_discord_message(header + current_message, level)
-                            webhook = DiscordWebhook(
-                                url=self.discord_webhook_url,
-                                content=formatted_current,
-                                rate_limit_retry=True
-                            )
-                            response = webhook.execute()
-                            message_count += 1
-                        
-                        # 새 메시지 시작
-                        current_message = line + '\n'
-                
-                # 마지막 메시지 전송
                 if current_message:
                     header = f"📄 로그 {message_count}/분할 "
-                    formatted_current = self._format_discord_message(header + current_message, level)
-                    webhook = DiscordWebhook(
-                        url=self.discord_webhook_url,
-                        content=formatted_current,
-                        rate_limit_retry=True
-                    )
-                    response = webhook.execute()
+                    chunks.append(self._format_discord_message(header + current_message, level, now))
+                    message_count += 1
+                
+                # 새 메시지 시작
+                current_message = line + '\n'
+        
+        # 마지막 메시지
+        if current_message:
+            header = f"📄 로그 {message_count}/분할 "
+            chunks.append(self._format_discord_message(header + current_message, level, now))
+        return chunks
+    
+    def _post_to_discord(self, content: str) -> None:
+        """웹훅으로 메시지 하나를 전송합니다. 전송 한도(429)에 걸리면 안내된 시간만큼 기다렸다가 재시도합니다."""
+        for _ in range(3):
+            response = self.discord_session.post(self.discord_webhook_url, json={'content': content}, timeout=10)
+            if response.status_code == 429:
+                time.sleep(float(response.json().get('retry_after', 1)))
+                continue
             
             # 실제 오류 상태 코드일 때만 로그 출력 (4xx, 5xx)
             if response.status_code >= 400:
                 self.logger.error(f"디스코드 메시지 전송 실패: 상태 코드 {response.status_code}")
-        except Exception as e:
-            self.logger.error(f"디스코드 메시지 전송 실패: {str(e)}")
+            return
+        self.logger.error("디스코드 메시지 전송 실패: 전송 한도 초과")
     
-    def info(self, message: str, send_discord: bool = True) -> None:
-        """INFO 레벨 로그를 기록합니다."""
-        self.logger.info(message)
-        if send_discord and self.discord_webhook_url and self._should_send_to_discord(message, "INFO"):
-            self._send_to_discord(message, "INFO")
+    def _pack_discord_chunks(self, items: list) -> list:
+        """대기 중인 메시지들을 길이 제한 안에서 최소한의 전송 단위로 묶습니다.
+        
+        연속된 메시지의 포맷(코드 블록 종류)이 같으면 코드 블록 하나로 합쳐 여는/닫는 표시를 반복하지 않습니다.
+        한 메시지가 길이 제한을 넘으면 분할된 조각을 각각 전송 단위로 사용합니다.
+        
+        Args:
+            items (list): (메시지, 로그 레벨, 발생 시각) 목록
+            
+        Returns:
+            list: 전송할 메시지 목록
+        """
+        contents = []
+        batch = ""
+        batch_format = None
+        for message, level, now in items:
+            for chunk in self._split_discord_message(message, level, now):
+                opening, body = chunk.split('\n', 1)  # ```포맷, 내용 + 닫는 ```
+                if batch and batch_format == opening and len(batch) - 3 + len(body) <= self.discord_max_length:
+                    batch = batch[:-3] + body  # 같은 코드 블록 안에 이어 붙임
+                    continue
+                if batch and len(batch) + 1 + len(chunk) <= self.discord_max_length:
+                    batch = f"{batch}\n{chunk}"
+                else:
+                    if batch:
+                        contents.append(batch)
+                    batch = chunk
+                batch_format = opening
+        if batch:
+            contents.append(batch)
+        return contents
+    
+    def _discord_worker(self) -> None:
+        """디스코드 전송 큐를 처리합니다. 짧은 시간 안에 쌓인 메시지는 길이 제한 안에서 하나로 묶어 전송합니다."""
+        while True:
+            items = [self.discord_queue.get()]
+            deadline = time.monotonic() + self.discord_batch_wait
+            while len(items) < self.discord_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self.discord_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                for content in self._pack_discord_chunks(items):
+                    self._post_to_discord(content)
+            except Exception as e:
+                self.logger.error(f"디스코드 메시지 전송 실패: {str(e)}")
+            finally:
+                for _ in items:
+                    self.discord_queue.task_done()
     
-    def warning(self, message: str, send_discord: bool = True):
+    def flush_discord(self, timeout: float = 5.0) -> None:
+        """대기 중인 디스코드 메시지가 전송될 때까지 최대 timeout초 기다립니다. (프로그램 종료 시 호출)"""
+        deadline = time.monotonic() + timeout
+        while self.discord_queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+    
+    def _discord_message(self, message: str, args: tuple) -> str:
+        """%-포맷 인자를 적용한 디스코드용 메시지를 만듭니다. (디스코드 전송 경로에서만 호출)"""
+        return message % args if args else message
+    
+    def info(self, message: str, *args, send_discord: bool = True) -> None:
+        """INFO 레벨 로그를 기록합니다.
+        
+        args를 전달하면 %-포맷팅을 로그가 실제로 출력되거나 디스코드로 보낼 때만 수행합니다.
+        """
+        send_discord = send_discord and bool(self.discord_webhook_url)
+        if not self.info_enabled_flag and not send_discord:
+            return
+        
+        self.logger.info(message, *args)
+        if send_discord:
+            message = self._discord_message(message, args)
+            if self._should_send_to_discord(message, "INFO"):
+                self._send_to_discord(message, "INFO")
+    
+    def warning(self, message: str, *args, send_discord: bool = True):
         """WARNING 레벨 메시지를 기록합니다."""
-        self.logger.warning(message)
-        if send_discord and self.discord_webhook_url and self._should_send_to_discord(message, "WARNING"):
-            self._send_to_discord(message, "WARNING")
+        self.logger.warning(message, *args)
+        if send_discord and self.discord_webhook_url:
+            message = self._discord_message(message, args)
+            if self._should_send_to_discord(message, "WARNING"):
+                self._send_to_discord(message, "WARNING")
     
-    def error(self, message: str, send_discord: bool = True, exc_info: bool = False) -> None:
+    def error(self, message: str, *args, send_discord: bool = True, exc_info: bool = False) -> None:
         """ERROR 레벨 로그를 기록합니다."""
-        self.logger.error(message, exc_info=exc_info)
-        if send_discord and self.discord_webhook_url and self._should_send_to_discord(message, "ERROR"):
-            self._send_to_discord(message, "ERROR")
+        self.logger.error(message, *args, exc_info=exc_info)
+        if send_discord and self.discord_webhook_url:
+            message = self._discord_message(message, args)
+            if self._should_send_to_discord(message, "ERROR"):
+                self._send_to_discord(message, "ERROR")
+    
+    def debug(self, message: str, *args):
+        """DEBUG 레벨 메시지를 기록합니다.
+        
+        args를 전달하면 %-포맷팅을 로그가 실제로 출력될 때만 수행합니다.
+        """
+        self.logger.debug(message, *args)
+    
+    def _flush_worker(self) -> None:
+        """LOG_FLUSH_INTERVAL마다 메모리에 모아 둔 파일 로그를 기록합니다. (백그라운드 스레드)"""
+        while not self.flush_stop.wait(LOG_FLUSH_INTERVAL):
+            self.memory_handler.flush()
+    
+    def close(self) -> None:
+        """로그 리스너를 정지하고 메모리에 모아 둔 로그를 파일에 기록합니다. (프로그램 종료 시 호출)"""
+        if self.log_listener is None:
+            return
+        self.flush_stop.set()
+        self.log_listener.stop()
+        self.log_listener = None
+        self.memory_handler.flush()
+    
+    def info_enabled(self) -> bool:
+        """INFO 레벨 로그가 출력되는지 반환합니다.
+        
+        만들기 비싼 로그 메시지는 다음처럼 확인 후 생성합니다:
+            if logger.info_enabled():
+                logger.info(f"... {expensive()} ...", send_discord=False)
+        """
+        return self.info_enabled_flag
+    
+    def setLevel(self, level) -> None:
+        """로그 레벨을 변경합니다."""
+        self.logger.setLevel(level)
+        self.info_enabled_flag = self.logger.isEnabledFor(logging.INFO)
     
-    def debug(self, message: str):
-        """DEBUG 레벨 메시지를 기록합니다."""
-        self.logger.debug(message)
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 로그 레벨이 출력되는지 확인합니다."""
+        return self.logger.isEnabledFor(level)
 
 def setup_logger(market_type: str, config: dict) -> CustomLogger:
     """로거를 설정합니다."""
@@ -1,22 +1,39 @@
 import socket
-import uuid
+import time
+import secrets
+import threading
 import requests
 from datetime import datetime
 
+PUBLIC_IP_TTL = 3600  # 공인 IP 캐시 유효 시간 (초)
+
+public_ip_cache = {"ip": None, "fetched_at": 0.0}
+public_ip_lock = threading.Lock()
+public_ip_session = requests.Session()
+
 def get_public_ip() -> str:
     """
     현재 시스템의 공인 IP 주소를 가져옵니다.
     
+    조회 결과는 PUBLIC_IP_TTL 동안 캐시하며, 여러 스레드가 동시에 호출해도 외부 API는 한 번만 호출합니다.
+    
     Returns:
         str: 공인 IP 주소
     """
-    try:
-        response = requests.get('https://api.ipify.org')
-        return response.text
-    except Exception as e:
-        # 외부 API 호출 실패 시 로컬 IP 반환
-        hostname = socket.gethostname()
-        return socket.gethostbyname(hostname)
+    with public_ip_lock:
+        if public_ip_cache["ip"] and time.time() - public_ip_cache["fetched_at"] < PUBLIC_IP_TTL:
+            return public_ip_cache["ip"]
+        
+        try:
+            response = public_ip_session.get('https://api.ipify.org', timeout=3)
+            response.raise_for_status()
+            public_ip_cache["ip"] = response.text.strip()
+            public_ip_cache["fetched_at"] = time.time()
+            return public_ip_cache["ip"]
+        except Exception as e:
+            # 외부 API 호출 실패 시 로컬 IP 반환 (캐시하지 않고 다음 호출에서 다시 시도)
+            hostname = socket.gethostname()
+            return socket.gethostbyname(hostname)
 
 def generate_global_uid(customer_identification_key: str = None) -> str:
     """
@@ -30,7 +47,7 @@ def generate_global_uid(customer_identification_key: str = None) -> str:
         str: 생성된 globalUID
     """
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    unique_id = str(uuid.uuid4())[:8]  # UUID의 앞 8자리만 사용
+    unique_id = secrets.token_hex(4)  # 16진수 8자리 (UUID 객체/문자열 생성 없이 바로 생성)
     
     if customer_identification_key:
         return f"{timestamp}_{customer_identification_key}_{unique_id}"
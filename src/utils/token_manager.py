@@ -3,16 +3,23 @@ import yaml
 import json
 import logging
 import time
+import hashlib
+import threading
 from datetime import datetime, timedelta
 import requests
 from typing import Dict, Optional
 from src.utils.network_utils import get_public_ip, generate_global_uid
+from src.utils.file_cache import FileCache
+
+# libyaml이 설치되어 있으면 C 구현 로더 사용 (순수 파이썬 로더보다 파싱이 빠름)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 class TokenManager:
     """한국투자증권 API 토큰 관리자"""
     
     _instance = None
     _initialized = False
+    config_path = None
     
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -20,12 +27,14 @@ class TokenManager:
         return cls._instance
     
     def __init__(self, config_path: str = None):
-        if self._initialized and not config_path:
+        # 이미 초기화되었으면 다른 설정 파일이 주어진 경우에만 다시 초기화 (같은 파일은 다시 파싱하지 않음)
+        if self._initialized and (not config_path or config_path == self.config_path):
             return
             
         if config_path:
             with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=YAML_LOADER)
+            self.config_path = config_path
             
             # 모의투자 여부에 따라 설정
             self.is_paper_trading = self.config['api']['is_paper_trading']
@@ -45,22 +54,55 @@ class TokenManager:
             self.access_token = None
             self.token_expired_time = None
             self.last_token_request = 0
+            
+            # 발급받은 토큰을 파일에 저장해 재시작 시 다시 사용 (토큰 발급은 1분당 1회로 제한됨)
+            self.token_cache = FileCache(os.path.join("data", "cache", "token"), ttl=86400, file_mode=0o600)
+            self.token_cache_key = hashlib.sha256(f"{self.base_url}:{self.api_key}".encode('utf-8')).hexdigest()[:16]
+            self._load_cached_token()
+            
+            # 연결을 재사용하는 HTTP 세션 (토큰 재발급 시 TCP/TLS 연결을 새로 맺지 않음)
+            if not getattr(self, 'session', None):
+                self.session = requests.Session()
+            
+            # 여러 스레드가 동시에 토큰을 재발급하지 않도록 보호하는 락
+            if not getattr(self, 'token_lock', None):
+                self.token_lock = threading.Lock()
             self._initialized = True
     
+    def _load_cached_token(self) -> None:
+        """파일에 저장된 토큰이 5분 이상 유효하면 불러옵니다."""
+        try:
+            cached = self.token_cache.get(self.token_cache_key)
+            if not cached:
+                return
+            expired_time = datetime.fromisoformat(cached['expires_at'])
+            if expired_time > datetime.now() + timedelta(minutes=5):
+                self.access_token = cached['access_token']
+                self.token_expired_time = expired_time
+                logging.info("저장된 토큰을 불러왔습니다. (만료: %s)", cached['expires_at'])
+        except Exception as e:
+            logging.warning(f"저장된 토큰 불러오기 실패: {str(e)}")
+    
+    def _is_token_valid(self) -> bool:
+        """토큰이 있고 만료 30초 전까지 남아 있는지 확인합니다. (API 호출 도중 만료되지 않도록 여유를 둠)"""
+        return (self.access_token is not None and
+                self.token_expired_time is not None and
+                datetime.now() < self.token_expired_time - timedelta(seconds=30))
+    
     def get_token(self) -> str:
         """토큰을 가져옵니다. 필요한 경우 새로 생성합니다."""
-        current_time = datetime.now()
+        # 유효한 토큰이 있으면 락 없이 바로 반환
+        if self._is_token_valid():
+            return self.access_token
         
-        # 토큰이 없거나 만료되었으면 새로 생성
-        if (not self.access_token or 
-            not self.token_expired_time or 
-            current_time >= self.token_expired_time):
-            
-            # API 호출 제한 (1분당 1회) 체크
-            if time.time() - self.last_token_request < 60:
-                time.sleep(60 - (time.time() - self.last_token_request))
-            
-            self._create_token()
+        with self.token_lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 새로 발급했으면 그대로 사용
+            if not self._is_token_valid():
+                # API 호출 제한 (1분당 1회) 체크
+                if time.time() - self.last_token_request < 60:
+                    time.sleep(60 - (time.time() - self.last_token_request))
+                
+                self._create_token()
         
         return self.access_token
     
@@ -85,12 +127,16 @@ class TokenManager:
             })
         
         self.last_token_request = time.time()
-        response = requests.post(url, headers=headers, data=json.dumps(data))
+        response = self.session.post(url, headers=headers, data=json.dumps(data))
         response_data = response.json()
         
         if response.status_code == 200:
             self.access_token = response_data.get('access_token')
             self.token_expired_time = datetime.now() + timedelta(seconds=response_data.get('expires_in', 86400))
+            self.token_cache.set(self.token_cache_key, {
+                'access_token': self.access_token,
+                'expires_at': self.token_expired_time.isoformat()
+            })
             logging.info("토큰이 성공적으로 생성되었습니다.")
         else:
             logging.error(f"토큰 생성 실패: {response_data}")
@@ -1,10 +1,139 @@
 import os
+import logging
 import sqlite3
+import queue
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import pytz
 import json
 
+# 자주 실행하는 SQL 문 (문자열이 같아야 연결의 prepared statement 캐시를 재사용하므로 상수로 한 곳에서 관리)
+
+# 거래 내역 추가
+INSERT_TRADE_SQL = '''
+    INSERT INTO trades (
+        trade_type, trade_action, stock_code, stock_name, quantity, price, total_amount,
+        ma_period, ma_value, reason, profit_loss, profit_loss_pct,
+        timestamp, timezone
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# 종목 요약 정보 갱신 (UPSERT 한 번으로 종목 생성, 최고가, 거래 유형별 갱신을 함께 처리, SQLite 3.24 이상)
+# - 구글 스프레드시트에 종목이 없어도 거래 데이터를 기반으로 종목 정보를 생성하며, 종목명은 처음 저장한 값을 유지
+# - 최고가는 새 가격이 기존 최고가보다 높은 경우에만 갱신 (최고가가 없으면 0으로 간주)
+# - DO UPDATE의 우변에서 컬럼 이름은 갱신 전 값, excluded는 새로 넣으려던 값
+
+# 매수: 첫 매수일, 보유 수량 갱신
+UPSERT_BUY_SQL = '''
+    INSERT INTO stock_history (stock_code, stock_name, first_buy_date, last_sell_date, highest_price, all_sold, total_quantity)
+    VALUES (?, ?, ?, NULL, MAX(?, 0), 0, ?)
+    ON CONFLICT(stock_code) DO UPDATE SET
+        highest_price = CASE WHEN COALESCE(highest_price, 0) < excluded.highest_price THEN excluded.highest_price ELSE highest_price END,
+        first_buy_date = excluded.first_buy_date,
+        all_sold = 0,
+        total_quantity = total_quantity + excluded.total_quantity
+'''
+
+# 리밸런싱 매도: all_sold를 0으로 유지
+UPSERT_REBALANCE_SELL_SQL = '''
+    INSERT INTO stock_history (stock_code, stock_name, first_buy_date, last_sell_date, highest_price, all_sold, total_quantity)
+    VALUES (?, ?, NULL, ?, MAX(?, 0), 0, 0)
+    ON CONFLICT(stock_code) DO UPDATE SET
+        highest_price = CASE WHEN COALESCE(highest_price, 0) < excluded.highest_price THEN excluded.highest_price ELSE highest_price END,
+        last_sell_date = excluded.last_sell_date,
+        all_sold = 0,
+        total_quantity = MAX(0, total_quantity - ?)
+'''
+
+# 일반 매도: 누적 보유 수량으로 전량 매도 여부 판단
+UPSERT_SELL_SQL = '''
+    INSERT INTO stock_history (stock_code, stock_name, first_buy_date, last_sell_date, highest_price, all_sold, total_quantity)
+    VALUES (?, ?, NULL, ?, MAX(?, 0), 1, 0)
+    ON CONFLICT(stock_code) DO UPDATE SET
+        highest_price = CASE WHEN COALESCE(highest_price, 0) < excluded.highest_price THEN excluded.highest_price ELSE highest_price END,
+        last_sell_date = excluded.last_sell_date,
+        all_sold = CASE WHEN total_quantity - ? <= 0 THEN 1 ELSE 0 END,
+        first_buy_date = CASE WHEN total_quantity - ? <= 0 THEN NULL ELSE first_buy_date END,
+        total_quantity = MAX(0, total_quantity - ?)
+'''
+
+# 그 밖의 거래: 종목 생성과 최고가만 갱신
+UPSERT_STOCK_HISTORY_SQL = '''
+    INSERT INTO stock_history (stock_code, stock_name, first_buy_date, last_sell_date, highest_price, all_sold, total_quantity)
+    VALUES (?, ?, NULL, NULL, MAX(?, 0), 1, 0)
+    ON CONFLICT(stock_code) DO UPDATE SET
+        highest_price = CASE WHEN COALESCE(highest_price, 0) < excluded.highest_price THEN excluded.highest_price ELSE highest_price END
+'''
+
+# 새 가격이 기존 최고가보다 높은 경우에만 최고가 갱신 (최고가가 없으면 0으로 간주)
+UPDATE_HIGHEST_PRICE_SQL = '''
+    UPDATE stock_history
+    SET highest_price = ?
+    WHERE stock_code = ? AND COALESCE(highest_price, 0) < ?
+'''
+
+# 종목 요약 정보 조회
+SELECT_STOCK_HISTORY_SQL = '''
+    SELECT stock_code, stock_name, first_buy_date, last_sell_date, all_sold
+    FROM stock_history
+    WHERE stock_code = ?
+'''
+
+# 종목별 거래 내역 시간순 조회
+SELECT_TRADES_BY_CODE_SQL = '''
+    SELECT id, trade_type, trade_action, stock_code, stock_name, quantity, price, total_amount,
+        ma_period, ma_value, reason, profit_loss, profit_loss_pct, timestamp, timezone
+    FROM trades
+    WHERE stock_code = ?
+    ORDER BY timestamp
+'''
+
+# 첫 매수일 조회
+SELECT_FIRST_BUY_DATE_SQL = '''
+    SELECT first_buy_date
+    FROM stock_history
+    WHERE stock_code = ?
+'''
+
+# 마지막 트레일링 스탑 매도 날짜 조회
+SELECT_LAST_TS_SELL_DATE_SQL = '''
+    SELECT substr(timestamp, 1, 10) as trade_date
+    FROM trades
+    WHERE stock_code = ? AND trade_type = 'TRAILING_STOP' AND trade_action = 'SELL'
+    ORDER BY timestamp DESC
+    LIMIT 1
+'''
+
+# 최고가 조회
+SELECT_HIGHEST_PRICE_SQL = '''
+    SELECT highest_price
+    FROM stock_history
+    WHERE stock_code = ?
+'''
+
+# 연결마다 적용하는 설정 (journal_mode=WAL은 데이터베이스 파일에 영구 저장되므로 쓰기 연결에서 한 번만 설정)
+CONNECTION_PRAGMAS = '''
+PRAGMA synchronous=NORMAL;    -- WAL 모드에서는 체크포인트 시점에만 fsync (전원 차단 시 마지막 몇 건의 커밋만 유실될 수 있음)
+PRAGMA cache_size=-64000;     -- 페이지 캐시 약 64MB
+PRAGMA temp_store=MEMORY;     -- 임시 테이블/정렬은 메모리에서 처리
+PRAGMA busy_timeout=5000;     -- 다른 연결이 잠금 중이면 최대 5초 대기
+'''
+
+# 캐시에 값이 없음을 나타내는 표시 (None도 캐시하는 경우에 사용)
+NOT_CACHED = object()
+
+def synchronized(method):
+    """인스턴스의 lock을 잡은 상태로 메서드를 실행합니다. (공유 데이터베이스 연결을 여러 스레드가 동시에 쓰지 않도록)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class TradeHistoryManager:
     """거래 내역을 SQLite 데이터베이스로 저장하고 관리하는 클래스
     
@@ -12,30 +141,103 @@ class TradeHistoryManager:
     국내(KOR)와 해외(USA) 시장의 거래 내역을 각각 다른 데이터베이스에서 관리합니다.
     """
     
-    def __init__(self, market_type: str):
+    def __init__(self, market_type: str, pool_size: int = 5):
         """TradeHistoryManager를 초기화합니다.
         
         Args:
             market_type (str): 시장 유형 (KOR/USA)
                 - KOR: 국내 주식 시장
                 - USA: 미국 주식 시장
+            pool_size (int): 조회 전용 연결 풀 크기 (매수 조건 체크 등 여러 스레드의 동시 조회용)
         """
+        self.logger = logging.getLogger('trade_history_manager')
         self.market_type = market_type  # 시장 유형 (KOR/USA)
         self.db_dir = os.path.join("data", "history")  # 데이터베이스 저장 디렉토리
         self.db_path = os.path.join(self.db_dir, f"trade_history_{market_type.lower()}.db")  # 데이터베이스 파일 경로
         
+        self.is_usa = self.market_type.upper() == "USA"  # 미국장 여부 (호출마다 upper()를 하지 않도록 한 번만 계산)
+        
         # 시간대 설정
-        if self.market_type.upper() == "USA":
+        if self.is_usa:
             self.timezone = pytz.timezone("America/New_York")  # 미국 뉴욕 시간대
         else:
             self.timezone = pytz.timezone("Asia/Seoul")  # 한국 시간대
+        self.timezone_name = self.timezone.zone  # 거래 내역에 저장할 시간대 이름
+        
+        # 종목별 거래 내역 조회 결과 캐시 (종목 코드 -> 거래 내역 목록), 해당 종목의 거래 추가 시 무효화
+        self.trades_cache = {}
+        
+        # 종목별 첫 매수일 캐시 (종목 코드 -> 첫 매수일 또는 None), 해당 종목의 거래 추가 시 무효화
+        self.first_buy_cache = {}
+        
+        # 원래 종목 코드 -> 데이터베이스 저장용 종목 코드 (미국장은 코드.거래소 형식에서 코드만 사용)
+        self.normalized_codes = {}
+        
+        # 최근 추가한 거래의 (종목 코드, 주문번호) (상위 로직의 재시도로 같은 주문이 다시 들어오면 중복 저장하지 않음)
+        self.recent_trades = deque(maxlen=4096)
+        self.recent_trade_keys = set()
         
         # 디렉토리 생성
         os.makedirs(self.db_dir, exist_ok=True)
         
+        # 쓰기용 데이터베이스 연결은 한 번만 열어 계속 재사용 (호출마다 연결을 열고 닫지 않고, 페이지 캐시도 유지)
+        # 매매 스레드와 시세 조회 스레드가 함께 사용할 수 있으므로 lock으로 접근을 직렬화
+        self.lock = threading.RLock()
+        self.conn = self._connect()
+        self.conn.execute('PRAGMA journal_mode=WAL')  # 변경 내용을 로그 파일 끝에 덧붙이기만 함 (읽기 연결이 쓰기를 기다리지 않음)
+        
         # 데이터베이스 초기화
         self._init_database()
+        
+        # 조회 전용 연결 풀 (WAL 모드에서는 읽기 연결끼리, 그리고 쓰기 연결과도 동시에 실행 가능)
+        self.read_pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self.read_pool.put(self._connect(read_only=True))
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """공통 설정을 적용한 데이터베이스 연결을 엽니다.
+        
+        Args:
+            read_only (bool): 조회 전용 연결 여부 (True면 쓰기 쿼리를 거부)
+            
+        Returns:
+            sqlite3.Connection: 데이터베이스 연결
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row  # 조회 결과를 컬럼명으로 접근 (행마다 dict(zip(...))를 만들지 않음)
+        conn.executescript(CONNECTION_PRAGMAS)
+        if read_only:
+            conn.execute('PRAGMA query_only=ON')
+        return conn
     
+    @contextmanager
+    def _checkout(self):
+        """조회 전용 연결 풀에서 연결을 빌려 쓰고 돌려놓습니다. (모든 연결이 사용 중이면 반납될 때까지 대기)
+        
+        데이터베이스 오류가 난 연결은 닫고 새 연결로 바꿔서 풀에 돌려놓습니다.
+        """
+        conn = self.read_pool.get()
+        try:
+            yield conn
+        except sqlite3.Error:
+            conn.close()
+            conn = self._connect(read_only=True)
+            raise
+        finally:
+            self.read_pool.put(conn)
+    
+    def _normalize_code(self, stock_code: str) -> str:
+        """데이터베이스에 저장하는 종목 코드로 변환합니다. (미국장의 경우 코드.거래소 형식에서 코드만 추출)"""
+        # 국내장은 변환이 필요 없으므로 캐시 조회 없이 그대로 반환
+        if not self.is_usa:
+            return stock_code
+        normalized = self.normalized_codes.get(stock_code)
+        if normalized is None:
+            normalized = stock_code.partition(".")[0]
+            self.normalized_codes[stock_code] = normalized
+        return normalized
+    
+    @synchronized
     def _init_database(self) -> None:
         """데이터베이스와 필요한 테이블들을 초기화합니다.
         
@@ -57,6 +259,8 @@ class TradeHistoryManager:
            - timestamp: 거래 시간
            - timezone: 시간대
 
+           - 인덱스: (stock_code, timestamp), (stock_code, trade_type, timestamp)
+
         2. stock_history: 종목별 요약 정보를 저장하는 테이블
            - stock_code: 종목 코드 (기본키)
            - stock_name: 종목명
@@ -64,8 +268,9 @@ class TradeHistoryManager:
            - last_sell_date: 마지막 매도일
            - highest_price: 최고가
            - all_sold: 전량 매도 여부
+           - total_quantity: 누적 보유 수량
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # 거래 내역 테이블 생성
@@ -89,6 +294,15 @@ class TradeHistoryManager:
         )
         ''')
         
+        # 거래 내역 조회용 인덱스 (종목별 시간순 조회, 종목+거래 유형별 최근 거래 조회가 전체 테이블 스캔 없이 처리됨)
+        # 마지막 트레일링 스탑 매도일 조회는 필요한 컬럼이 모두 인덱스에 있어 테이블을 읽지 않음 (커버링 인덱스)
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_trades_code_ts ON trades (stock_code, timestamp)
+        ''')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_trades_code_type_action_ts ON trades (stock_code, trade_type, trade_action, timestamp)
+        ''')
+        
         # 종목별 거래 내역 테이블 생성
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS stock_history (
@@ -97,13 +311,27 @@ class TradeHistoryManager:
             first_buy_date TEXT,                   -- 첫 매수일
             last_sell_date TEXT,                   -- 마지막 매도일
             highest_price REAL DEFAULT 0,          -- 최고가
-            all_sold BOOLEAN DEFAULT 1             -- 전량 매도 여부
+            all_sold BOOLEAN DEFAULT 1,            -- 전량 매도 여부
+            total_quantity INTEGER NOT NULL DEFAULT 0  -- 누적 보유 수량 (매수 시 증가, 매도 시 감소)
         )
         ''')
         
+        # 이전 버전 데이터베이스에는 누적 보유 수량 컬럼을 추가하고 거래 내역으로 한 번만 계산
+        cursor.execute('PRAGMA table_info(stock_history)')
+        if 'total_quantity' not in {column[1] for column in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE stock_history ADD COLUMN total_quantity INTEGER NOT NULL DEFAULT 0')
+            cursor.execute('''
+            UPDATE stock_history
+            SET total_quantity = MAX(0, COALESCE((
+                SELECT SUM(CASE WHEN trade_action = 'BUY' THEN quantity ELSE -quantity END)
+                FROM trades
+                WHERE trades.stock_code = stock_history.stock_code
+            ), 0))
+            ''')
+        
         conn.commit()
-        conn.close()
     
+    @synchronized
     def add_trade(self, trade_data: Dict[str, Any]) -> None:
         """거래 내역을 데이터베이스에 추가합니다.
         
@@ -121,189 +349,153 @@ class TradeHistoryManager:
                 - reason: 거래 사유
                 - profit_loss: 손익 (매도 시)
                 - profit_loss_pct: 손익률 (매도 시)
+                - order_no: 증권사 주문번호 (선택)
+        
+        같은 주문번호(종목 코드 + order_no)의 거래가 다시 들어오면 중복으로 보고 저장하지 않습니다.
+        주문번호가 없는 거래는 중복 확인 없이 그대로 저장합니다.
+        주문이 체결된 뒤 호출되므로 저장에 실패해도 예외를 올리지 않고 오류 로그(트레이스백 포함)만 남깁니다. (이후 알림과 남은 주문이 중단되지 않도록)
         """
+        trade_key = None
         try:
-            # 현재 시간을 해당 시장의 시간대로 변환하여 추가
-            now = datetime.now(pytz.UTC).astimezone(self.timezone)
-            trade_data["timestamp"] = now.strftime("%Y-%m-%d %H:%M:%S")
-            trade_data["timezone"] = self.timezone.zone
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # 중복 거래 확인 (주문번호가 있는 경우에만, 데이터베이스 접근 전에 메모리에서 확인)
+            order_no = trade_data.get("order_no")
+            if order_no:
+                trade_key = (trade_data["stock_code"], order_no)
+                if trade_key in self.recent_trade_keys:
+                    self.logger.warning(f"중복 거래 내역을 건너뜁니다: {trade_data['stock_code']} 주문번호 {order_no}")
+                    return
+                if len(self.recent_trades) == self.recent_trades.maxlen:
+                    self.recent_trade_keys.discard(self.recent_trades[0])
+                self.recent_trades.append(trade_key)
+                self.recent_trade_keys.add(trade_key)
+            
+            # 현재 시간을 해당 시장의 시간대로 추가 (날짜는 _update_stock_history에서 앞 10자리를 잘라 사용)
+            trade_data["timestamp"] = datetime.now(self.timezone).strftime("%Y-%m-%d %H:%M:%S")
+            trade_data["timezone"] = self.timezone_name
             
             # 미국장의 경우 거래소 코드 제거 (코드.거래소 형식에서 코드만 추출)
-            stock_code = trade_data["stock_code"]
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
-            else:
-                stock_code = trade_data["stock_code"]
+            stock_code = self._normalize_code(trade_data["stock_code"])
             
-            # 거래 내역 추가
-            cursor.execute('''
-            INSERT INTO trades (
-                trade_type, trade_action, stock_code, stock_name, quantity, price, total_amount,
-                ma_period, ma_value, reason, profit_loss, profit_loss_pct,
-                timestamp, timezone
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                trade_data["trade_type"],
-                trade_data["trade_action"],
-                stock_code,
-                trade_data["stock_name"],
-                trade_data["quantity"],
-                trade_data["price"],
-                trade_data["total_amount"],
-                trade_data.get("ma_period"),
-                trade_data.get("ma_value"),
-                trade_data.get("reason"),
-                trade_data.get("profit_loss"),
-                trade_data.get("profit_loss_pct"),
-                trade_data["timestamp"],
-                trade_data["timezone"]
-            ))
-            # 종목별 거래 내역 업데이트
-            self._update_stock_history(cursor, trade_data)
+            # 거래 내역 추가와 종목별 요약 업데이트를 하나의 트랜잭션으로 처리 (성공 시 한 번 커밋, 실패 시 모두 롤백)
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.execute(INSERT_TRADE_SQL, self._trade_row(trade_data, stock_code))
+                # 종목별 거래 내역 업데이트
+                self._update_stock_history(cursor, trade_data, stock_code)
             
-            conn.commit()
-            conn.close()
+            self._invalidate_cache(stock_code)
             
         except Exception as e:
-            print(f"거래 내역 추가 중 오류 발생: {str(e)}")
+            # 저장되지 않은 거래는 중복 확인 대상에서 빼서 재시도 시 다시 저장할 수 있도록 함
+            self.recent_trade_keys.discard(trade_key)
+            self.logger.error(f"거래 내역 추가 중 오류 발생: {str(e)}", exc_info=True)
+    
+    def _invalidate_cache(self, stock_code: str) -> None:
+        """거래가 추가된 종목의 거래 내역 캐시와 첫 매수일 캐시를 비웁니다. (커밋 후 호출)"""
+        self.trades_cache.pop(stock_code, None)
+        self.first_buy_cache.pop(stock_code, None)
+    
+    @staticmethod
+    def _trade_row(trade_data: Dict[str, Any], stock_code: str) -> tuple:
+        """trades 테이블 INSERT에 사용할 값 튜플을 만듭니다."""
+        return (
+            trade_data["trade_type"],
+            trade_data["trade_action"],
+            stock_code,
+            trade_data["stock_name"],
+            trade_data["quantity"],
+            trade_data["price"],
+            trade_data["total_amount"],
+            trade_data.get("ma_period"),
+            trade_data.get("ma_value"),
+            trade_data.get("reason"),
+            trade_data.get("profit_loss"),
+            trade_data.get("profit_loss_pct"),
+            trade_data["timestamp"],
+            trade_data["timezone"]
+        )
     
-    def _update_stock_history(self, cursor: sqlite3.Cursor, trade_data: Dict[str, Any]) -> None:
+    def _update_stock_history(self, cursor: sqlite3.Cursor, trade_data: Dict[str, Any], stock_code: str) -> None:
         """종목별 거래 내역 요약 정보를 업데이트합니다.
         
         Args:
             cursor (sqlite3.Cursor): 데이터베이스 커서
             trade_data (Dict[str, Any]): 거래 데이터
+            stock_code (str): 거래소 코드를 제거한 종목 코드
         """
-        stock_code = trade_data["stock_code"]
+        stock_name = trade_data["stock_name"]
         price = trade_data["price"]
+        quantity = trade_data["quantity"]
         
-        # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-        if self.market_type.upper() == "USA" and "." in stock_code:
-            stock_code = stock_code.split(".")[0]
-        
-        trade_date = datetime.strptime(trade_data["timestamp"], "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d")
-        
-        # 종목 정보 조회 또는 생성 - 구글 스프레드시트에 종목이 없어도 거래 데이터를 기반으로 stock_history 테이블에 정보를 저장
-        cursor.execute('''
-        INSERT OR IGNORE INTO stock_history (stock_code, stock_name, first_buy_date, last_sell_date, highest_price, all_sold)
-        VALUES (?, ?, NULL, NULL, 0, 1)
-        ''', (stock_code, trade_data["stock_name"]))
-        
-        # 현재 최고가 조회
-        cursor.execute('''
-        SELECT highest_price
-        FROM stock_history
-        WHERE stock_code = ?
-        ''', (stock_code,))
-        
-        current_highest = cursor.fetchone()
-        current_highest_price = current_highest[0] if current_highest and current_highest[0] is not None else 0
-        
-        # 현재 가격이 최고가보다 높은 경우 최고가 업데이트
-        if price > current_highest_price:
-            cursor.execute('''
-            UPDATE stock_history
-            SET highest_price = ?
-            WHERE stock_code = ?
-            ''', (price, stock_code))
+        trade_date = trade_data["timestamp"][:10]  # add_trade에서 "%Y-%m-%d %H:%M:%S" 형식으로 만든 값이므로 앞 10자리가 날짜
         
+        # 종목 정보 생성, 최고가, 거래 유형별 갱신을 UPSERT 한 번으로 처리
         if trade_data["trade_action"] == "BUY":
-            # 첫 매수일 업데이트 (없거나 전량 매도 후 다시 매수하는 경우)
-            cursor.execute('''
-            UPDATE stock_history
-            SET first_buy_date = ?,
-            all_sold = 0
-            WHERE stock_code = ?
-            ''', (trade_date, stock_code))
+            # 첫 매수일 업데이트 및 보유 수량 증가
+            cursor.execute(UPSERT_BUY_SQL, (stock_code, stock_name, trade_date, price, quantity))
         
         elif trade_data["trade_action"] == "SELL":
-            # 마지막 매도일 업데이트
-            cursor.execute('''
-            UPDATE stock_history
-            SET last_sell_date = ?
-            WHERE stock_code = ?
-            ''', (trade_date, stock_code))
-
             # 리밸런싱 매도인 경우 all_sold를 0으로 유지
             if trade_data["trade_type"] == "REBALANCE":
-                cursor.execute('''
-                UPDATE stock_history
-                SET all_sold = 0
-                WHERE stock_code = ?
-                ''', (stock_code,))
+                cursor.execute(UPSERT_REBALANCE_SELL_SQL, (stock_code, stock_name, trade_date, price, quantity))
             else:
-                # 일반 매도인 경우 보유 수량 확인 필요
-                # 현재 코드에서는 전량 매도로 가정하고 all_sold를 1로 설정
-                cursor.execute('''
-                UPDATE stock_history
-                SET all_sold = 1,
-                    first_buy_date = NULL
-                WHERE stock_code = ?
-                ''', (stock_code,))
+                # 일반 매도인 경우 누적 보유 수량으로 전량 매도 여부 판단
+                cursor.execute(UPSERT_SELL_SQL, (stock_code, stock_name, trade_date, price, quantity, quantity, quantity))
+        
+        else:
+            cursor.execute(UPSERT_STOCK_HISTORY_SQL, (stock_code, stock_name, price))
     
-    def get_stock_history(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """종목별 거래 내역을 조회합니다.
+    def get_stock_summary(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """종목별 요약 정보만 조회합니다. (거래 내역 없이 stock_history 기본 키 조회 한 번)
         
         Args:
             stock_code (str): 종목 코드
             
         Returns:
-            Optional[Dict[str, Any]]: 종목별 거래 내역 정보
+            Optional[Dict[str, Any]]: 종목별 요약 정보, 없으면 None
                 - stock_code: 종목 코드
                 - stock_name: 종목명
                 - first_buy_date: 첫 매수일
                 - last_sell_date: 마지막 매도일
-                - trades: 거래 내역 목록
+                - all_sold: 전량 매도 여부
         """
         # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-        if self.market_type.upper() == "USA" and "." in stock_code:
-            stock_code = stock_code.split(".")[0]
+        stock_code = self._normalize_code(stock_code)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._checkout() as conn:
+            stock_info = conn.execute(SELECT_STOCK_HISTORY_SQL, (stock_code,)).fetchone()
         
-        # 종목 정보 조회
-        cursor.execute('''
-        SELECT stock_code, stock_name, first_buy_date, last_sell_date, all_sold
-        FROM stock_history
-        WHERE stock_code = ?
-        ''', (stock_code,))
-        
-        stock_info = cursor.fetchone()
-        if not stock_info:
-            conn.close()
-            return None
+        return dict(stock_info) if stock_info else None
+    
+    def get_stock_history(self, stock_code: str, include_trades: bool = True) -> Optional[Dict[str, Any]]:
+        """종목별 거래 내역을 조회합니다.
         
-        # 거래 내역 조회
-        cursor.execute('''
-        SELECT *
-        FROM trades
-        WHERE stock_code = ?
-        ORDER BY timestamp
-        ''', (stock_code,))
+        get_stock_summary와 get_trades_by_code(캐시 사용)를 합친 결과를 돌려줍니다.
         
-        trades = cursor.fetchall()
-        conn.close()
+        Args:
+            stock_code (str): 종목 코드
+            include_trades (bool): 거래 내역 목록 포함 여부 (요약 정보만 필요하면 False)
+            
+        Returns:
+            Optional[Dict[str, Any]]: 종목별 거래 내역 정보
+                - stock_code: 종목 코드
+                - stock_name: 종목명
+                - first_buy_date: 첫 매수일
+                - last_sell_date: 마지막 매도일
+                - trades: 거래 내역 목록 (include_trades가 True인 경우)
+        """
+        summary = self.get_stock_summary(stock_code)
+        if not summary:
+            return None
         
-        # 결과 구성
         result = {
-            "stock_code": stock_info[0],
-            "stock_name": stock_info[1],
-            "first_buy_date": stock_info[2],
-            "last_sell_date": stock_info[3],
-            "trades": []
+            "stock_code": summary["stock_code"],
+            "stock_name": summary["stock_name"],
+            "first_buy_date": summary["first_buy_date"],
+            "last_sell_date": summary["last_sell_date"]
         }
-        
-        # 컬럼명 매핑
-        columns = [description[0] for description in cursor.description]
-        
-        # 거래 내역 추가
-        for trade in trades:
-            trade_dict = dict(zip(columns, trade))
-            result["trades"].append(trade_dict)
+        if include_trades:
+            result["trades"] = self.get_trades_by_code(stock_code)
         
         return result
     
@@ -314,29 +506,29 @@ class TradeHistoryManager:
             stock_code (str): 종목 코드
             
         Returns:
-            Optional[str]: 첫 매수일 (YYYY-MM-DD 형식)
+            Optional[str]: 첫 매수일 (YYYY-MM-DD 형식), 같은 종목의 거래가 추가되기 전까지는 캐시된 결과 사용
         """
         # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-        if self.market_type.upper() == "USA" and "." in stock_code:
-            stock_code = stock_code.split(".")[0]
+        stock_code = self._normalize_code(stock_code)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # 캐시된 첫 매수일이 있으면 데이터베이스 조회 없이 반환 (첫 매수일이 없는 경우(None)도 캐시)
+        cached = self.first_buy_cache.get(stock_code, NOT_CACHED)
+        if cached is not NOT_CACHED:
+            return cached
         
-        cursor.execute('''
-        SELECT first_buy_date
-        FROM stock_history
-        WHERE stock_code = ?
-        ''', (stock_code,))
-        
-        result = cursor.fetchone()
-        conn.close()
+        # 캐시 무효화와 순서가 어긋나지 않도록 쓰기 연결에서 lock을 잡고 조회
+        with self.lock:
+            result = self.conn.execute(SELECT_FIRST_BUY_DATE_SQL, (stock_code,)).fetchone()
+            first_buy_date = result[0] if result else None
+            self.first_buy_cache[stock_code] = first_buy_date
         
-        return result[0] if result else None
+        return first_buy_date
     
     def get_trades_by_type_and_code(self, trade_type: str, stock_code: str) -> List[Dict[str, Any]]:
         """특정 거래 유형과 종목 코드에 해당하는 거래 내역을 조회합니다.
         
+        get_trades_by_code의 (캐시된) 시간순 거래 내역에서 거래 유형만 걸러내므로 별도 조회나 정렬이 필요 없습니다.
+        
         Args:
             trade_type (str): 거래 유형 (BUY/SELL/REBALANCE/STOP_LOSS/TRAILING_STOP)
             stock_code (str): 종목 코드
@@ -345,38 +537,7 @@ class TradeHistoryManager:
             List[Dict[str, Any]]: 거래 내역 목록
                 - 각 거래 내역은 trades 테이블의 모든 필드를 포함
         """
-        try:
-            # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            SELECT *
-            FROM trades
-            WHERE stock_code = ? AND trade_type = ?
-            ORDER BY timestamp
-            ''', (stock_code, trade_type))
-            
-            trades = cursor.fetchall()
-            conn.close()
-            
-            # 컬럼명 매핑
-            columns = [description[0] for description in cursor.description]
-            
-            # 결과 구성
-            result = []
-            for trade in trades:
-                trade_dict = dict(zip(columns, trade))
-                result.append(trade_dict)
-            
-            return result
-            
-        except Exception as e:
-            print(f"거래 내역 조회 중 오류 발생: {str(e)}")
-            return []
+        return [trade for trade in self.get_trades_by_code(stock_code) if trade["trade_type"] == trade_type]
     
     def get_last_ts_sell_date(self, stock_code: str) -> Optional[str]:
         """특정 종목의 마지막 트레일링 스탑 매도 날짜를 조회합니다.
@@ -389,32 +550,21 @@ class TradeHistoryManager:
         """
         try:
             # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            stock_code = self._normalize_code(stock_code)
             
             # 트레일링 스탑 매도 내역 중 가장 최근 날짜 조회
-            cursor.execute('''
-            SELECT substr(timestamp, 1, 10) as trade_date
-            FROM trades
-            WHERE stock_code = ? AND trade_type = 'TRAILING_STOP' AND trade_action = 'SELL'
-            ORDER BY timestamp DESC
-            LIMIT 1
-            ''', (stock_code,))
-            
-            result = cursor.fetchone()
-            conn.close()
+            with self._checkout() as conn:
+                result = conn.execute(SELECT_LAST_TS_SELL_DATE_SQL, (stock_code,)).fetchone()
             
             if result:
                 return result[0]  # YYYY-MM-DD 형식의 날짜 반환
             return None
             
         except Exception as e:
-            print(f"트레일링 스탑 매도 날짜 조회 중 오류 발생: {str(e)}")
+            self.logger.error(f"트레일링 스탑 매도 날짜 조회 중 오류 발생: {str(e)}")
             return None
     
+    @synchronized
     def update_highest_price(self, stock_code: str, price: float) -> None:
         """종목의 최고가를 업데이트합니다.
         
@@ -424,36 +574,44 @@ class TradeHistoryManager:
         """
         try:
             # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
+            stock_code = self._normalize_code(stock_code)
             
-            conn = sqlite3.connect(self.db_path)
+            conn = self.conn
             cursor = conn.cursor()
             
-            # 현재 최고가 조회
-            cursor.execute('''
-            SELECT highest_price
-            FROM stock_history
-            WHERE stock_code = ?
-            ''', (stock_code,))
-            
-            current_highest = cursor.fetchone()
-            
             # 종목이 존재하고 새 가격이 기존 최고가보다 높은 경우에만 업데이트
-            if current_highest:
-                current_highest_price = current_highest[0] or 0
-                if price > current_highest_price:
-                    cursor.execute('''
-                    UPDATE stock_history
-                    SET highest_price = ?
-                    WHERE stock_code = ?
-                    ''', (price, stock_code))
-                    conn.commit()
+            cursor.execute(UPDATE_HIGHEST_PRICE_SQL, (price, stock_code, price))
+            conn.commit()
             
-            conn.close()
+        except Exception as e:
+            self.logger.error(f"최고가 업데이트 중 오류 발생: {str(e)}", exc_info=True)
+    
+    @synchronized
+    def update_highest_prices(self, prices: Dict[str, float]) -> None:
+        """여러 종목의 최고가를 한 번의 연결과 트랜잭션으로 업데이트합니다.
+        
+        종목이 존재하고 새 가격이 기존 최고가보다 높은 경우에만 업데이트합니다.
+        
+        Args:
+            prices (Dict[str, float]): {종목 코드: 가격}
+        """
+        if not prices:
+            return
+        
+        try:
+            rows = []
+            for stock_code, price in prices.items():
+                # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
+                stock_code = self._normalize_code(stock_code)
+                rows.append((price, stock_code, price))
+            
+            conn = self.conn
+            cursor = conn.cursor()
+            cursor.executemany(UPDATE_HIGHEST_PRICE_SQL, rows)
+            conn.commit()
             
         except Exception as e:
-            print(f"최고가 업데이트 중 오류 발생: {str(e)}")
+            self.logger.error(f"최고가 일괄 업데이트 중 오류 발생: {str(e)}", exc_info=True)
     
     def get_highest_price(self, stock_code: str) -> float:
         """종목의 최고가를 조회합니다.
@@ -466,27 +624,18 @@ class TradeHistoryManager:
         """
         try:
             # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            SELECT highest_price
-            FROM stock_history
-            WHERE stock_code = ?
-            ''', (stock_code,))
+            stock_code = self._normalize_code(stock_code)
             
-            result = cursor.fetchone()
-            conn.close()
+            with self._checkout() as conn:
+                result = conn.execute(SELECT_HIGHEST_PRICE_SQL, (stock_code,)).fetchone()
             
             return result[0] if result and result[0] is not None else 0
             
         except Exception as e:
-            print(f"최고가 조회 중 오류 발생: {str(e)}")
+            self.logger.error(f"최고가 조회 중 오류 발생: {str(e)}")
             return 0
     
+    @synchronized
     def get_trades_by_code(self, stock_code: str) -> List[Dict[str, Any]]:
         """특정 종목 코드에 해당하는 모든 거래 내역을 조회합니다.
         
@@ -494,38 +643,40 @@ class TradeHistoryManager:
             stock_code (str): 종목 코드
             
         Returns:
-            List[Dict[str, Any]]: 거래 내역 목록
+            List[Dict[str, Any]]: 거래 내역 목록 (같은 종목의 거래가 추가되기 전까지는 캐시된 결과 사용)
+                - 캐시 무효화와 순서가 어긋나지 않도록 조회 전용 연결 풀이 아닌 쓰기 연결에서 lock을 잡고 조회
                 - 각 거래 내역은 trades 테이블의 모든 필드를 포함
         """
         try:
             # 미국장의 경우 거래소 코드 제외 (코드.거래소 형식에서 코드만 추출)
-            if self.market_type.upper() == "USA" and "." in stock_code:
-                stock_code = stock_code.split(".")[0]
+            stock_code = self._normalize_code(stock_code)
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # 캐시된 거래 내역이 있으면 데이터베이스 조회 없이 반환
+            cached = self.trades_cache.get(stock_code)
+            if cached is not None:
+                return list(cached)
             
-            cursor.execute('''
-            SELECT *
-            FROM trades
-            WHERE stock_code = ?
-            ORDER BY timestamp
-            ''', (stock_code,))
-            
-            trades = cursor.fetchall()
-            conn.close()
+            conn = self.conn
+            cursor = conn.cursor()
             
-            # 컬럼명 매핑
-            columns = [description[0] for description in cursor.description]
+            cursor.execute(SELECT_TRADES_BY_CODE_SQL, (stock_code,))
             
-            # 결과 구성
-            result = []
-            for trade in trades:
-                trade_dict = dict(zip(columns, trade))
-                result.append(trade_dict)
+            # 결과 구성 (sqlite3.Row를 그대로 dict로 변환)
+            result = [dict(trade) for trade in cursor.fetchall()]
             
-            return result
+            self.trades_cache[stock_code] = result
+            return list(result)
             
         except Exception as e:
-            print(f"거래 내역 조회 중 오류 발생: {str(e)}")
-            return [] 
\ No newline at end of file
+            self.logger.error(f"거래 내역 조회 중 오류 발생: {str(e)}")
+            return [] 
+    
+    def close(self) -> None:
+        """쓰기 연결과 조회 전용 연결 풀을 모두 닫습니다. (프로그램 종료 시 호출)"""
+        with self.lock:
+            self.conn.close()
+        while True:
+            try:
+                self.read_pool.get_nowait().close()
+            except queue.Empty:
+                break